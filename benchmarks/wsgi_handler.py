@@ -0,0 +1,71 @@
+"""
+Microbenchmark of serving a response with `WSGIHandler`, from building the
+request from a WSGI environ through to the status line and headers passed
+to `start_response`.
+
+Usage::
+
+    $ python -m benchmarks.wsgi_handler
+"""
+
+import argparse
+import timeit
+from io import BytesIO
+
+from rivr.http import Request, Response
+from rivr.wsgi import WSGIHandler
+
+
+def view(request: Request) -> Response:
+    response = Response('Hello World', content_type='text/plain')
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def cookie_view(request: Request) -> Response:
+    response = view(request)
+    response.set_cookie('session', 'abc123')
+    return response
+
+
+def environ() -> dict:
+    return {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': '/',
+        'QUERY_STRING': 'page=1',
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'HTTP_HOST': 'localhost',
+        'HTTP_ACCEPT': 'text/html',
+        'HTTP_ACCEPT_ENCODING': 'gzip, br',
+        'HTTP_USER_AGENT': 'benchmark',
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': BytesIO(),
+    }
+
+
+def start_response(status, headers):
+    pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--number', type=int, default=100000)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, handler in (
+        ('response', WSGIHandler(view)),
+        ('response with cookie', WSGIHandler(cookie_view)),
+    ):
+        timings = timeit.repeat(
+            lambda: handler(environ(), start_response),
+            number=args.number,
+            repeat=args.repeat,
+        )
+        best = min(timings) / args.number
+        print('{:<24} {:.2f} us per request'.format(name, best * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,13 @@
 VERSION = '0.10.0'
 
 from rivr import views
-from rivr.http import Http404, Request, Response
+from rivr.http import Http404, JSONResponse, Request, Response
 from rivr.middleware import ErrorWrapper, Middleware, MiddlewareController
 from rivr.middleware.auth import AuthMiddleware
+from rivr.middleware.compression import CompressionMiddleware
+from rivr.middleware.conditional import ConditionalMiddleware
 from rivr.middleware.debug import DebugMiddleware
+from rivr.middleware.timing import TimingMiddleware
 from rivr.router import Domain, Router, include, url
 from rivr.server import serve
 
@@ -13,11 +16,15 @@ __all__ = [
     'Http404',
     'Request',
     'Response',
+    'JSONResponse',
     'ErrorWrapper',
     'Middleware',
     'MiddlewareController',
     'AuthMiddleware',
+    'CompressionMiddleware',
+    'ConditionalMiddleware',
     'DebugMiddleware',
+    'TimingMiddleware',
     'Domain',
     'Router',
     'include',
@@ -0,0 +1,301 @@
+import asyncio
+import io
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from rivr import concurrency
+from rivr.http.headers import Headers
+from rivr.http.request import Query, Request
+from rivr.http.response import (
+    Http404,
+    Response,
+    ResponseNotFound,
+    StreamingResponse,
+)
+
+__all__ = ['ASGIRequest', 'ASGIHandler']
+
+logger = logging.getLogger('rivr.request')
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class ASGIRequestBody(io.RawIOBase):
+    """
+    The body of an ASGI request. The body may be read asynchronously using
+    `stream()`, or as a blocking file by synchronous views which are run
+    outside of the event loop.
+    """
+
+    def __init__(self, receive: Receive, loop: asyncio.AbstractEventLoop):
+        self.receive = receive
+        self.loop = loop
+        self.buffer = b''
+        self.more_body = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self.buffer and self.more_body:
+            try:
+                running_loop: Optional[asyncio.AbstractEventLoop] = (
+                    asyncio.get_running_loop()
+                )
+            except RuntimeError:
+                running_loop = None
+
+            if running_loop is self.loop:
+                raise RuntimeError(
+                    'The request body cannot be read synchronously from the event'
+                    ' loop, use `request.stream()` instead.'
+                )
+
+            future = asyncio.run_coroutine_threadsafe(self.receive_message(), self.loop)
+            self.handle_message(future.result())
+
+        length = min(len(buffer), len(self.buffer))
+        buffer[:length] = self.buffer[:length]
+        self.buffer = self.buffer[length:]
+        return length
+
+    async def receive_message(self) -> Message:
+        # `receive` may return any awaitable, while running it on the event
+        # loop from another thread requires a coroutine.
+        return await self.receive()
+
+    def handle_message(self, message: Message) -> None:
+        if message['type'] == 'http.disconnect':
+            self.more_body = False
+            raise IOError('Client disconnected before the body was received')
+
+        self.buffer += message.get('body', b'')
+        self.more_body = message.get('more_body', False)
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        if self.buffer:
+            buffer, self.buffer = self.buffer, b''
+            yield buffer
+
+        while self.more_body:
+            self.handle_message(await self.receive())
+
+            if self.buffer:
+                buffer, self.buffer = self.buffer, b''
+                yield buffer
+
+
+class ASGIRequest(Request):
+    """
+    https://asgi.readthedocs.io/en/latest/specs/www.html#http-connection-scope
+    """
+
+    def __init__(self, scope: Scope, receive: Receive):
+        query = Query(scope.get('query_string', b'').decode('latin-1'))
+        headers = Headers(
+            [
+                (name.decode('latin-1'), value.decode('latin-1'))
+                for name, value in scope.get('headers', [])
+            ]
+        )
+
+        self.scope = scope
+        self.asgi_body = ASGIRequestBody(receive, asyncio.get_running_loop())
+
+        super(ASGIRequest, self).__init__(
+            scope['path'],
+            scope['method'],
+            query=query,
+            headers=headers,
+            body=io.BufferedReader(self.asgi_body),
+        )
+
+        host = self.headers['Host']
+        if host:
+            self.host = host
+        elif scope.get('server'):
+            self.host = scope['server'][0]
+
+    def stream(self) -> AsyncIterator[bytes]:
+        """
+        Asynchronously iterates over the chunks of the request body as they
+        are received.
+
+        Example::
+
+            async def view(request):
+                async for chunk in request.stream():
+                    ...
+        """
+
+        return self.asgi_body.stream()
+
+    @property
+    def is_secure(self) -> bool:
+        """
+        Returns True if connection was made over HTTPS/TLS.
+        """
+
+        return self.scheme == 'https'
+
+    @property
+    def scheme(self) -> str:
+        """
+        Scheme used for the request. For example, `https`.
+        """
+
+        return self.scope.get('scheme', 'http')
+
+    @property
+    def port(self) -> int:
+        """
+        Port used for the connection.
+        """
+
+        server = self.scope.get('server')
+        if server and server[1] is not None:
+            return int(server[1])
+
+        return 443 if self.is_secure else 80
+
+    @property
+    def url(self) -> str:
+        """
+        Hostname used for the request. For example, `https://rivr.com/about`.
+        """
+
+        scheme = self.scheme
+        url = scheme + '://' + self.host
+        port = self.port
+        if (scheme == 'http' and port != 80) or (scheme == 'https' and port != 443):
+            url += ':' + str(port)
+
+        return url + self.path
+
+
+class ASGIHandler(object):
+    """
+    An ASGI application serving a rivr view.
+
+    Asynchronous (`async def`) views are run on the event loop, while
+    synchronous views are run in a thread pool of up to `max_workers`
+    threads. Streaming responses may provide either an iterable or an
+    asynchronous iterable of chunks.
+
+    Example::
+
+        app = ASGIHandler(router)
+    """
+
+    request_class = ASGIRequest
+
+    def __init__(
+        self, view: Callable[[Request], Any], max_workers: Optional[int] = None
+    ):
+        self.view = view
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='rivr'
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+
+        if scope['type'] != 'http':
+            raise ValueError('Unsupported ASGI scope type {}'.format(scope['type']))
+
+        request = self.request_class(scope, receive)
+        token = concurrency.executor.set(self.executor)
+
+        try:
+            response = await concurrency.call_view(self.view, request)
+            if not response:
+                raise Exception("View did not return a response.")
+        except Http404:
+            response = ResponseNotFound('Page not found')
+        except Exception:
+            logger.error(
+                'Internal Server Error: {}'.format(request.path),
+                exc_info=sys.exc_info(),
+                extra={'status_code': 500, 'request': request},
+            )
+
+            response = Response('Internal server error', status=500)
+
+        try:
+            await self.send_response(response, send)
+        finally:
+            concurrency.executor.reset(token)
+
+    async def lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    def encode_headers(self, response: Response) -> List[Tuple[bytes, bytes]]:
+        return [
+            (name.lower().encode('latin-1'), value.encode('latin-1'))
+            for name, value in response.headers_items()
+        ]
+
+    async def send_response(self, response: Response, send: Send) -> None:
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': response.status_code,
+                'headers': self.encode_headers(response),
+            }
+        )
+
+        if not isinstance(response, StreamingResponse):
+            await send({'type': 'http.response.body', 'body': response.content})
+            return
+
+        try:
+            async for chunk in self.iterate(response):
+                await send(
+                    {'type': 'http.response.body', 'body': chunk, 'more_body': True}
+                )
+        finally:
+            aclose = getattr(response.streaming_content, 'aclose', None)
+            if aclose:
+                await aclose()
+            else:
+                await concurrency.run_sync(response.close)
+
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def iterate(self, response: StreamingResponse) -> AsyncIterator[bytes]:
+        content = response.streaming_content
+
+        if hasattr(content, '__aiter__'):
+            async for chunk in content:  # type: ignore
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+
+                if chunk:
+                    yield chunk
+
+            return
+
+        # Synchronous iterables, such as files, may block and so are iterated
+        # in the executor.
+        iterator = iter(response)
+        while True:
+            chunk = await concurrency.run_sync(next, iterator, None)
+            if chunk is None:
+                break
+
+            yield chunk
@@ -0,0 +1,65 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
+
+__all__ = ['is_async_callable', 'run_sync', 'call_view']
+
+T = TypeVar('T')
+
+executor: contextvars.ContextVar[Optional[Executor]] = contextvars.ContextVar(
+    'rivr.executor', default=None
+)
+"""The executor used to run synchronous views from asynchronous code."""
+
+
+def is_async_callable(obj: Any) -> bool:
+    """
+    Returns True if calling the object returns a coroutine, for example an
+    `async def` function or an instance of a class with an `async def
+    __call__` method.
+    """
+
+    while isinstance(obj, functools.partial):
+        obj = obj.func
+
+    return inspect.iscoroutinefunction(obj) or inspect.iscoroutinefunction(
+        getattr(obj, '__call__', None)
+    )
+
+
+async def resolve(value: Union[T, Awaitable[T]]) -> T:
+    if inspect.isawaitable(value):
+        return await value
+
+    return value  # type: ignore
+
+
+async def run_sync(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Runs a synchronous callable in the current executor, so that it does not
+    block the event loop. Context variables are propagated to the callable.
+    """
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        executor.get(), functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+async def call_view(view: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Calls a synchronous or asynchronous view. Synchronous views are run in
+    the current executor, when a synchronous view returns an awaitable, such
+    as a router dispatching to an asynchronous view, the awaitable is awaited.
+    """
+
+    if is_async_callable(view):
+        response = view(*args, **kwargs)
+    else:
+        response = await run_sync(view, *args, **kwargs)
+
+    return await resolve(response)
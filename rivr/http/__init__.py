@@ -1,25 +1,39 @@
+from rivr.http.headers import Headers
 from rivr.http.media_type import MediaType
 from rivr.http.request import Request
 from rivr.http.response import (
+    FileResponse,
     Http404,
+    JSONResponse,
     Response,
     ResponseNoContent,
     ResponseNotAllowed,
     ResponseNotFound,
     ResponseNotModified,
     ResponsePermanentRedirect,
+    ResponsePreconditionFailed,
+    ResponseRangeNotSatisfiable,
     ResponseRedirect,
+    StreamingJSONResponse,
+    StreamingResponse,
 )
 
 __all__ = [
     'Request',
     'Http404',
     'Response',
+    'FileResponse',
+    'JSONResponse',
     'ResponseNoContent',
     'ResponseNotAllowed',
     'ResponseNotFound',
     'ResponseNotModified',
     'ResponsePermanentRedirect',
+    'ResponsePreconditionFailed',
+    'ResponseRangeNotSatisfiable',
     'ResponseRedirect',
+    'StreamingJSONResponse',
+    'StreamingResponse',
     'MediaType',
+    'Headers',
 ]
@@ -0,0 +1,97 @@
+import io
+import re
+from typing import IO
+
+__all__ = ['ChunkedReader']
+
+CHUNK_SIZE = re.compile(rb'[0-9A-Fa-f]+')
+
+
+class ChunkedReader(io.RawIOBase):
+    """
+    Decodes a message body using the chunked transfer coding (RFC 9112
+    section 7.1) as it is read from the underlying stream.
+
+    Chunk data is read directly into the caller's buffer, only the chunk
+    size lines and trailer section are buffered and they are limited to
+    `max_line_size` and `max_trailer_size` bytes. Chunk extensions and
+    trailer fields are discarded.
+
+    Example::
+
+        body = io.BufferedReader(ChunkedReader(environ['wsgi.input']))
+    """
+
+    max_line_size = 4096
+    """The maximum size of a chunk size line, including chunk extensions."""
+
+    max_trailer_size = 16 * 1024
+    """The maximum size of the trailer section."""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.remaining = 0
+        self.finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.finished:
+            return 0
+
+        if self.remaining == 0:
+            self.remaining = self.read_chunk_size()
+
+            if self.remaining == 0:
+                self.read_trailers()
+                self.finished = True
+                return 0
+
+        data = self.stream.read(min(len(buffer), self.remaining))
+        if not data:
+            raise IOError('Message body ended within a chunk')
+
+        length = len(data)
+        buffer[:length] = data
+        self.remaining -= length
+
+        if self.remaining == 0:
+            if self.read_line(self.max_line_size) != b'':
+                raise ValueError('Chunk data is not followed by a line break')
+
+        return length
+
+    def read_line(self, limit: int) -> bytes:
+        line = self.stream.readline(limit + 2)
+        if not line.endswith(b'\n'):
+            if len(line) > limit:
+                raise IOError('Chunked body line is above max bytes limit')
+
+            raise IOError('Message body ended within chunked framing')
+
+        return line.rstrip(b'\r\n')
+
+    def read_chunk_size(self) -> int:
+        line = self.read_line(self.max_line_size)
+        size, _, _ = line.partition(b';')
+        size = size.strip(b' \t')
+
+        # int() also accepts signs, prefixes and underscores which are not
+        # valid in a chunk size
+        if not CHUNK_SIZE.fullmatch(size):
+            raise ValueError('Invalid chunk size {!r}'.format(size))
+
+        return int(size, 16)
+
+    def read_trailers(self) -> None:
+        size = 0
+
+        while True:
+            line = self.read_line(self.max_trailer_size)
+            if not line:
+                return
+
+            size += len(line)
+            if size > self.max_trailer_size:
+                raise IOError('Chunked trailer section is above max bytes limit')
@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import List, Optional
+
+from rivr.http.request import Request
+
+__all__ = ['etag_matches', 'evaluate_preconditions']
+
+
+def is_weak(etag: str) -> bool:
+    return etag.startswith('W/')
+
+
+def opaque_tag(etag: str) -> str:
+    if is_weak(etag):
+        return etag[2:]
+
+    return etag
+
+
+def etag_matches(etag: str, candidates: List[str], weak: bool = False) -> bool:
+    """
+    Returns True when the entity tag matches any of the candidates, which
+    may include `*` to match any entity tag.
+
+    Strong comparison requires that both entity tags are strong, while weak
+    comparison only compares the opaque tags.
+
+    >>> etag_matches('W/"1"', ['"1"'], weak=True)
+    True
+    """
+
+    for candidate in candidates:
+        if candidate == '*':
+            return True
+
+        if weak:
+            if opaque_tag(candidate) == opaque_tag(etag):
+                return True
+        elif not is_weak(etag) and candidate == etag:
+            return True
+
+    return False
+
+
+def evaluate_preconditions(
+    request: Request, etag: Optional[str], last_modified: Optional[datetime]
+) -> Optional[int]:
+    """
+    Evaluates the conditional headers of a request against the current entity
+    tag and modification date of the selected representation, in the order
+    specified by RFC 9110 section 13.2.2.
+
+    Returns the status code which should be used instead of serving the
+    representation, either 304 or 412, or None when the request should be
+    served normally.
+    """
+
+    if_match = request.if_match
+    if if_match is not None:
+        if '*' not in if_match and (etag is None or not etag_matches(etag, if_match)):
+            return 412
+    else:
+        if_unmodified_since = request.if_unmodified_since
+        if (
+            if_unmodified_since is not None
+            and last_modified is not None
+            and last_modified > if_unmodified_since
+        ):
+            return 412
+
+    is_safe = request.method in ('GET', 'HEAD')
+
+    if_none_match = request.if_none_match
+    if if_none_match is not None:
+        if '*' in if_none_match or (
+            etag is not None and etag_matches(etag, if_none_match, weak=True)
+        ):
+            return 304 if is_safe else 412
+    elif is_safe:
+        if_modified_since = request.if_modified_since
+        if (
+            if_modified_since is not None
+            and last_modified is not None
+            and last_modified <= if_modified_since
+        ):
+            return 304
+
+    return None
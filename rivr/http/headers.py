@@ -0,0 +1,196 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+__all__ = ['Headers']
+
+T = TypeVar('T')
+
+HeadersInit = Union['Headers', Mapping[str, str], Iterable[Tuple[str, str]]]
+
+
+class Headers(object):
+    """
+    A case-insensitive, multi-valued collection of HTTP header fields.
+
+    Fields are stored by their lowercased name so that lookups do not need
+    to scan every field. Multiple values for the same field, such as
+    `Set-Cookie`, are kept in the order they were added.
+
+    >>> headers = Headers([('Content-Type', 'text/plain')])
+    >>> headers['content-type']
+    'text/plain'
+    """
+
+    def __init__(self, headers: Optional[HeadersInit] = None):
+        self._fields: Dict[str, List[Tuple[str, str]]] = {}
+        self._parsed: Dict[str, Any] = {}
+
+        if headers is not None:
+            if hasattr(headers, 'items'):
+                headers = headers.items()  # type: ignore
+
+            for name, value in headers:  # type: ignore
+                self.add(name, value)
+
+    def __repr__(self) -> str:
+        return '%s(%r)' % (self.__class__.__name__, self.items())
+
+    def __str__(self) -> str:
+        return '\r\n'.join(['%s: %s' % field for field in self.items()] + ['', ''])
+
+    def __bytes__(self) -> bytes:
+        return str(self).encode('iso-8859-1')
+
+    def __len__(self) -> int:
+        """
+        Returns the number of header field values, including repeated fields.
+        """
+
+        return sum(len(fields) for fields in self._fields.values())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Returns True when the header field is present.
+        """
+
+        return name.lower() in self._fields
+
+    def __getitem__(self, name: str) -> Optional[str]:
+        """
+        Returns the first value of the header field, or None when the field
+        is not present.
+        """
+
+        return self.get(name)
+
+    def __setitem__(self, name: str, value: str) -> None:
+        """
+        Sets the header field, replacing any existing values.
+        """
+
+        key = name.lower()
+        self._fields.pop(key, None)
+        self._fields[key] = [(name, value)]
+        self._parsed.pop(key, None)
+
+    def __delitem__(self, name: str) -> None:
+        """
+        Removes all values of the header field, if present.
+        """
+
+        key = name.lower()
+        self._fields.pop(key, None)
+        self._parsed.pop(key, None)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Headers):
+            return self.items() == other.items()
+
+        return NotImplemented
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        fields = self._fields.get(name.lower())
+        if fields:
+            return fields[0][1]
+
+        return default
+
+    def get_all(self, name: str) -> List[str]:
+        """
+        Returns every value of the header field in the order they were added.
+        """
+
+        return [value for (_, value) in self._fields.get(name.lower(), [])]
+
+    def add(self, name: str, value: str) -> None:
+        """
+        Adds a value for the header field, keeping any existing values.
+        """
+
+        key = name.lower()
+        fields = self._fields.get(key)
+        if fields is None:
+            self._fields[key] = [(name, value)]
+        else:
+            fields.append((name, value))
+
+        self._parsed.pop(key, None)
+
+    def add_header(self, name: str, value: Optional[str], **params: Any) -> None:
+        """
+        Adds a header field with optional parameters, compatible with
+        `wsgiref.headers.Headers.add_header`.
+
+        >>> headers.add_header('Content-Disposition', 'attachment', filename='a.txt')
+        """
+
+        parts = []
+        if value is not None:
+            parts.append(value)
+
+        for key, parameter in params.items():
+            key = key.replace('_', '-')
+            if parameter is None:
+                parts.append(key)
+            else:
+                parts.append('%s="%s"' % (key, parameter))
+
+        self.add(name, '; '.join(parts))
+
+    def setdefault(self, name: str, value: str) -> str:
+        """
+        Returns the first value of the header field, setting the field to
+        `value` when it is not present.
+        """
+
+        result = self.get(name)
+        if result is None:
+            self[name] = value
+            return value
+
+        return result
+
+    def keys(self) -> List[str]:
+        return [name for (name, _) in self.items()]
+
+    def values(self) -> List[str]:
+        return [value for (_, value) in self.items()]
+
+    def items(self) -> List[Tuple[str, str]]:
+        """
+        Returns every header field as a list of `(name, value)` pairs.
+        """
+
+        return [field for fields in self._fields.values() for field in fields]
+
+    def parsed(self, name: str, parser: Callable[[str], T]) -> Optional[T]:
+        """
+        Returns the first value of the header field parsed by `parser`, or
+        None when the field is not present. The parsed value is cached until
+        the header field is modified and so should be treated as immutable.
+        """
+
+        key = name.lower()
+        try:
+            return self._parsed[key]
+        except KeyError:
+            pass
+
+        value = self.get(name)
+        result = parser(value) if value else None
+        self._parsed[key] = result
+        return result
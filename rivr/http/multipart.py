@@ -0,0 +1,342 @@
+import re
+from tempfile import SpooledTemporaryFile
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+from rivr.http.headers import Headers
+from rivr.http.media_type import MediaType
+
+__all__ = ['UploadedFile', 'MultipartParser']
+
+DISPOSITION_PARAMETER = re.compile(
+    r';\s*([^\s=;]+)\s*=\s*("(?:\\.|[^"\\])*"|[^;]*)', re.ASCII
+)
+QUOTED_PAIR = re.compile(r'\\(.)')
+
+
+def parse_content_disposition(value: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Parses a Content-Disposition header into the disposition type and its
+    parameters.
+
+    >>> parse_content_disposition('form-data; name="file"; filename="a.txt"')
+    ('form-data', {'name': 'file', 'filename': 'a.txt'})
+    """
+
+    disposition, _, _ = value.partition(';')
+    parameters: Dict[str, str] = {}
+
+    for match in DISPOSITION_PARAMETER.finditer(value):
+        name = match.group(1).lower()
+        parameter = match.group(2).strip()
+
+        if parameter.startswith('"'):
+            parameter = QUOTED_PAIR.sub(r'\1', parameter[1:-1])
+
+        if name.endswith('*'):
+            # RFC 5987 extended notation, charset'language'value
+            charset, _, encoded = parameter.partition("'")
+            _, _, encoded = encoded.partition("'")
+            try:
+                parameter = unquote(encoded, charset or 'utf-8', 'strict')
+            except (LookupError, UnicodeDecodeError):
+                continue
+
+            name = name[:-1]
+        elif name in parameters:
+            # The extended notation takes precedence when both are given
+            continue
+
+        parameters[name] = parameter
+
+    return (disposition.strip().lower(), parameters)
+
+
+class UploadedFile(object):
+    """
+    A file uploaded in a `multipart/form-data` request body. Small files are
+    held in memory while larger files are spooled to a temporary file which
+    is removed once the file is closed.
+    """
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        name: str,
+        filename: str,
+        headers: Headers,
+        size: int,
+    ):
+        self.file = file
+        self.name = name
+        self.filename = filename
+        self.headers = headers
+        self.size = size
+
+    def __repr__(self) -> str:
+        return '<UploadedFile %r (%d bytes)>' % (self.filename, self.size)
+
+    @property
+    def content_type(self) -> Optional[MediaType]:
+        content_type = self.headers['Content-Type']
+        if content_type:
+            return MediaType.parse(content_type)
+        return None
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.file.seek(offset, whence)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class MultipartParser(object):
+    """
+    An incremental parser for `multipart/form-data` bodies (RFC 7578), which
+    reads the body in chunks of `chunk_size` bytes.
+
+    Fields are decoded into strings, while files are written to a
+    `SpooledTemporaryFile` which is moved to disk once it exceeds
+    `spool_size` bytes. An `IOError` is raised when a part is larger than
+    `max_part_size`, a field is larger than `max_field_size` or the body is
+    larger than `max_size`. A `ValueError` is raised for malformed bodies.
+
+    Example::
+
+        parser = MultipartParser(request.body, 'boundary', length=1024)
+        fields, files = parser.parse()
+    """
+
+    chunk_size = 64 * 1024
+    """The number of bytes read from the body at a time."""
+
+    max_header_size = 16 * 1024
+    """The maximum size of the headers of a single part."""
+
+    max_parts = 1000
+    """The maximum number of parts in a body."""
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        boundary: str,
+        length: Optional[int] = None,
+        spool_size: int = 1024 * 1024,
+        max_part_size: Optional[int] = None,
+        max_field_size: Optional[int] = 1024 * 1024,
+        max_size: Optional[int] = None,
+        encoding: str = 'utf-8',
+    ):
+        if not boundary or len(boundary) > 70:
+            raise ValueError('Invalid multipart boundary')
+
+        self.stream = stream
+        self.delimiter = b'\r\n--' + boundary.encode('latin-1')
+        self.remaining = length
+        self.spool_size = spool_size
+        self.max_part_size = max_part_size
+        self.max_field_size = max_field_size
+        self.max_size = max_size
+        self.encoding = encoding
+
+        self.buffer = b''
+        self.size = 0
+
+    def parse(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, UploadedFile]]]:
+        """
+        Parses the body, returning the fields and files as lists of `(name,
+        value)` pairs in the order they were given.
+        """
+
+        if self.max_size is not None and (self.remaining or 0) > self.max_size:
+            raise IOError('Message body is above max bytes limit')
+
+        fields: List[Tuple[str, str]] = []
+        files: List[Tuple[str, UploadedFile]] = []
+
+        # The first delimiter is not required to be preceded by a line break
+        self.buffer = b'\r\n'
+        for _ in self.read_part():
+            pass  # Discard the preamble
+
+        try:
+            while not self.read_boundary_end():
+                if len(fields) + len(files) >= self.max_parts:
+                    raise IOError('Message body contains too many parts')
+
+                headers = self.read_headers()
+                disposition, parameters = parse_content_disposition(
+                    headers['Content-Disposition'] or ''
+                )
+                if disposition != 'form-data' or 'name' not in parameters:
+                    raise ValueError('Multipart part is missing a form-data name')
+
+                name = parameters['name']
+                if 'filename' in parameters:
+                    files.append(
+                        (name, self.read_file(name, parameters['filename'], headers))
+                    )
+                else:
+                    fields.append((name, self.read_field(headers)))
+        except BaseException:
+            for _, uploaded_file in files:
+                uploaded_file.close()
+            raise
+
+        return (fields, files)
+
+    def read_field(self, headers: Headers) -> str:
+        data = bytearray()
+        for chunk in self.read_part():
+            data += chunk
+
+            if self.max_field_size is not None and len(data) > self.max_field_size:
+                raise IOError('Multipart field is above max bytes limit')
+
+        encoding = self.encoding
+        content_type = headers['Content-Type']
+        if content_type:
+            media_type = MediaType.parse(content_type)
+            encoding = media_type['charset'] or encoding
+
+        return data.decode(encoding)
+
+    def read_file(self, name: str, filename: str, headers: Headers) -> UploadedFile:
+        file: IO[bytes] = SpooledTemporaryFile(max_size=self.spool_size)  # type: ignore
+        size = 0
+
+        try:
+            for chunk in self.read_part():
+                file.write(chunk)
+                size += len(chunk)
+        except BaseException:
+            file.close()
+            raise
+
+        file.seek(0)
+        return UploadedFile(file, name, filename, headers, size)
+
+    def fill(self) -> bool:
+        """
+        Reads the next chunk of the body into the buffer, returning False
+        once the body has been read.
+        """
+
+        size = self.chunk_size
+        if self.remaining is not None:
+            if self.remaining <= 0:
+                return False
+
+            size = min(size, self.remaining)
+
+        chunk = self.stream.read(size)
+        if not chunk:
+            return False
+
+        if self.remaining is not None:
+            self.remaining -= len(chunk)
+
+        self.size += len(chunk)
+        if self.max_size is not None and self.size > self.max_size:
+            raise IOError('Message body is above max bytes limit')
+
+        self.buffer += chunk
+        return True
+
+    def read_part(self) -> Iterator[bytes]:
+        """
+        Yields the content of the current part up until the next delimiter,
+        which is consumed.
+        """
+
+        delimiter = self.delimiter
+        keep = len(delimiter) - 1
+        size = 0
+
+        while True:
+            index = self.buffer.find(delimiter)
+            if index != -1:
+                data = self.buffer[:index]
+                self.buffer = self.buffer[index + len(delimiter) :]
+            elif len(self.buffer) > keep:
+                # The end of the buffer may contain the start of a delimiter
+                data = self.buffer[:-keep]
+                self.buffer = self.buffer[-keep:]
+            else:
+                data = b''
+
+            if data:
+                size += len(data)
+                if self.max_part_size is not None and size > self.max_part_size:
+                    raise IOError('Multipart part is above max bytes limit')
+
+                yield data
+
+            if index != -1:
+                return
+
+            if not self.fill():
+                raise ValueError('Multipart body ended before the closing delimiter')
+
+    def read_boundary_end(self) -> bool:
+        """
+        Consumes the remainder of a delimiter line, returning True if the
+        delimiter closed the body.
+        """
+
+        while len(self.buffer) < 2 and self.fill():
+            pass
+
+        if self.buffer.startswith(b'--'):
+            return True
+
+        while True:
+            line_end = self.buffer.find(b'\r\n')
+            if line_end != -1:
+                break
+
+            if len(self.buffer) > self.max_header_size or not self.fill():
+                raise ValueError('Invalid multipart delimiter')
+
+        if self.buffer[:line_end].strip(b' \t'):
+            raise ValueError('Invalid multipart delimiter')
+
+        self.buffer = self.buffer[line_end + 2 :]
+        return False
+
+    def read_headers(self) -> Headers:
+        while True:
+            if self.buffer.startswith(b'\r\n'):
+                block = b''
+                self.buffer = self.buffer[2:]
+                break
+
+            end = self.buffer.find(b'\r\n\r\n')
+            if end != -1:
+                block = self.buffer[:end]
+                self.buffer = self.buffer[end + 4 :]
+                break
+
+            if len(self.buffer) > self.max_header_size:
+                raise IOError('Multipart headers are above max bytes limit')
+
+            if not self.fill():
+                raise ValueError('Multipart body ended within part headers')
+
+        headers = Headers()
+        for line in block.split(b'\r\n'):
+            name, separator, value = line.partition(b':')
+            if not separator:
+                raise ValueError('Invalid multipart header')
+
+            try:
+                decoded_value = value.strip().decode('utf-8')
+            except UnicodeDecodeError:
+                decoded_value = value.strip().decode('latin-1')
+
+            headers.add(name.strip().decode('latin-1'), decoded_value)
+
+        return headers
@@ -1,14 +1,17 @@
-import json
-from datetime import datetime
+import re
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from http.cookies import CookieError, SimpleCookie
 from io import BytesIO
-from typing import IO, Any, Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import parse_qsl, urlencode
 
+from rivr.http.headers import Headers
 from rivr.http.message import HTTPMessage
+from rivr.http.multipart import MultipartParser, UploadedFile
+from rivr.http.serialization import iter_ndjson, loads
 
-__all__ = ['Query', 'Request']
+__all__ = ['Query', 'MutableQuery', 'Request']
 
 
 def parse_cookie(values: List[str]) -> SimpleCookie:
@@ -23,18 +26,80 @@ def parse_cookie(values: List[str]) -> SimpleCookie:
     return cookies
 
 
-QueryConvertible = Union[str, Dict[str, str]]
+def parse_http_date(value: str) -> Optional[datetime]:
+    """
+    Parses an HTTP-date, returning None when the value is not a valid date.
+    Dates in the obsolete asctime format do not include a time zone and are
+    in UTC.
+    """
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (ValueError, TypeError):
+        return None
+
+    if date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+
+    return date
+
+
+BYTE_RANGE_SPEC = re.compile(r'([0-9]*)-([0-9]*)')
+
+QueryConvertible = Union[str, Dict[str, str], Iterable[Tuple[str, str]]]
 
 
 class Query:
+    """
+    The parameters of a URL query string. A parameter may be given multiple
+    times, `query[name]` returns the first value while `getlist()` returns
+    every value.
+
+    The query string is only parsed once a parameter is accessed. A `Query`
+    is immutable, use `copy()` to create a `MutableQuery`.
+    """
+
     def __init__(self, query: Optional[QueryConvertible] = None):
+        self._query_string: Optional[str] = None
+        self._pairs: Optional[List[Tuple[str, str]]] = None
+        self._index: Optional[Dict[str, List[str]]] = None
+        self._encoded: Optional[str] = None
+        self._dict: Optional[Dict[str, str]] = None
+
         if query:
             if isinstance(query, str):
-                self._query = parse_qsl(query, True)
+                self._query_string = query
+            elif isinstance(query, Query):
+                self._pairs = query.items()
             elif isinstance(query, dict):
-                self._query = list(query.items())
+                self._pairs = list(query.items())
+            else:
+                self._pairs = list(query)
         else:
-            self._query = []
+            self._pairs = []
+
+    @property
+    def _query(self) -> List[Tuple[str, str]]:
+        if self._pairs is None:
+            self._pairs = parse_qsl(self._query_string or '', True)
+
+        return self._pairs
+
+    @property
+    def _parameters(self) -> Dict[str, List[str]]:
+        if self._index is None:
+            index: Dict[str, List[str]] = {}
+
+            for key, value in self._query:
+                values = index.get(key)
+                if values is None:
+                    index[key] = [value]
+                else:
+                    values.append(value)
+
+            self._index = index
+
+        return self._index
 
     def __str__(self) -> str:
         """
@@ -43,7 +108,13 @@ class Query:
         'category=fruits'
         """
 
-        return urlencode(self._query)
+        if self._encoded is None:
+            self._encoded = urlencode(self._query)
+
+        return self._encoded
+
+    def __repr__(self) -> str:
+        return '%s(%r)' % (self.__class__.__name__, self.items())
 
     def __contains__(self, name: str) -> bool:
         """
@@ -52,7 +123,7 @@ class Query:
         True
         """
 
-        return self[name] is not None
+        return name in self._parameters
 
     def __getitem__(self, name: str) -> Optional[str]:
         """
@@ -61,12 +132,24 @@ class Query:
         'fruits'
         """
 
-        for key, value in self._query:
-            if key == name:
-                return value
+        values = self._parameters.get(name)
+        if values:
+            return values[0]
 
         return None
 
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the names of the parameters, a parameter which is given
+        multiple times is only included once.
+
+        >>> query = Query('category=fruits&limit=10')
+        >>> list(query)
+        ['category', 'limit']
+        """
+
+        return iter(self._parameters)
+
     def __len__(self) -> int:
         """
         >>> query = Query('category=fruits&limit=10')
@@ -76,6 +159,118 @@ class Query:
 
         return len(self._query)
 
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Query):
+            return self.items() == other.items()
+
+        return NotImplemented
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        >>> query = Query('category=fruits')
+        >>> query.get('limit', '10')
+        '10'
+        """
+
+        values = self._parameters.get(name)
+        if values:
+            return values[0]
+
+        return default
+
+    def getlist(self, name: str) -> List[str]:
+        """
+        >>> query = Query('category=fruits&category=vegetables')
+        >>> query.getlist('category')
+        ['fruits', 'vegetables']
+        """
+
+        return list(self._parameters.get(name, []))
+
+    def keys(self) -> List[str]:
+        return list(self._parameters)
+
+    def items(self) -> List[Tuple[str, str]]:
+        """
+        Returns every parameter as a list of `(name, value)` pairs, in the
+        order they were given.
+        """
+
+        return list(self._query)
+
+    def to_dict(self) -> Dict[str, str]:
+        """
+        Returns the parameters as a dictionary, using the last value of
+        parameters which are given multiple times. The dictionary is shared
+        and must not be modified.
+        """
+
+        if self._dict is None:
+            self._dict = dict(self._query)
+
+        return self._dict
+
+    def copy(self) -> 'MutableQuery':
+        return MutableQuery(self._query)
+
+
+class MutableQuery(Query):
+    """
+    A query which may be modified, for example to build a URL.
+
+    >>> query = Query('category=fruits&page=2').copy()
+    >>> query['page'] = '3'
+    >>> str(query)
+    'category=fruits&page=3'
+    """
+
+    def __setitem__(self, name: str, value: str) -> None:
+        """
+        Sets the parameter, replacing any existing values.
+        """
+
+        self.setlist(name, [value])
+
+    def __delitem__(self, name: str) -> None:
+        self._pairs = [(key, value) for (key, value) in self._query if key != name]
+        self.changed()
+
+    def setlist(self, name: str, values: List[str]) -> None:
+        """
+        Sets the parameter to multiple values, replacing any existing values.
+        The values are placed in the position of the first existing value.
+        """
+
+        pairs: List[Tuple[str, str]] = []
+        inserted = False
+
+        for key, value in self._query:
+            if key == name:
+                if not inserted:
+                    pairs.extend((name, value) for value in values)
+                    inserted = True
+            else:
+                pairs.append((key, value))
+
+        if not inserted:
+            pairs.extend((name, value) for value in values)
+
+        self._pairs = pairs
+        self.changed()
+
+    def add(self, name: str, value: str) -> None:
+        """
+        Adds a value for the parameter, keeping any existing values.
+        """
+
+        self._query.append((name, value))
+        self.changed()
+
+    def changed(self) -> None:
+        self._index = None
+        self._encoded = None
+        self._dict = None
+
 
 class Request(HTTPMessage):
     """
@@ -86,24 +281,45 @@ class Request(HTTPMessage):
 
     host = 'localhost'
 
+    multipart_spool_size = 1024 * 1024
+    """
+    Uploaded files larger than this number of bytes are spooled to a
+    temporary file instead of being held in memory.
+    """
+
+    max_multipart_part_size: Optional[int] = None
+    """The maximum size of each part of a `multipart/form-data` body."""
+
+    max_multipart_field_size: Optional[int] = 1024 * 1024
+    """The maximum size of each non-file field of a `multipart/form-data` body."""
+
+    max_multipart_size: Optional[int] = None
+    """The maximum size of a `multipart/form-data` body."""
+
+    max_body_size: Optional[int] = 10 * 1024 * 1024
+    """The maximum size of a JSON or form body decoded by `attributes`."""
+
+    json_decoder = staticmethod(loads)
+    """
+    The function used to decode JSON request bodies from bytes. By default
+    `orjson` is used when installed, otherwise the `json` module.
+    """
+
     def __init__(
         self,
         path: str = '/',
         method: str = 'GET',
         query: Optional[Union[Dict[str, str], Query]] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Union[Headers, Dict[str, str]]] = None,
         body: Optional[Union[bytes, IO[bytes]]] = None,
     ):
         self.path = path
         self.method = method
 
-        if query:
-            if isinstance(query, Query):
-                self.query = query
-            else:
-                self.query = Query(query)
+        if isinstance(query, Query):
+            self.query = query
         else:
-            self.query = Query()
+            self.query = Query(query)
 
         if body:
             if isinstance(body, bytes):
@@ -124,6 +340,55 @@ class Request(HTTPMessage):
 
     # Header accessors
 
+    @property
+    def accept_encoding(self) -> Optional[Dict[str, float]]:
+        """
+        The content codings of the Accept-Encoding header, mapped to their
+        quality values.
+
+        >>> request = Request(headers={'Accept-Encoding': 'gzip, br;q=0.5'})
+        >>> request.accept_encoding
+        {'gzip': 1.0, 'br': 0.5}
+        """
+
+        accept_encoding = self.headers.get('accept-encoding')
+        if accept_encoding is None:
+            return None
+
+        codings: Dict[str, float] = {}
+        for value in accept_encoding.split(','):
+            coding, _, parameters = value.partition(';')
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+
+            quality = 1.0
+            name, _, q = parameters.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(q)
+                except ValueError:
+                    quality = 0.0
+
+            codings[coding] = quality
+
+        return codings
+
+    def accepts_encoding(self, coding: str) -> bool:
+        """
+        Returns True if the client accepts the given content coding, such as
+        `gzip`.
+        """
+
+        accept_encoding = self.accept_encoding
+        if not accept_encoding:
+            return False
+
+        if coding in accept_encoding:
+            return accept_encoding[coding] > 0
+
+        return accept_encoding.get('*', 0) > 0
+
     @property
     def authorization(self) -> Optional[Tuple[str, str]]:
         authorization = self.headers.get('authorization')
@@ -149,18 +414,53 @@ class Request(HTTPMessage):
 
         return [m.strip() for m in if_none_match.split(',')]
 
+    @property
+    def if_range(self) -> Optional[str]:
+        return self.headers.get('if-range')
+
+    @property
+    def range(self) -> Optional[List[Tuple[Optional[int], Optional[int]]]]:
+        """
+        The byte ranges of the Range header as a list of `(first, last)`
+        positions, where `last` is inclusive. Either position may be None for
+        ranges such as `500-` and suffix ranges such as `-500`.
+
+        None is returned when the header is missing, invalid or uses a unit
+        other than bytes.
+        """
+
+        value = self.headers.get('range')
+        if not value:
+            return None
+
+        unit, _, specs = value.partition('=')
+        if unit.strip().lower() != 'bytes':
+            return None
+
+        ranges: List[Tuple[Optional[int], Optional[int]]] = []
+        for spec in specs.split(','):
+            match = BYTE_RANGE_SPEC.fullmatch(spec.strip())
+            if not match or match.group() == '-':
+                return None
+
+            first = int(match.group(1)) if match.group(1) else None
+            last = int(match.group(2)) if match.group(2) else None
+            if first is not None and last is not None and last < first:
+                return None
+
+            ranges.append((first, last))
+
+        return ranges
+
     @property
     def if_modified_since(self) -> Optional[datetime]:
         value = self.headers.get('if-modified-since')
         if value is None:
             return None
 
-        try:
-            return parsedate_to_datetime(value)
-        except (ValueError, TypeError):
-            # A recipient MUST ignore the If-Modified-Since header field if
-            # the received field value is not a valid HTTP-date
-            return None
+        # A recipient MUST ignore the If-Modified-Since header field if
+        # the received field value is not a valid HTTP-date
+        return parse_http_date(value)
 
     @property
     def if_unmodified_since(self) -> Optional[datetime]:
@@ -168,16 +468,86 @@ class Request(HTTPMessage):
         if value is None:
             return None
 
-        try:
-            return parsedate_to_datetime(value)
-        except (ValueError, TypeError):
-            # A recipient MUST ignore the If-Unmodified-Since header field
-            # if the received field value is not a valid HTTP-date
-            # (including when the field value appears to be a list of dates).
-            return None
+        # A recipient MUST ignore the If-Unmodified-Since header field
+        # if the received field value is not a valid HTTP-date
+        # (including when the field value appears to be a list of dates).
+        return parse_http_date(value)
 
     # Body
 
+    @property
+    def is_chunked(self) -> bool:
+        transfer_encoding = self.headers['transfer-encoding']
+        if not transfer_encoding:
+            return False
+
+        return 'chunked' in {te.strip() for te in transfer_encoding.split(',')}
+
+    def body_length(self) -> Optional[int]:
+        """
+        Returns the number of bytes of the request body which may be read,
+        or None when the body is chunked and should be read until the end of
+        the stream.
+        """
+
+        if self.is_chunked:
+            return None
+
+        content_length = self.content_length
+
+        if content_length is None:
+            raise IOError('Message body was not chunked nor contained content-length')
+
+        return content_length
+
+    def read_body(self, max_bytes: Optional[int] = 1000000) -> bytes:
+        """
+        Read the request body into bytes, up until a default limit of 1mb.
+
+        read_body is a blocking method, and can block if a client slowly
+        streams a request body.
+        """
+
+        content_length = self.body_length()
+
+        if content_length is None:
+            buffer = self.body.read(max_bytes or -1)
+            if max_bytes and len(self.body.read(1)) > 0:
+                raise IOError('Message body is above max bytes limit')
+
+            return buffer
+
+        if max_bytes and content_length > max_bytes:
+            raise IOError('Message body is above max bytes limit')
+
+        return self.body.read(content_length)
+
+    def iter_body(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Iterates over the request body in chunks of up to `chunk_size` bytes
+        as they are received, without reading the whole body into memory.
+
+        Example::
+
+            def view(request):
+                for chunk in request.iter_body():
+                    ...
+        """
+
+        remaining = self.body_length()
+        read = getattr(self.body, 'read1', self.body.read)
+
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = read(size)
+            if not chunk:
+                break
+
+            if remaining is not None:
+                remaining -= len(chunk)
+
+            yield chunk
+
     def text(self, max_bytes: Optional[int] = 1000000) -> str:
         """
         Read the request body into a string, up until a default limit of 1mb.
@@ -189,14 +559,6 @@ class Request(HTTPMessage):
         streams a request body.
         """
 
-        transfer_encoding = self.headers['transfer-encoding']
-        is_chunked = False
-        if transfer_encoding:
-            supported_encodings = set(
-                map(lambda te: te.strip(), transfer_encoding.split(','))
-            )
-            is_chunked = 'chunked' in supported_encodings
-
         encoding = 'utf-8'
 
         content_type = self.content_type
@@ -205,56 +567,125 @@ class Request(HTTPMessage):
             if charset:
                 encoding = charset
 
-        if is_chunked:
-            buffer = self.body.read(max_bytes or -1)
-            if max_bytes and len(self.body.read(1)) > 0:
-                raise IOError('Message body is above max bytes limit')
-        else:
-            content_length = self.content_length
+        return self.read_body(max_bytes).decode(encoding)
 
-            if content_length is None:
-                raise IOError(
-                    'Message body was not chunked nor contained content-length'
-                )
+    def json(self, max_bytes: Optional[int] = 1000000) -> Any:
+        """
+        Decode a JSON request body, up until a default limit of 1mb. The body
+        is decoded directly from bytes by `json_decoder`.
+        """
 
-            if max_bytes and content_length > max_bytes:
-                raise IOError('Message body is above max bytes limit')
+        return self.json_decoder(self.read_body(max_bytes))
+
+    def ndjson(self, max_record_size: Optional[int] = 1000000) -> Iterator[Any]:
+        """
+        Iterates over the records of a newline delimited JSON request body,
+        decoding each record as it is read. Each record may be up to
+        `max_record_size` bytes while the body itself is not limited.
+
+        Example::
+
+            def view(request):
+                for record in request.ndjson():
+                    ...
+        """
+
+        return iter_ndjson(
+            self.body,
+            length=self.body_length(),
+            decoder=self.json_decoder,
+            max_record_size=max_record_size,
+        )
+
+    @property
+    def files(self) -> Dict[str, UploadedFile]:
+        """
+        The files uploaded in a `multipart/form-data` request body, by their
+        field name.
+
+        Uploaded files should be closed once they are no longer needed,
+        which removes any temporary file.
+        """
+
+        if not hasattr(self, '_files'):
+            content_type = self.content_type
+
+            if (
+                content_type
+                and content_type.type == 'multipart'
+                and content_type.subtype == 'form-data'
+            ):
+                self.parse_multipart()
+            else:
+                self._files: Dict[str, UploadedFile] = {}
+
+        return self._files
 
-            buffer = self.body.read(content_length)
+    def parse_multipart(self) -> None:
+        """
+        Parses a `multipart/form-data` request body incrementally into
+        `attributes` and `files`.
+        """
 
-        return buffer.decode(encoding)
+        content_type = self.content_type
+        boundary = content_type['boundary'] if content_type else None
+        if not boundary:
+            raise ValueError('Multipart request is missing a boundary')
+
+        parser = MultipartParser(
+            self.body,
+            boundary,
+            length=self.body_length(),
+            spool_size=self.multipart_spool_size,
+            max_part_size=self.max_multipart_part_size,
+            max_field_size=self.max_multipart_field_size,
+            max_size=self.max_multipart_size,
+        )
+        fields, files = parser.parse()
+
+        self._attributes = dict(fields)
+        self._files = dict(files)
 
     # Deprecated
     @property
     def GET(self) -> Dict[str, str]:
-        return dict((k, v) for k, v in self.query._query)
+        return dict(self.query.to_dict())
 
     @property
     def attributes(self) -> Any:
         """
         A request body, deserialized as a dictionary.
 
-        This will automatically deserialize form or JSON encoded request
-        bodies.
+        This will automatically deserialize form, multipart form or JSON
+        encoded request bodies. Files uploaded in a multipart form are
+        available from `files`.
         """
 
         if not hasattr(self, '_attributes'):
             content_type = self.content_type
 
-            if content_type:
-                text = self.text(max_bytes=None)
-
-                if (
-                    content_type.type == 'application'
-                    and content_type.subtype == 'json'
-                ):
-                    self._attributes = json.loads(text)
-                elif (
-                    content_type.type == 'application'
-                    and content_type.subtype == 'x-www-form-urlencoded'
-                ):
-                    data = parse_qsl(text, True)
-                    self._attributes = dict((k, v) for k, v in data)
+            if (
+                content_type
+                and content_type.type == 'multipart'
+                and content_type.subtype == 'form-data'
+            ):
+                self.parse_multipart()
+            elif (
+                content_type
+                and content_type.type == 'application'
+                and (
+                    content_type.subtype == 'json'
+                    or content_type.subtype.endswith('+json')
+                )
+            ):
+                self._attributes = self.json(max_bytes=self.max_body_size)
+            elif (
+                content_type
+                and content_type.type == 'application'
+                and content_type.subtype == 'x-www-form-urlencoded'
+            ):
+                text = self.text(max_bytes=self.max_body_size)
+                self._attributes = dict(parse_qsl(text, True))
             else:
                 self._attributes = {}
 
@@ -1,8 +1,15 @@
+import asyncio
 import datetime
+import os
 from http.cookies import SimpleCookie
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import IO, Any, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from rivr.http.message import HTTPMessage, MediaType
+from rivr.http.serialization import dumps, iter_json_array
+from rivr.timing import measure
+
+closing_tasks: Set['asyncio.Task[None]'] = set()
+"""Tasks closing asynchronous streaming content, referenced until done."""
 
 
 class Http404(Exception):
@@ -18,6 +25,9 @@ class Response(HTTPMessage):
     status_code: int = 200
     """The HTTP status code for the response."""
 
+    _cookies: Optional[SimpleCookie] = None
+    _set_cookie_headers: Optional[List[Tuple[str, str]]] = None
+
     def __init__(
         self,
         content: Union[str, bytes] = '',
@@ -26,25 +36,59 @@ class Response(HTTPMessage):
     ):
         super(Response, self).__init__()
 
-        self.content = content
-
         if status:
             self.status_code = status
 
         if content_type:
-            if isinstance(content_type, str):
-                self.content_type = MediaType.parse(content_type)
-            else:
-                self.content_type = content_type
+            # A string content type is stored as is, it is only parsed if
+            # `content_type` is accessed.
+            self.headers['Content-Type'] = str(content_type)
 
-        self.cookies: SimpleCookie = SimpleCookie()
+        self.content = content
 
     def __str__(self) -> str:
         headers = ['%s: %s' % (key, value) for key, value in self.headers.items()]
-        if isinstance(self.content, bytes):
-            return '\n'.join(headers) + '\n\n' + self.content.decode('utf-8')
+        return '\n'.join(headers) + '\n\n' + self.content.decode('utf-8', 'replace')
+
+    @property
+    def content(self) -> bytes:
+        """
+        The body of the response. Text content is encoded as UTF-8 when it
+        is set, and the `Content-Length` header is set to the length of the
+        content.
+        """
+
+        return self._content
 
-        return '\n'.join(headers) + '\n\n' + self.content
+    @content.setter
+    def content(self, value: Union[str, bytes]) -> None:
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+
+        self._content = value
+
+        if self.status_code >= 200 and self.status_code not in (204, 304):
+            self.headers['Content-Length'] = str(len(value))
+
+    @property
+    def cookies(self) -> SimpleCookie:
+        """
+        The cookies set by the response, created when first accessed.
+        """
+
+        # The cookies may be modified by the caller, the serialised
+        # `Set-Cookie` fields are rebuilt when next needed.
+        self._set_cookie_headers = None
+
+        if self._cookies is None:
+            self._cookies = SimpleCookie()
+
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, cookies: SimpleCookie) -> None:
+        self._set_cookie_headers = None
+        self._cookies = cookies
 
     def set_cookie(
         self,
@@ -97,15 +141,232 @@ class Response(HTTPMessage):
             expires='Thu, 01-Jan-1970 00:00:00 GMT',
         )
 
-    def headers_items(self) -> Iterable[Tuple[str, str]]:
-        headers = [(k, v) for k, v in self.headers.items()]
+    def headers_items(self) -> List[Tuple[str, str]]:
+        """
+        Returns the header fields of the response as they are sent, including
+        a `Set-Cookie` field for each cookie. The `Set-Cookie` fields are
+        serialised once, until the cookies are accessed again.
+        `Content-Length` is omitted for statuses which do not have a body.
+        """
+
+        headers = self.headers.items()
 
-        for cookie in self.cookies.values():
-            headers.append(('Set-Cookie', cookie.OutputString()))
+        if self.status_code < 200 or self.status_code in (204, 304):
+            # The status may have been changed after the content was set
+            headers = [
+                (name, value)
+                for (name, value) in headers
+                if name.lower() != 'content-length'
+            ]
+
+        if self._cookies:
+            if self._set_cookie_headers is None:
+                self._set_cookie_headers = [
+                    ('Set-Cookie', cookie.OutputString())
+                    for cookie in self._cookies.values()
+                ]
+
+            headers.extend(self._set_cookie_headers)
 
         return headers
 
 
+class StreamingResponse(Response):
+    """
+    A response whose body is produced by an iterable of `bytes` or `str`
+    chunks, for example a generator. The body is passed to the server chunk by
+    chunk instead of being held in memory.
+
+    Example::
+
+        def export(request):
+            def rows():
+                for row in query():
+                    yield ','.join(row) + '\\n'
+
+            return StreamingResponse(rows(), content_type='text/csv')
+
+    When the response is served, `close()` is called once the server has
+    finished with the body, which closes the underlying iterable if it
+    supports it.
+
+    When served by `ASGIHandler`, the content may also be an asynchronous
+    iterable such as an async generator.
+    """
+
+    def __init__(
+        self,
+        content: Union[Iterable[Union[str, bytes]], str, bytes] = (),
+        status: Optional[int] = None,
+        content_type: Union[str, MediaType, None] = 'text/html; charset=utf8',
+    ):
+        super(StreamingResponse, self).__init__(content, status, content_type)  # type: ignore
+
+    @property  # type: ignore
+    def content(self) -> bytes:
+        """
+        The complete body of the response. Accessing the content consumes the
+        streaming content.
+        """
+
+        return b''.join(self)
+
+    @content.setter
+    def content(self, value: Union[Iterable[Union[str, bytes]], str, bytes]) -> None:
+        if hasattr(self, 'streaming_content'):
+            self.close()
+
+        if isinstance(value, (str, bytes)):
+            value = [value]
+
+        self.streaming_content: Iterable[Union[str, bytes]] = value
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.streaming_content:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+
+            if chunk:
+                yield chunk
+
+    def close(self) -> None:
+        close = getattr(self.streaming_content, 'close', None)
+        if close:
+            close()
+            return
+
+        aclose = getattr(self.streaming_content, 'aclose', None)
+        if aclose:
+            # Asynchronous iterables can only be closed on the event loop
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+
+            task = loop.create_task(aclose())
+            closing_tasks.add(task)
+            task.add_done_callback(closing_tasks.discard)
+
+
+class JSONResponse(Response):
+    """
+    A response whose body is a value encoded as JSON. The value is encoded
+    directly to bytes by `encoder`, which by default uses `orjson` or
+    `ujson` when they are installed.
+
+    Example::
+
+        def view(request):
+            return JSONResponse({'name': 'Kyle'})
+    """
+
+    encoder = staticmethod(dumps)
+    """The function used to encode the value as JSON bytes."""
+
+    def __init__(
+        self,
+        value: Any,
+        status: Optional[int] = None,
+        content_type: Union[str, MediaType, None] = 'application/json',
+    ):
+        with measure('serialize'):
+            content = self.encoder(value)
+
+        super(JSONResponse, self).__init__(content, status, content_type)
+
+
+class StreamingJSONResponse(StreamingResponse):
+    """
+    A streaming response which encodes an iterable, such as a generator or
+    large list, as a JSON array item by item while it is served.
+
+    Example::
+
+        def export(request):
+            return StreamingJSONResponse(row.to_dict() for row in query())
+    """
+
+    encoder = staticmethod(dumps)
+    """The function used to encode each item as JSON bytes."""
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        status: Optional[int] = None,
+        content_type: Union[str, MediaType, None] = 'application/json',
+    ):
+        self.items = items
+        super(StreamingJSONResponse, self).__init__(
+            iter_json_array(items, self.encoder), status, content_type
+        )
+
+    def close(self) -> None:
+        super(StreamingJSONResponse, self).close()
+
+        close = getattr(self.items, 'close', None)
+        if close:
+            close()
+
+
+class FileResponse(StreamingResponse):
+    """
+    A streaming response which serves the contents of an open binary file,
+    read from its current position in chunks of `block_size` bytes. When
+    `length` is given, only that many bytes are served.
+
+    When served by `WSGIHandler`, the server's `wsgi.file_wrapper` is used
+    if available, allowing the server to send the file using platform
+    specific optimisations such as `sendfile()`.
+
+    The file is closed when the response is closed.
+    """
+
+    block_size: int = 8192
+    """The size of the chunks which the file is read in."""
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        status: Optional[int] = None,
+        content_type: Union[str, MediaType, None] = 'application/octet-stream',
+        length: Optional[int] = None,
+    ):
+        self.file = file
+        self.length = length
+        super(FileResponse, self).__init__(self.read_chunks(), status, content_type)
+
+        if length is None:
+            try:
+                size = os.fstat(file.fileno()).st_size
+            except (AttributeError, OSError):
+                pass
+            else:
+                self.content_length = size - file.tell()
+        else:
+            self.content_length = length
+
+    def read_chunks(self) -> Iterator[bytes]:
+        remaining = self.length
+
+        while remaining is None or remaining > 0:
+            if remaining is None:
+                chunk = self.file.read(self.block_size)
+            else:
+                chunk = self.file.read(min(self.block_size, remaining))
+                remaining -= len(chunk)
+
+            if not chunk:
+                break
+
+            yield chunk
+
+        self.file.close()
+
+    def close(self) -> None:
+        super(FileResponse, self).close()
+        self.file.close()
+
+
 class ResponseNoContent(Response):
     """A response that uses the 204 status code to indicate no content."""
 
@@ -150,6 +411,18 @@ class ResponseNotModified(Response):
     status_code = 304
 
 
+class ResponsePreconditionFailed(Response):
+    """Acts just like a Response, but uses a 412 status code."""
+
+    status_code = 412
+
+
+class ResponseRangeNotSatisfiable(Response):
+    """Acts just like a Response, but uses a 416 status code."""
+
+    status_code = 416
+
+
 class ResponseNotAllowed(Response):
     """
     A response that uses the 405 status code and takes a list of
@@ -0,0 +1,154 @@
+import json
+from typing import IO, Any, Callable, Iterable, Iterator, Optional
+
+try:
+    import orjson  # type: ignore
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson  # type: ignore
+
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+__all__ = ['loads', 'dumps', 'iter_json_array', 'iter_ndjson']
+
+JSONDecoder = Callable[[bytes], Any]
+JSONEncoder = Callable[[Any], bytes]
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decodes a JSON document from bytes using `orjson` or `ujson` when they
+    are installed, otherwise the standard library `json` module. Each
+    raises a `ValueError` for an invalid document.
+    """
+
+    if HAS_ORJSON:
+        return orjson.loads(data)
+
+    if HAS_UJSON:
+        return ujson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encodes a value as compact UTF-8 encoded JSON using `orjson` or `ujson`
+    when they are installed, otherwise the standard library `json` module.
+
+    >>> dumps({'name': 'Kyle'})
+    b'{"name":"Kyle"}'
+    """
+
+    if HAS_ORJSON:
+        return orjson.dumps(value)
+
+    if HAS_UJSON:
+        return ujson.dumps(value, ensure_ascii=False).encode('utf-8')
+
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def iter_json_array(
+    items: Iterable[Any], encoder: JSONEncoder = dumps, buffer_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """
+    Encodes an iterable as a JSON array incrementally, yielding chunks of
+    roughly `buffer_size` bytes so that the whole array is never held in
+    memory.
+
+    >>> b''.join(iter_json_array(range(3)))
+    b'[0,1,2]'
+    """
+
+    buffer = bytearray(b'[')
+
+    for index, item in enumerate(items):
+        if index:
+            buffer += b','
+
+        buffer += encoder(item)
+
+        if len(buffer) >= buffer_size:
+            yield bytes(buffer)
+            buffer.clear()
+
+    buffer += b']'
+    yield bytes(buffer)
+
+
+def iter_lines(
+    stream: IO[bytes],
+    length: Optional[int] = None,
+    chunk_size: int = 64 * 1024,
+    max_line_size: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Yields the non-empty lines of a stream, without line endings, reading up
+    to `length` bytes in chunks of `chunk_size` bytes.
+    """
+
+    buffer = bytearray()
+    remaining = length
+
+    while remaining is None or remaining > 0:
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        chunk = stream.read(size)
+        if not chunk:
+            break
+
+        if remaining is not None:
+            remaining -= len(chunk)
+
+        start = len(buffer)
+        buffer += chunk
+        end = buffer.find(b'\n', start)
+        if end == -1:
+            if max_line_size is not None and len(buffer) > max_line_size:
+                raise IOError('Message body line is above max bytes limit')
+            continue
+
+        position = 0
+        while end != -1:
+            line = bytes(buffer[position:end]).rstrip(b'\r')
+            if max_line_size is not None and len(line) > max_line_size:
+                raise IOError('Message body line is above max bytes limit')
+
+            if line.strip():
+                yield line
+
+            position = end + 1
+            end = buffer.find(b'\n', position)
+
+        del buffer[:position]
+        if max_line_size is not None and len(buffer) > max_line_size:
+            raise IOError('Message body line is above max bytes limit')
+
+    if buffer.strip():
+        yield bytes(buffer).rstrip(b'\r')
+
+
+def iter_ndjson(
+    stream: IO[bytes],
+    length: Optional[int] = None,
+    decoder: JSONDecoder = loads,
+    max_record_size: Optional[int] = None,
+    chunk_size: int = 64 * 1024,
+) -> Iterator[Any]:
+    """
+    Decodes newline delimited JSON (NDJSON) from a stream, yielding each
+    record as it is read so that the whole body is never held in memory.
+
+    >>> from io import BytesIO
+    >>> list(iter_ndjson(BytesIO(b'{"id": 1}\\n{"id": 2}\\n')))
+    [{'id': 1}, {'id': 2}]
+    """
+
+    for line in iter_lines(stream, length, chunk_size, max_record_size):
+        yield decoder(line)
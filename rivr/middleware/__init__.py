@@ -1,7 +1,17 @@
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional
 
+from rivr.concurrency import is_async_callable, resolve
 from rivr.http import Http404, Request, Response, ResponseNotFound
 from rivr.middleware.base import Middleware
+from rivr.timing import current_timing, timed
+
+
+def metric_name(method: Callable[..., Any]) -> str:
+    owner = getattr(method, '__self__', None)
+    if owner is None:
+        return method.__name__
+
+    return '%s.%s' % (type(owner).__name__, method.__name__)
 
 
 class MiddlewareController(Middleware):
@@ -29,19 +39,55 @@ class MiddlewareController(Middleware):
             self.append(mw_instance)
 
     def append(self, middleware: Middleware) -> None:
-        if hasattr(middleware, 'process_request'):
-            self.request_middleware.append(middleware.process_request)
+        process_request = self.hook(middleware, 'process_request')
+        if process_request:
+            self.request_middleware.append(process_request)
 
-        if hasattr(middleware, 'process_response'):
-            self.response_middleware.insert(0, middleware.process_response)
+        process_response = self.hook(middleware, 'process_response')
+        if process_response:
+            self.response_middleware.insert(0, process_response)
 
         process_exception = getattr(middleware, 'process_exception', None)
         if process_exception:
             self.exception_middleware.insert(0, process_exception)
 
+    def hook(self, middleware: Middleware, name: str) -> Any:
+        # Asynchronous middleware may implement the `async_` variant of a
+        # process method instead of the synchronous method.
+        method = getattr(middleware, name, None)
+        if (
+            method is not None
+            and isinstance(middleware, Middleware)
+            and middleware.is_async()
+            and not is_async_callable(method)
+        ):
+            return getattr(middleware, 'async_' + name, method)
+
+        return method
+
+    def dispatch(
+        self, view: Callable[..., Response], request: Request, *args, **kwargs
+    ) -> Response:
+        return super(MiddlewareController, self).dispatch(
+            timed('view', view), request, *args, **kwargs
+        )
+
+    async def async_dispatch(
+        self, view: Callable[..., Any], request: Request, *args, **kwargs
+    ) -> Response:
+        return await super(MiddlewareController, self).async_dispatch(
+            timed('view', view), request, *args, **kwargs
+        )
+
     def process_request(self, request: Request) -> Optional[Response]:
         for request_mw in self.request_middleware:
-            response = request_mw(request)
+            timing = current_timing.get()
+            if timing is None:
+                response = request_mw(request)
+            else:
+                with timing.measure(metric_name(request_mw)):
+                    response = request_mw(request)
+
             if response:
                 return response
 
@@ -49,7 +95,12 @@ class MiddlewareController(Middleware):
 
     def process_response(self, request: Request, response: Response) -> Response:
         for response_mw in self.response_middleware:
-            response = response_mw(request, response)
+            timing = current_timing.get()
+            if timing is None:
+                response = response_mw(request, response)
+            else:
+                with timing.measure(metric_name(response_mw)):
+                    response = response_mw(request, response)
 
         return response
 
@@ -63,6 +114,51 @@ class MiddlewareController(Middleware):
         else:
             raise
 
+    def is_async(self) -> bool:
+        return any(
+            is_async_callable(middleware)
+            for middleware in self.request_middleware
+            + self.response_middleware
+            + self.exception_middleware
+        )
+
+    async def async_process_request(self, request: Request) -> Optional[Response]:
+        for request_mw in self.request_middleware:
+            timing = current_timing.get()
+            if timing is None:
+                response = await resolve(request_mw(request))
+            else:
+                with timing.measure(metric_name(request_mw)):
+                    response = await resolve(request_mw(request))
+
+            if response:
+                return response
+
+        return None
+
+    async def async_process_response(
+        self, request: Request, response: Response
+    ) -> Response:
+        for response_mw in self.response_middleware:
+            timing = current_timing.get()
+            if timing is None:
+                response = await resolve(response_mw(request, response))
+            else:
+                with timing.measure(metric_name(response_mw)):
+                    response = await resolve(response_mw(request, response))
+
+        return response
+
+    async def async_process_exception(
+        self, request: Request, exception: Exception
+    ) -> Optional[Response]:
+        for exception_mw in self.exception_middleware:
+            response = await resolve(exception_mw(request, exception))
+            if response:
+                return response
+
+        return None
+
 
 class ErrorWrapper(object):
     def __init__(
@@ -1,5 +1,7 @@
-from typing import Callable, Optional
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Union
 
+from rivr.concurrency import call_view, is_async_callable, resolve
 from rivr.http import Request, Response
 
 __all__ = ['Middleware']
@@ -8,8 +10,8 @@ __all__ = ['Middleware']
 class Middleware(object):
     @classmethod
     def wrap(
-        cls, view: Callable[..., Response], *initargs, **initkwargs
-    ) -> Callable[..., Response]:
+        cls, view: Callable[..., Any], *initargs, **initkwargs
+    ) -> Callable[..., Union[Response, Awaitable[Response]]]:
         """
         The wrap method allows you to wrap a view calling the middleware's
         process_request and process_response before and after the view.
@@ -22,8 +24,18 @@ class Middleware(object):
             view = Middleware.wrap(view)
             response = view(request)
 
+        When either the view or the middleware is asynchronous, the wrapped
+        view is an asynchronous function.
         """
 
+        if is_async_callable(view) or cls(*initargs, **initkwargs).is_async():
+
+            async def async_func(*args, **kwargs) -> Response:
+                middleware = cls(*initargs, **initkwargs)
+                return await middleware.async_dispatch(view, *args, **kwargs)
+
+            return async_func
+
         def func(*args, **kwargs) -> Response:
             return cls(*initargs, **initkwargs).dispatch(view, *args, **kwargs)
 
@@ -33,9 +45,23 @@ class Middleware(object):
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def is_async(self) -> bool:
+        """
+        Returns True if any of the middleware's process methods are
+        asynchronous.
+        """
+
+        return any(
+            is_async_callable(getattr(self, name, None))
+            for name in ('process_request', 'process_response', 'process_exception')
+        )
+
     def dispatch(
         self, view: Callable[..., Response], request: Request, *args, **kwargs
     ) -> Response:
+        if self.is_async():
+            return self.async_dispatch(view, request, *args, **kwargs)  # type: ignore
+
         response = self.process_request(request)
 
         if response is None:
@@ -52,8 +78,60 @@ class Middleware(object):
                 else:
                     raise
 
+        if inspect.isawaitable(response):
+            # The view is asynchronous, process the response once available
+            return self.process_awaitable(request, response)  # type: ignore
+
         return self.process_response(request, response)
 
+    async def async_dispatch(
+        self, view: Callable[..., Any], request: Request, *args, **kwargs
+    ) -> Response:
+        """
+        Asynchronous variant of dispatch, supporting both synchronous and
+        asynchronous views and process methods. Synchronous views are run in
+        an executor.
+        """
+
+        response = await self.async_process_request(request)
+        if response is None:
+            return await self.process_awaitable(
+                request, call_view(view, request, *args, **kwargs)
+            )
+
+        return await self.async_process_response(request, response)
+
+    async def process_awaitable(
+        self, request: Request, awaitable: Awaitable[Response]
+    ) -> Response:
+        try:
+            response = await awaitable
+        except Exception as e:
+            exception_response = await self.async_process_exception(request, e)
+            if not exception_response:
+                raise
+
+            response = exception_response
+
+        return await self.async_process_response(request, response)
+
+    async def async_process_request(self, request: Request) -> Optional[Response]:
+        return await resolve(self.process_request(request))
+
+    async def async_process_response(
+        self, request: Request, response: Response
+    ) -> Response:
+        return await resolve(self.process_response(request, response))
+
+    async def async_process_exception(
+        self, request: Request, exception: Exception
+    ) -> Optional[Response]:
+        process_exception = getattr(self, 'process_exception', None)
+        if process_exception is None:
+            return None
+
+        return await resolve(process_exception(request, exception))
+
     def process_request(self, request: Request) -> Optional[Response]:
         """
         This method is called before the view on each request. This method
@@ -0,0 +1,245 @@
+import zlib
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
+
+try:
+    import brotli  # type: ignore
+
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+from rivr.http import MediaType, Request, Response, StreamingResponse
+from rivr.middleware.base import Middleware
+
+__all__ = ['CompressionMiddleware']
+
+
+class ZlibCompressor(object):
+    def __init__(self, wbits: int, level: int):
+        self.compressobj = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressobj.compress(data)
+
+    def sync_flush(self) -> bytes:
+        return self.compressobj.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self) -> bytes:
+        return self.compressobj.flush()
+
+
+class BrotliCompressor(object):
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def sync_flush(self) -> bytes:
+        return self.compressor.flush()
+
+    def flush(self) -> bytes:
+        return self.compressor.finish()
+
+
+Compressor = Union[ZlibCompressor, BrotliCompressor]
+
+
+class CompressedStream(object):
+    """
+    An iterable which compresses the content of a streaming response chunk
+    by chunk, closing the response when closed. Each chunk is flushed from
+    the compressor, so that streams such as server-sent events are not held
+    back until the response has finished.
+    """
+
+    def __init__(self, response: StreamingResponse, compressor: Compressor) -> None:
+        self.response = response
+        self.compressor = compressor
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.response:
+            if chunk:
+                yield self.compressor.compress(chunk) + self.compressor.sync_flush()
+
+        yield self.compressor.flush()
+
+    def close(self) -> None:
+        self.response.close()
+
+
+class AsyncCompressedStream(object):
+    """
+    An asynchronous iterable which compresses the asynchronous content of a
+    streaming response chunk by chunk, closing the content when closed. Each
+    chunk is flushed from the compressor.
+    """
+
+    def __init__(self, response: StreamingResponse, compressor: Compressor) -> None:
+        self.response = response
+        self.compressor = compressor
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.response.streaming_content:  # type: ignore
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+
+            if chunk:
+                yield self.compressor.compress(chunk) + self.compressor.sync_flush()
+
+        yield self.compressor.flush()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.response.streaming_content, 'aclose', None)
+        if aclose:
+            await aclose()
+
+
+class CompressionMiddleware(Middleware):
+    """
+    Compresses response bodies using the content coding preferred by the
+    client's `Accept-Encoding` header, either brotli (when the `brotli`
+    package is installed), gzip or deflate.
+
+    Streaming responses are compressed incrementally as they are served.
+    Responses which are smaller than `min_size`, already have a content
+    coding, or whose media type is not in `compress_types` are not
+    compressed.
+    """
+
+    min_size = 200
+    """The minimum size of a response body, in bytes, which is compressed."""
+
+    level = 6
+    """The compression level used for gzip and deflate."""
+
+    brotli_level = 4
+    """The compression quality used for brotli."""
+
+    compress_types = (
+        'text/*',
+        'application/javascript',
+        'application/json',
+        'application/xml',
+        'image/svg+xml',
+    )
+    """
+    The media types which are compressed, `*` may be used to match any
+    subtype. Media types with a `+json` or `+xml` structured syntax suffix
+    are also compressed.
+    """
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        if not self.is_compressible(response):
+            return response
+
+        self.patch_vary(response)
+
+        encoding = self.negotiate_encoding(request)
+        if encoding is None:
+            return response
+
+        if isinstance(response, StreamingResponse):
+            stream: Union[CompressedStream, AsyncCompressedStream]
+            if hasattr(response.streaming_content, '__aiter__'):
+                stream = AsyncCompressedStream(response, self.compressor(encoding))
+            else:
+                stream = CompressedStream(response, self.compressor(encoding))
+
+            compressed = StreamingResponse(
+                stream,  # type: ignore
+                status=response.status_code,
+                content_type=None,
+            )
+            compressed.headers = response.headers
+            compressed._cookies = response._cookies
+            del compressed.headers['Content-Length']
+            response = compressed
+        else:
+            compressor = self.compressor(encoding)
+            response.content = (
+                compressor.compress(response.content) + compressor.flush()
+            )
+
+        response.headers['Content-Encoding'] = encoding
+
+        etag = response.headers['ETag']
+        if etag and not etag.startswith('W/'):
+            # The compressed representation is no longer byte for byte
+            # identical to the representation of a strong entity tag.
+            response.headers['ETag'] = 'W/' + etag
+
+        return response
+
+    def is_compressible(self, response: Response) -> bool:
+        if response.status_code < 200 or response.status_code in (204, 206, 304):
+            return False
+
+        if response.headers['Content-Encoding']:
+            return False
+
+        if 'no-transform' in (response.headers['Cache-Control'] or '').lower():
+            return False
+
+        content_type = response.content_type
+        if content_type is None or not self.is_compressible_media_type(content_type):
+            return False
+
+        if isinstance(response, StreamingResponse):
+            content_length = response.content_length
+            return content_length is None or content_length >= self.min_size
+
+        return len(response.content) >= self.min_size
+
+    def is_compressible_media_type(self, media_type: MediaType) -> bool:
+        type = media_type.type.lower()
+        subtype = media_type.subtype.lower()
+
+        if subtype.endswith(('+json', '+xml')):
+            return True
+
+        return (
+            '%s/%s' % (type, subtype) in self.compress_types
+            or '%s/*' % type in self.compress_types
+        )
+
+    def negotiate_encoding(self, request: Request) -> Optional[str]:
+        accept_encoding = request.accept_encoding
+        if not accept_encoding:
+            return None
+
+        candidates: List[Tuple[float, int, str]] = []
+        for preference, encoding in enumerate(self.encodings()):
+            if request.accepts_encoding(encoding):
+                quality = accept_encoding.get(encoding, accept_encoding.get('*', 0))
+                candidates.append((quality, -preference, encoding))
+
+        if not candidates:
+            return None
+
+        return max(candidates)[2]
+
+    def encodings(self) -> List[str]:
+        if HAS_BROTLI:
+            return ['br', 'gzip', 'deflate']
+
+        return ['gzip', 'deflate']
+
+    def compressor(self, encoding: str) -> Compressor:
+        if encoding == 'br':
+            return BrotliCompressor(self.brotli_level)
+
+        if encoding == 'gzip':
+            return ZlibCompressor(16 + zlib.MAX_WBITS, self.level)
+
+        return ZlibCompressor(zlib.MAX_WBITS, self.level)
+
+    def patch_vary(self, response: Response) -> None:
+        vary = response.headers['Vary']
+        if not vary:
+            response.headers['Vary'] = 'Accept-Encoding'
+            return
+
+        values = [value.strip().lower() for value in vary.split(',')]
+        if 'accept-encoding' not in values and '*' not in values:
+            response.headers['Vary'] = vary + ', Accept-Encoding'
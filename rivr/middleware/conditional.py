@@ -0,0 +1,93 @@
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from rivr.http import (
+    Request,
+    Response,
+    ResponseNotModified,
+    ResponsePreconditionFailed,
+    StreamingResponse,
+)
+from rivr.http.conditional import evaluate_preconditions
+from rivr.http.request import parse_http_date
+from rivr.middleware.base import Middleware
+
+__all__ = ['ConditionalMiddleware']
+
+NOT_MODIFIED_HEADERS = (
+    'Cache-Control',
+    'Content-Location',
+    'Date',
+    'ETag',
+    'Expires',
+    'Last-Modified',
+    'Vary',
+)
+
+
+class ConditionalMiddleware(Middleware):
+    """
+    Evaluates the `If-Match`, `If-None-Match`, `If-Modified-Since` and
+    `If-Unmodified-Since` headers of `GET` and `HEAD` requests against the
+    `ETag` and `Last-Modified` headers of successful responses, replacing the
+    response with a `304 Not Modified` or `412 Precondition Failed` response.
+
+    Responses to other methods are returned unchanged. As the view has
+    already been called, views performing unsafe methods must evaluate their
+    preconditions with `evaluate_preconditions()` before making any changes.
+    """
+
+    generate_etag = False
+    """
+    When generate_etag is True, a weak ETag is generated from the content of
+    responses which do not provide an ETag, which requires hashing the
+    content of each response. Streaming responses are excluded.
+    """
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        if request.method not in ('GET', 'HEAD'):
+            return response
+
+        if not 200 <= response.status_code < 300:
+            return response
+
+        etag = response.headers['ETag']
+        if etag is None and self.generate_etag:
+            etag = self.content_etag(response)
+            if etag is not None:
+                response.headers['ETag'] = etag
+
+        status = evaluate_preconditions(request, etag, self.last_modified(response))
+
+        if status is None:
+            return response
+
+        if isinstance(response, StreamingResponse):
+            response.close()
+
+        if status == 412:
+            return ResponsePreconditionFailed()
+
+        not_modified = ResponseNotModified(content_type=None)
+        for header in NOT_MODIFIED_HEADERS:
+            value = response.headers[header]
+            if value is not None:
+                not_modified.headers[header] = value
+
+        not_modified._cookies = response._cookies
+        return not_modified
+
+    def content_etag(self, response: Response) -> Optional[str]:
+        if isinstance(response, StreamingResponse):
+            return None
+
+        digest = hashlib.md5(response.content, usedforsecurity=False)
+        return 'W/"%s"' % digest.hexdigest()
+
+    def last_modified(self, response: Response) -> Optional[datetime]:
+        value = response.headers['Last-Modified']
+        if value is None:
+            return None
+
+        return parse_http_date(value)
@@ -0,0 +1,91 @@
+from typing import Callable, Optional
+
+from rivr.http import Request, Response
+from rivr.middleware.base import Middleware
+from rivr.timing import Timing, current_timing
+
+__all__ = ['TimingMiddleware']
+
+MetricsSink = Callable[[Request, Optional[Response], Timing], None]
+
+
+class TimingMiddleware(Middleware):
+    """
+    Records the time spent routing, in each middleware's `process_request`
+    and `process_response` and in the view, which is exposed as a
+    `Server-Timing` response header and passed to a metrics sink.
+
+    The timing middleware should be the first middleware of a
+    `MiddlewareController` so that it can time the other middleware. Views
+    may record their own metrics with `rivr.timing.measure()`.
+
+    Example::
+
+        def sink(request, response, timing):
+            for metric in timing:
+                statsd.timing(metric.name, metric.duration)
+
+        app = MiddlewareController.wrap(
+            router,
+            TimingMiddleware(sink=sink),
+            SessionMiddleware(),
+        )
+    """
+
+    server_timing = True
+    """
+    Adds a `Server-Timing` header to responses. The header exposes the
+    structure of the application to clients and may be disabled.
+    """
+
+    sink: Optional[MetricsSink] = None
+    """
+    A callable which is passed the request, the response (or None when the
+    view raised an exception) and the `Timing` of each request.
+    """
+
+    def process_request(self, request: Request) -> Optional[Response]:
+        timing = Timing()
+        request.timing = timing  # type: ignore
+        request.timing_token = current_timing.set(timing)  # type: ignore
+        return None
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        timing = self.finish(request)
+        if timing is None:
+            return response
+
+        if self.server_timing:
+            response.headers['Server-Timing'] = timing.server_timing()
+
+        if self.sink:
+            self.sink(request, response, timing)
+
+        return response
+
+    def process_exception(
+        self, request: Request, exception: Exception
+    ) -> Optional[Response]:
+        timing = self.finish(request)
+        if timing is not None and self.sink:
+            self.sink(request, None, timing)
+
+        return None
+
+    def finish(self, request: Request) -> Optional[Timing]:
+        timing: Optional[Timing] = getattr(request, 'timing', None)
+        token = getattr(request, 'timing_token', None)
+        if timing is None or token is None:
+            return None
+
+        request.timing_token = None  # type: ignore
+
+        try:
+            current_timing.reset(token)
+        except ValueError:
+            # The response is processed in a different context to the
+            # request, for example in another thread.
+            current_timing.set(None)
+
+        timing.finish()
+        return timing
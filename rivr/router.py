@@ -1,8 +1,21 @@
 import re
-from typing import Any, Callable, Dict, Iterable, Optional, Self, Tuple
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Self,
+    Tuple,
+)
 
 from rivr.http import Http404, Request, Response, ResponsePermanentRedirect
 from rivr.importlib import import_module
+from rivr.timing import measure
 
 
 class Resolver404(Http404):
@@ -125,7 +138,177 @@ class RegexURLResolver(RegexURL):
         return self._router
 
 
+REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+REGEX_QUANTIFIERS = frozenset('*+?{')
+
+
+def literal_prefix(regex: str) -> str:
+    r"""
+    Returns the literal text that every match of a `^` anchored regex must
+    start with. An empty string is returned when no prefix can be
+    determined, for example for unanchored patterns or alternations.
+
+    >>> literal_prefix(r'^test/(?P<slug>[-\w]+)/$')
+    'test/'
+    """
+
+    if not regex.startswith('^') or '|' in regex:
+        return ''
+
+    prefix: List[str] = []
+    index = 1
+
+    while index < len(regex):
+        character = regex[index]
+
+        if character == '\\':
+            escaped = regex[index + 1 : index + 2]
+            if not escaped or escaped.isalnum():
+                # Character classes such as `\d` and anchors such as `\b`
+                break
+
+            character = escaped
+            index += 2
+        elif character in REGEX_METACHARACTERS:
+            break
+        else:
+            index += 1
+
+        if regex[index : index + 1] in REGEX_QUANTIFIERS:
+            # The quantifier may make the preceding character optional.
+            break
+
+        prefix.append(character)
+
+    return ''.join(prefix)
+
+
+class URLPatternIndex(object):
+    """
+    A literal-prefix trie of URL patterns, used by compiled routers to only
+    attempt the patterns which could match a path. Patterns are returned in
+    their registration order, preserving first-match-wins resolution.
+    """
+
+    def __init__(self, urlpatterns: Iterable[RegexURL]):
+        self.root: Dict[str, Any] = {}
+        self.unprefixed: List[Tuple[int, RegexURL]] = []
+
+        for position, pattern in enumerate(urlpatterns):
+            prefix = literal_prefix(pattern.regex.pattern)
+
+            if not prefix:
+                self.unprefixed.append((position, pattern))
+                continue
+
+            node = self.root
+            for character in prefix:
+                node = node.setdefault(character, {})
+            node.setdefault('', []).append((position, pattern))
+
+    def candidates(self, path: str) -> List[RegexURL]:
+        matches = list(self.unprefixed)
+        is_sorted = True
+
+        node = self.root
+        for character in path:
+            child = node.get(character)
+            if child is None:
+                break
+
+            node = child
+            patterns = node.get('')
+            if patterns:
+                is_sorted = is_sorted and not matches
+                matches.extend(patterns)
+
+        if not is_sorted:
+            matches.sort(key=lambda match: match[0])
+
+        return [pattern for _, pattern in matches]
+
+
+ResolverMatch = Tuple[Callable, Iterable[Any], Dict[str, Any]]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ResolverCache(object):
+    """
+    A bounded least recently used cache of resolved paths. Both matches and
+    paths which did not match any pattern (stored as None) are cached.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.entries: 'OrderedDict[str, Optional[ResolverMatch]]' = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, path: str) -> Optional[ResolverMatch]:
+        """
+        Returns the cached result for a path, raising KeyError when the path
+        is not cached.
+        """
+
+        with self.lock:
+            try:
+                result = self.entries[path]
+            except KeyError:
+                self.misses += 1
+                raise
+
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return result
+
+    def set(self, path: str, result: Optional[ResolverMatch]) -> None:
+        with self.lock:
+            self.entries[path] = result
+            self.entries.move_to_end(path)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self.entries)
+        )
+
+
 class BaseRouter(object):
+    compiled = False
+    """
+    When compiled is True, the router indexes its patterns by their literal
+    prefix so that resolving a path only attempts the patterns which could
+    match it, instead of each pattern in turn. Resolution order is unchanged.
+    The index is rebuilt when patterns are added or removed through the
+    router.
+    """
+
+    cache_size = 0
+    """
+    When cache_size is greater than 0, the results of resolving paths,
+    including paths which did not match, are kept in a least recently used
+    cache of up to cache_size paths. The cache is cleared when patterns are
+    added or removed through the router. Results which depend on an included
+    router are not cached, as the included router may change independently.
+    The included router may cache its own results.
+    """
+
     def __init__(self, *urls):
         """
         Router takes URLs which you can register on creation.
@@ -158,16 +341,109 @@ class BaseRouter(object):
 
             self.urlpatterns.append(t)
 
+        self._index: Optional[URLPatternIndex] = None
+        self._cache: Optional[ResolverCache] = None
+
     def __iadd__(self, router) -> Self:
         self.urlpatterns.__iadd__(router.urlpatterns)
+        self.patterns_changed()
         return self
 
     def __isub__(self, router) -> Self:
         self.urlpatterns.__isub__(router.urlpatterns)
+        self.patterns_changed()
         return self
 
     def append(self, url):
         self.urlpatterns.append(url)
+        self.patterns_changed()
+
+    def patterns_changed(self) -> None:
+        """
+        Discards any state derived from the URL patterns. This is called
+        automatically when patterns are changed through the router, and should
+        be called after modifying `urlpatterns` directly.
+        """
+
+        self._index = None
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the hits, misses and evictions of the resolver cache along with
+        its maximum and current size.
+        """
+
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, self.cache_size, 0)
+
+        return self._cache.info()
+
+    def resolve(self, path: str) -> ResolverMatch:
+        if self.cache_size <= 0:
+            result = self.resolve_uncached(path)
+        else:
+            if self._cache is None or self._cache.maxsize != self.cache_size:
+                self._cache = ResolverCache(self.cache_size)
+
+            try:
+                result = self._cache.get(path)
+            except KeyError:
+                result, cacheable = self.resolve_patterns(path)
+                if cacheable:
+                    self._cache.set(path, result)
+
+        if result is None:
+            raise Resolver404('No URL pattern matched.')
+
+        callback, args, kwargs = result
+        # Callers update the keyword arguments, which must not leak into
+        # the cached result.
+        return callback, args, dict(kwargs)
+
+    def resolve_uncached(self, path: str) -> Optional[ResolverMatch]:
+        result, _ = self.resolve_patterns(path)
+        return result
+
+    def resolve_patterns(self, path: str) -> Tuple[Optional[ResolverMatch], bool]:
+        """
+        Resolves the path against the URL patterns, returning the result along
+        with whether the result may be cached. Results are not cacheable once
+        the prefix of an included router has matched the path.
+        """
+
+        cacheable = True
+
+        for pattern in self.patterns_for(path):
+            if isinstance(pattern, RegexURLResolver):
+                match = pattern.regex.search(path)
+                if match is None:
+                    continue
+
+                cacheable = False
+                result = pattern.match_found(path, match)
+            else:
+                result = pattern.resolve(path)
+
+            if result is not None:
+                return (result, cacheable)
+
+        return (None, cacheable)
+
+    def patterns_for(self, path: str) -> Iterable[RegexURL]:
+        """
+        Returns the URL patterns to attempt for the given path, in order.
+        """
+
+        if not self.compiled:
+            return self.urlpatterns
+
+        if self._index is None:
+            self._index = URLPatternIndex(self.urlpatterns)
+
+        return self._index.candidates(path)
 
     def register(self, *t):
         """
@@ -208,13 +484,6 @@ class Router(BaseRouter):
     any issues to the same URL with a slash appended.
     """
 
-    def resolve(self, path: str) -> Tuple[Callable, Iterable[Any], Dict[str, Any]]:
-        for pattern in self.urlpatterns:
-            result = pattern.resolve(path)
-            if result is not None:
-                return result
-        raise Resolver404('No URL pattern matched.')
-
     def __call__(self, request: Request) -> Response:
         if self.append_slash and (not request.path.endswith('/')):
             if (not self.is_valid_path(request.path)) and self.is_valid_path(
@@ -222,11 +491,13 @@ class Router(BaseRouter):
             ):
                 return ResponsePermanentRedirect(request.path + '/')
 
-        result = RegexURLResolver(r'^/', self).resolve(request.path)
-        if result:
-            callback, args, kwargs = result
-            return callback(request, *args, **kwargs)
-        raise Resolver404('No URL pattern matched.')
+        if not request.path.startswith('/'):
+            raise Resolver404('No URL pattern matched.')
+
+        with measure('route'):
+            callback, args, kwargs = self.resolve(request.path[1:])
+
+        return callback(request, *args, **kwargs)
 
     def is_valid_path(self, path: str) -> bool:
         try:
@@ -239,13 +510,6 @@ class Router(BaseRouter):
 class Domain(BaseRouter):
     APPEND_SLASH = True
 
-    def resolve(self, path: str) -> Tuple[Callable, Iterable[Any], Dict[str, Any]]:
-        for pattern in self.urlpatterns:
-            result = pattern.resolve(path)
-            if result is not None:
-                return result
-        raise Resolver404('No URL pattern matched.')
-
     def __call__(self, request: Request) -> Response:
         host = ':'.join(request.host.split(':')[:-1])
         url = host + request.path
@@ -254,11 +518,10 @@ class Domain(BaseRouter):
             if (not self.is_valid_url(url)) and self.is_valid_url(url + '/'):
                 return ResponsePermanentRedirect(url + '/')
 
-        result = self.resolve(url)
-        if result:
-            callback, args, kwargs = result
-            return callback(request, *args, **kwargs)
-        raise Resolver404('No URL pattern matched.')
+        with measure('route'):
+            callback, args, kwargs = self.resolve(url)
+
+        return callback(request, *args, **kwargs)
 
     def is_valid_url(self, path: str) -> bool:
         try:
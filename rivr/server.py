@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, cast
 from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
 
 from rivr.http import Request, Response
@@ -21,7 +21,9 @@ def serve(
     """
 
     if debug:
-        handler = DebugMiddleware.wrap(handler)
+        # DebugMiddleware is synchronous, wrapping a synchronous handler
+        # returns a synchronous handler.
+        handler = cast(Callable[[Request], Response], DebugMiddleware.wrap(handler))
 
     httpd = WSGIServer((host, port), WSGIRequestHandler)
     httpd.set_app(WSGIHandler(handler))
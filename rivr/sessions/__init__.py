@@ -0,0 +1,674 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from random import random
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from rivr.concurrency import is_async_callable, run_sync
+from rivr.http import Request, Response
+from rivr.middleware import Middleware
+
+SessionResult = Tuple[Optional[Dict[str, str]], bool]
+
+
+class Session(Protocol):
+    def __contains__(self, key: str) -> bool: ...
+
+    def __getitem__(self, key: str) -> str: ...
+
+    def __setitem__(self, key: str, value: str) -> None: ...
+
+    def __delitem__(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def save(self) -> None: ...
+
+
+class SessionStore(Protocol):
+    def __call__(self, *args, **kwargs) -> Session: ...
+
+
+class AsyncSession(Protocol):
+    """
+    A session of an asynchronous session store, which is loaded with
+    `await session.load()` before its data is accessed.
+    """
+
+    modified: bool
+    stale: bool
+    session_key: Optional[str]
+
+    async def load(self) -> 'AsyncSession': ...
+
+    def __contains__(self, key: str) -> bool: ...
+
+    def __getitem__(self, key: str) -> str: ...
+
+    def __setitem__(self, key: str, value: str) -> None: ...
+
+    def __delitem__(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def generate_key(self) -> None: ...
+
+    async def save(self) -> None: ...
+
+
+class AsyncSessionStore(Protocol):
+    def __call__(self, session_key: Optional[str]) -> AsyncSession: ...
+
+
+class BaseSession(object):
+    """
+    The session is loaded from the store when its data is first accessed,
+    so requests which do not use the session do not load it. A session is
+    saved as a whole, and only when it has been modified or is stale.
+    """
+
+    def __init__(self, session_key: Optional[str] = None) -> None:
+        self.modified = False
+        self.stale = False
+        """True when the session should be saved to refresh its expiry."""
+        self.session_key = session_key
+        self._data: Optional[Dict[str, str]] = None if session_key else {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    @property
+    def data(self) -> Dict[str, str]:
+        if self._data is None:
+            self.get_session()
+
+            if self._data is None:
+                self._data = {}
+
+        return self._data
+
+    @data.setter
+    def data(self, data: Dict[str, str]) -> None:
+        self._data = data
+
+    def get_session(self):
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def __getitem__(self, key: str) -> str:
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        data = self.data
+        if key in data and data[key] == value:
+            return
+
+        self.modified = True
+        data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.data[key]
+        self.modified = True
+
+    def clear(self) -> None:
+        if self._data is None or self._data:
+            self.modified = True
+
+        self.data = {}
+
+    def generate_key(self) -> None:
+        self.modified = True
+        hsh = hashlib.sha1((str(time.time()) + str(random())).encode('utf-8'))
+        self.session_key = hsh.hexdigest()
+
+    def saved(self) -> None:
+        self.modified = False
+        self.stale = False
+
+
+class SessionStoreOptions(object):
+    """
+    The expiry and serialisation options shared by the synchronous and
+    asynchronous base session stores.
+    """
+
+    max_age = 14 * 24 * 60 * 60
+    """The number of seconds a session is kept after it was last saved."""
+
+    encoder: Callable[[Dict[str, str]], str] = staticmethod(json.dumps)
+    """The function used to serialise session data into a string."""
+
+    decoder: Callable[[Union[str, bytes]], Any] = staticmethod(json.loads)
+    """The function used to deserialise session data."""
+
+    touch_interval: Optional[float] = None
+    """
+    The number of seconds after a session was saved that a session which is
+    used, but not modified, is saved again to refresh its expiry. When None,
+    only modified sessions are saved.
+    """
+
+    def encode(self, data: Dict[str, str]) -> str:
+        return self.encoder(data)
+
+    def decode(self, value: Union[str, bytes]) -> Optional[Dict[str, str]]:
+        try:
+            data = self.decoder(value)
+        except ValueError:
+            return None
+
+        if not isinstance(data, dict):
+            return None
+
+        return data
+
+
+class BaseSessionStore(SessionStoreOptions, SessionStore):
+    """
+    A base class for session stores which persist the session data outside
+    of the process, such as in a database, so that sessions can be shared
+    between processes and servers.
+
+    Subclasses implement `load()`, `save()` and `delete()`. The session data
+    is serialised with `encoder` and `decoder`, JSON by default.
+    """
+
+    def __call__(self, *args, **kwargs) -> Session:
+        return StoredSession(self, *args, **kwargs)
+
+    def load(self, session_key: str) -> Optional[Dict[str, str]]:
+        """
+        Returns the data of the session, or None when the session does not
+        exist or has expired.
+        """
+
+        raise NotImplementedError
+
+    def load_session(self, session_key: str) -> SessionResult:
+        """
+        Returns the data of the session along with whether the session should
+        be saved to refresh its expiry. Stores which know when a session was
+        saved override this method to support `touch_interval`.
+        """
+
+        return (self.load(session_key), False)
+
+    def save(self, session_key: str, data: Dict[str, str]) -> None:
+        raise NotImplementedError
+
+    def delete(self, session_key: str) -> None:
+        raise NotImplementedError
+
+
+class StoredSession(BaseSession, Session):
+    def __init__(self, store: BaseSessionStore, *args, **kwargs) -> None:
+        self.store: BaseSessionStore = store
+        super(StoredSession, self).__init__(*args, **kwargs)
+
+    def get_session(self) -> None:
+        assert self.session_key
+        data, self.stale = self.store.load_session(self.session_key)
+        if data is not None:
+            self.data = data
+
+    def save(self) -> None:
+        """
+        Saves the session when it has been modified or is stale.
+        """
+
+        assert self.session_key
+        if self.modified or self.stale:
+            self.store.save(self.session_key, self.data)
+            self.saved()
+
+
+class AsyncBaseSessionStore(SessionStoreOptions, AsyncSessionStore):
+    """
+    A base class for asynchronous session stores, which load and save
+    sessions without blocking the event loop.
+
+    Subclasses implement `load_many()`, `save()` and `delete()`. Sessions
+    which are loaded concurrently, for example by the tasks of a request
+    which fans out, are loaded with a single call to `load_many()`.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.pending: Optional[Dict[str, 'asyncio.Future[SessionResult]']] = None
+        self.batches: Set['asyncio.Task[None]'] = set()
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __call__(self, *args, **kwargs) -> AsyncSession:
+        return AsyncStoredSession(self, *args, **kwargs)
+
+    async def load_session(self, session_key: str) -> SessionResult:
+        """
+        Returns the data of the session along with whether the session should
+        be saved to refresh its expiry.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        if self.pending is None:
+            # Gather the sessions requested by the tasks which are ready to
+            # run before loading them.
+            self.pending = {}
+            loop.call_soon(self.load_pending)
+
+        future = self.pending.get(session_key)
+        if future is None:
+            future = loop.create_future()
+            self.pending[session_key] = future
+
+        return await asyncio.shield(future)
+
+    def load_pending(self) -> None:
+        pending = self.pending or {}
+        self.pending = None
+
+        batch = asyncio.ensure_future(self.load_batch(pending))
+        self.batches.add(batch)
+        batch.add_done_callback(self.batches.discard)
+
+    async def load_batch(
+        self, pending: Dict[str, 'asyncio.Future[SessionResult]']
+    ) -> None:
+        try:
+            results = await self.load_many(list(pending))
+        except BaseException as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+
+            if not isinstance(e, Exception):
+                raise
+
+            return
+
+        if len(results) != len(pending):
+            error = ValueError(
+                '%s.load_many() returned %d results for %d sessions'
+                % (type(self).__name__, len(results), len(pending))
+            )
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+            return
+
+        for future, result in zip(pending.values(), results):
+            if not future.done():
+                future.set_result(result)
+
+    async def load_many(self, session_keys: Sequence[str]) -> List[SessionResult]:
+        """
+        Returns the data of each session along with whether the session
+        should be saved to refresh its expiry. The data is None when the
+        session does not exist or has expired.
+        """
+
+        raise NotImplementedError
+
+    async def save(self, session_key: str, data: Dict[str, str]) -> None:
+        raise NotImplementedError
+
+    async def delete(self, session_key: str) -> None:
+        raise NotImplementedError
+
+
+class AsyncStoredSession(BaseSession, AsyncSession):
+    """
+    A session of an asynchronous store, which must be loaded with
+    `await session.load()` before its data is accessed.
+    """
+
+    loading: Optional['asyncio.Future[SessionResult]'] = None
+
+    def __init__(self, store: AsyncBaseSessionStore, *args, **kwargs) -> None:
+        self.store: AsyncBaseSessionStore = store
+        super(AsyncStoredSession, self).__init__(*args, **kwargs)
+
+    def get_session(self) -> None:
+        raise RuntimeError(
+            'Asynchronous sessions must be loaded with `await session.load()`'
+        )
+
+    async def load(self) -> 'AsyncStoredSession':
+        """
+        Loads the session, when it has not already been loaded. Tasks which
+        load the session concurrently share a single load from the store.
+        """
+
+        if self._data is None:
+            if self.loading is None:
+                assert self.session_key
+                self.loading = asyncio.ensure_future(
+                    self.store.load_session(self.session_key)
+                )
+
+            data, stale = await asyncio.shield(self.loading)
+
+            if self._data is None:
+                self.stale = stale
+                self._data = data if data is not None else {}
+
+        return self
+
+    async def save(self) -> None:
+        """
+        Saves the session when it has been modified or is stale.
+        """
+
+        assert self.session_key
+        if self.modified or self.stale:
+            await self.store.save(self.session_key, self.data)
+            self.saved()
+
+
+class SessionStoreInfo(NamedTuple):
+    hits: int
+    misses: int
+    expirations: int
+    evictions: int
+    max_entries: Optional[int]
+    size: int
+
+
+class MemorySessionEntry(object):
+    __slots__ = ('data', 'saved_at', 'accessed_at')
+
+    def __init__(self, data: Dict[str, str], saved_at: float):
+        self.data = data
+        self.saved_at = saved_at
+        self.accessed_at = saved_at
+
+
+class MemorySessionStore(BaseSessionStore):
+    """
+    Stores sessions in the memory of the process.
+
+    Sessions expire `max_age` seconds after they were saved, or
+    `idle_timeout` seconds after they were last loaded or saved. Expired
+    sessions are removed when they are loaded, and each save removes
+    expired sessions from the least recently used end of the store, so
+    sessions which are never used again are removed without scanning the
+    store. The least recently used sessions are evicted once the store holds
+    more than `max_entries` sessions.
+
+    Example::
+
+        session_store = MemorySessionStore(idle_timeout=30 * 60, max_entries=10000)
+    """
+
+    idle_timeout: Optional[float] = None
+    """
+    The number of seconds a session is kept after it was last used, or None
+    to keep sessions until they reach `max_age`.
+    """
+
+    max_entries: Optional[int] = None
+    """The maximum number of sessions held, or None for no limit."""
+
+    sweep_size = 16
+    """The maximum number of sessions checked for expiry on each save."""
+
+    def __init__(self, **kwargs) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.sessions: 'OrderedDict[str, MemorySessionEntry]' = OrderedDict()
+        self.lock = Lock()
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __call__(self, *args, **kwargs) -> Session:
+        return MemorySession(self, *args, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def is_expired(self, entry: MemorySessionEntry, now: float) -> bool:
+        if now - entry.saved_at >= self.max_age:
+            return True
+
+        return (
+            self.idle_timeout is not None
+            and now - entry.accessed_at >= self.idle_timeout
+        )
+
+    def load(self, session_key: str) -> Optional[Dict[str, str]]:
+        data, _ = self.load_session(session_key)
+        return data
+
+    def load_session(self, session_key: str) -> SessionResult:
+        now = time.monotonic()
+
+        with self.lock:
+            entry = self.sessions.get(session_key)
+            if entry is None:
+                self.misses += 1
+                return (None, False)
+
+            if self.is_expired(entry, now):
+                del self.sessions[session_key]
+                self.expirations += 1
+                self.misses += 1
+                return (None, False)
+
+            self.sessions.move_to_end(session_key)
+            entry.accessed_at = now
+            self.hits += 1
+
+        stale = (
+            self.touch_interval is not None
+            and now - entry.saved_at >= self.touch_interval
+        )
+        return (dict(entry.data), stale)
+
+    def save(self, session_key: str, data: Dict[str, str]) -> None:
+        now = time.monotonic()
+
+        with self.lock:
+            self.sessions[session_key] = MemorySessionEntry(dict(data), now)
+            self.sessions.move_to_end(session_key)
+            self.sweep(now)
+
+            while (
+                self.max_entries is not None and len(self.sessions) > self.max_entries
+            ):
+                self.sessions.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, session_key: str) -> None:
+        with self.lock:
+            self.sessions.pop(session_key, None)
+
+    def sweep(self, now: float) -> None:
+        # Sessions are ordered by when they were last used, the first
+        # session which has not expired is likely to be followed by others.
+        for _ in range(self.sweep_size):
+            if not self.sessions:
+                return
+
+            session_key, entry = next(iter(self.sessions.items()))
+            if not self.is_expired(entry, now):
+                return
+
+            del self.sessions[session_key]
+            self.expirations += 1
+
+    def clear_expired(self) -> int:
+        """
+        Removes every expired session, returning the number of sessions
+        removed.
+        """
+
+        now = time.monotonic()
+
+        with self.lock:
+            expired = [
+                session_key
+                for (session_key, entry) in self.sessions.items()
+                if self.is_expired(entry, now)
+            ]
+
+            for session_key in expired:
+                del self.sessions[session_key]
+
+            self.expirations += len(expired)
+
+        return len(expired)
+
+    def info(self) -> SessionStoreInfo:
+        """
+        Returns the hits, misses, expirations and evictions of the store
+        along with its maximum and current number of sessions.
+        """
+
+        return SessionStoreInfo(
+            self.hits,
+            self.misses,
+            self.expirations,
+            self.evictions,
+            self.max_entries,
+            len(self.sessions),
+        )
+
+
+class MemorySession(StoredSession):
+    pass
+
+
+class SessionMiddleware(Middleware):
+    cookie_name = 'sessionid'
+    cookie_secure = False
+    cookie_path = '/'
+    cookie_domain = None
+
+    session_store: Optional[Union[SessionStore, AsyncSessionStore]] = None
+
+    def process_request(self, request: Request) -> Optional[Response]:
+        if self.session_store is None:
+            raise Exception(
+                "SessionMiddleware is improperly configured."
+                "Session store is not defined"
+            )
+
+        session_key = request.cookies.get(self.cookie_name)
+        if session_key:
+            session = self.session_store(session_key.value)
+        else:
+            session = self.session_store(None)
+
+        if is_async_callable(session.save) and not self.is_async():
+            raise Exception(
+                "SessionMiddleware is improperly configured."
+                "Use AsyncSessionMiddleware with an asynchronous session store"
+            )
+
+        setattr(request, 'session', session)
+
+        return None
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        session = getattr(request, 'session')
+        if session and (session.modified or session.stale):
+            # Save the session data and refresh the client cookie.
+            if not session.session_key:
+                session.generate_key()
+
+            session.save()
+            self.set_session_cookie(request, response, session)
+
+        return response
+
+    def set_session_cookie(
+        self, request: Request, response: Response, session: BaseSession
+    ) -> None:
+        session_key = session.session_key
+        if session_key is None:
+            return
+
+        # The cookie only needs to be sent when the session key changed
+        cookie = request.cookies.get(self.cookie_name)
+        if cookie is None or cookie.value != session_key:
+            response.set_cookie(
+                self.cookie_name,
+                session_key,
+                path=self.cookie_path,
+                domain=self.cookie_domain,
+                secure=self.cookie_secure,
+            )
+
+
+class AsyncSessionMiddleware(SessionMiddleware):
+    """
+    A session middleware for asynchronous applications, which loads and
+    saves sessions without blocking the event loop. Sessions of an
+    asynchronous session store are awaited, while sessions of a synchronous
+    session store are loaded and saved in the executor. As the view may
+    access a session of a synchronous store from the event loop, such
+    sessions are loaded before the view is called when the request has a
+    session cookie.
+
+    Sessions of an asynchronous session store must be loaded before use::
+
+        async def view(request):
+            session = await request.session.load()
+            session['visited'] = 'yes'
+            return Response()
+    """
+
+    def is_async(self) -> bool:
+        return True
+
+    async def async_process_request(self, request: Request) -> Optional[Response]:
+        self.process_request(request)
+
+        session = getattr(request, 'session')
+        if (
+            isinstance(session, BaseSession)
+            and not is_async_callable(getattr(session, 'save', None))
+            and not session.loaded
+        ):
+            await run_sync(lambda: session.data)
+
+        return None
+
+    async def async_process_response(
+        self, request: Request, response: Response
+    ) -> Response:
+        session = getattr(request, 'session')
+        if session and (session.modified or session.stale):
+            if not session.session_key:
+                session.generate_key()
+
+            if is_async_callable(session.save):
+                await session.save()
+            else:
+                await run_sync(session.save)
+
+            self.set_session_cookie(request, response, session)
+
+        return response
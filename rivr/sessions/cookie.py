@@ -0,0 +1,195 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from rivr.sessions import (
+    BaseSession,
+    Session,
+    SessionResult,
+    SessionStore,
+    SessionStoreOptions,
+)
+
+__all__ = ['CookieSessionStore']
+
+
+def encode_json(data: Dict[str, str]) -> str:
+    return json.dumps(data, separators=(',', ':'))
+
+
+def b64encode(value: bytes) -> bytes:
+    return base64.urlsafe_b64encode(value).rstrip(b'=')
+
+
+def b64decode(value: bytes) -> bytes:
+    return base64.urlsafe_b64decode(value + b'=' * (-len(value) % 4))
+
+
+class CookieSessionStore(SessionStoreOptions, SessionStore):
+    """
+    Stores sessions in the session cookie itself, so that loading a session
+    does not require a lookup in a database.
+
+    The session data is serialised as JSON, compressed with zlib when it is
+    larger than `compress_size` bytes and signed with HMAC-SHA256. The data
+    is readable by the client, but it cannot be modified without the secret
+    key. Sessions expire `max_age` seconds after they were last saved.
+
+    Keys may be rotated by passing a list of secret keys, sessions are
+    signed with the first key and may be verified with any of the keys.
+
+    Example::
+
+        session_store = CookieSessionStore(['new secret', 'old secret'])
+        app = SessionMiddleware.wrap(view, session_store=session_store)
+    """
+
+    max_size = 4000
+    """
+    The maximum size of the cookie value, browsers limit the size of a
+    cookie to 4096 bytes including its name and attributes.
+    """
+
+    compress_size = 256
+    """The minimum size of session data which is compressed."""
+
+    encoder: Callable[[Dict[str, str]], str] = staticmethod(encode_json)
+    """
+    The function used to serialise session data into a string, compact JSON
+    by default.
+    """
+
+    digest = staticmethod(hashlib.sha256)
+
+    def __init__(self, secret_keys: Union[str, Sequence[str]], **kwargs) -> None:
+        if isinstance(secret_keys, str):
+            secret_keys = [secret_keys]
+
+        if not secret_keys:
+            raise ValueError('CookieSessionStore requires a secret key')
+
+        self.keys: List[bytes] = [
+            hashlib.sha256(b'rivr.sessions.cookie' + key.encode('utf-8')).digest()
+            for key in secret_keys
+        ]
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __call__(self, *args, **kwargs) -> Session:
+        return CookieSession(self, *args, **kwargs)
+
+    def signature(self, key: bytes, value: bytes) -> bytes:
+        return b64encode(hmac.new(key, value, self.digest).digest())
+
+    def dumps(self, data: Dict[str, str]) -> str:
+        """
+        Returns the signed cookie value for the session data. A `ValueError`
+        is raised when the value is larger than `max_size`.
+        """
+
+        payload = self.encode(data).encode('utf-8')
+        prefix = b''
+
+        if len(payload) >= self.compress_size:
+            compressed = zlib.compress(payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                prefix = b'.'
+
+        value = b'%s%s.%s' % (prefix, b64encode(payload), b'%x' % int(time.time()))
+        value += b'.' + self.signature(self.keys[0], value)
+
+        if len(value) > self.max_size:
+            raise ValueError('Session data is above max cookie size')
+
+        return value.decode('ascii')
+
+    def loads(self, value: str) -> Optional[Dict[str, str]]:
+        """
+        Returns the session data from a cookie value, or None when the value
+        is invalid, was not signed by one of the keys or has expired.
+        """
+
+        data, _ = self.load_session(value)
+        return data
+
+    def load_session(self, value: str) -> SessionResult:
+        """
+        Returns the session data from a cookie value along with whether the
+        session should be saved to refresh its expiry.
+        """
+
+        if len(value) > self.max_size:
+            return (None, False)
+
+        try:
+            signed_value = value.encode('ascii')
+        except UnicodeEncodeError:
+            return (None, False)
+
+        signed, _, signature = signed_value.rpartition(b'.')
+        if not any(
+            hmac.compare_digest(signature, self.signature(key, signed))
+            for key in self.keys
+        ):
+            return (None, False)
+
+        compressed = signed.startswith(b'.')
+        payload, _, timestamp = signed.lstrip(b'.').rpartition(b'.')
+
+        now = time.time()
+
+        try:
+            saved_at = int(timestamp, 16)
+            if saved_at + self.max_age <= now:
+                return (None, False)
+
+            data = b64decode(payload)
+            if compressed:
+                data = zlib.decompress(data)
+
+            result = self.decode(data.decode('utf-8'))
+        except (ValueError, zlib.error):
+            return (None, False)
+
+        if result is None:
+            return (None, False)
+
+        stale = (
+            self.touch_interval is not None and now - saved_at >= self.touch_interval
+        )
+        return (result, stale)
+
+
+class CookieSession(BaseSession, Session):
+    """
+    A session whose key is the signed session data, the key changes each
+    time the session is saved.
+    """
+
+    def __init__(self, store: CookieSessionStore, *args, **kwargs) -> None:
+        self.store: CookieSessionStore = store
+        super(CookieSession, self).__init__(*args, **kwargs)
+
+    def get_session(self) -> None:
+        assert self.session_key
+        data, self.stale = self.store.load_session(self.session_key)
+        if data is not None:
+            self.data = data
+
+    def generate_key(self) -> None:
+        self.modified = True
+
+    def save(self) -> None:
+        """
+        Saves the session when it has been modified or is stale.
+        """
+
+        if self.modified or self.stale:
+            self.session_key = self.store.dumps(self.data)
+            self.saved()
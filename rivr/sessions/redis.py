@@ -0,0 +1,493 @@
+import asyncio
+import socket
+import threading
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from rivr.sessions import AsyncBaseSessionStore, BaseSessionStore, SessionResult
+
+__all__ = [
+    'RedisError',
+    'RedisConnection',
+    'RedisConnectionPool',
+    'RedisSessionStore',
+    'AsyncRedisConnection',
+    'AsyncRedisConnectionPool',
+    'AsyncRedisSessionStore',
+]
+
+Argument = Union[str, bytes, int]
+
+
+class RedisError(Exception):
+    """
+    An error reply from the Redis server.
+    """
+
+
+def encode_command(command: Sequence[Argument]) -> bytes:
+    parts = [b'*%d\r\n' % len(command)]
+
+    for argument in command:
+        if isinstance(argument, str):
+            argument = argument.encode('utf-8')
+        elif isinstance(argument, int):
+            argument = b'%d' % argument
+
+        parts.append(b'$%d\r\n%s\r\n' % (len(argument), argument))
+
+    return b''.join(parts)
+
+
+def parse_line(line: bytes) -> Tuple[bytes, Any]:
+    """
+    Parses a reply line, returning the type of the reply along with the
+    reply, or the length of a bulk string or array which follows the line.
+    """
+
+    if not line.endswith(b'\r\n'):
+        raise ConnectionError('Connection closed by the Redis server')
+
+    kind = line[:1]
+    value = line[1:-2]
+
+    if kind == b'+':
+        return (kind, value.decode('utf-8'))
+
+    if kind == b'-':
+        return (kind, RedisError(value.decode('utf-8')))
+
+    if kind in (b':', b'$', b'*'):
+        return (kind, int(value))
+
+    raise ConnectionError('Invalid reply from the Redis server')
+
+
+class RedisConnection(object):
+    """
+    A connection to a server speaking the Redis serialisation protocol
+    (RESP2). Commands are pipelined, every command given to `execute()` is
+    sent at once before the replies are read.
+    """
+
+    def __init__(self, host: str, port: int, timeout: Optional[float] = None):
+        self.socket = socket.create_connection((host, port), timeout=timeout)
+        self.file: IO[bytes] = self.socket.makefile('rb')
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+    def execute(self, *commands: Sequence[Argument]) -> List[Any]:
+        """
+        Sends the commands and returns their replies. A `RedisError` is
+        raised for the first error reply, once every reply has been read.
+
+        >>> connection.execute(('SET', 'key', 'value'), ('GET', 'key'))
+        ['OK', b'value']
+        """
+
+        self.socket.sendall(b''.join(encode_command(command) for command in commands))
+        replies = [self.read_reply() for _ in commands]
+
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+
+        return replies
+
+    def read_reply(self) -> Any:
+        kind, value = parse_line(self.file.readline())
+
+        if kind == b'$' and value >= 0:
+            data = self.file.read(value + 2)
+            if len(data) != value + 2:
+                raise ConnectionError('Connection closed by the Redis server')
+
+            return data[:-2]
+
+        if kind == b'*' and value >= 0:
+            return [self.read_reply() for _ in range(value)]
+
+        if kind in (b'$', b'*'):
+            return None
+
+        return value
+
+
+class RedisConnectionPool(object):
+    """
+    A thread safe pool of connections to a Redis server. At most
+    `max_connections` connections are open at once, a command waits up to
+    `timeout` seconds for a connection to become available before a
+    `ConnectionError` is raised. Connections are kept open for reuse.
+    """
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: Optional[float] = 5.0,
+        max_connections: int = 10,
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self.max_connections = max_connections
+
+        self.idle: List[RedisConnection] = []
+        self.lock = threading.Lock()
+        self.semaphore = threading.BoundedSemaphore(max_connections)
+
+    def connect(self) -> RedisConnection:
+        connection = RedisConnection(self.host, self.port, self.timeout)
+
+        commands: List[Sequence[Argument]] = []
+        if self.password is not None:
+            commands.append(('AUTH', self.password))
+        if self.db:
+            commands.append(('SELECT', self.db))
+
+        if commands:
+            try:
+                connection.execute(*commands)
+            except BaseException:
+                connection.close()
+                raise
+
+        return connection
+
+    def close(self) -> None:
+        """
+        Closes every idle connection.
+        """
+
+        with self.lock:
+            idle = self.idle
+            self.idle = []
+
+        for connection in idle:
+            connection.close()
+
+    def execute(self, *commands: Sequence[Argument]) -> List[Any]:
+        """
+        Executes the commands on a pooled connection. The commands are
+        retried once on a new connection when a pooled connection has been
+        closed by the server.
+        """
+
+        if not self.semaphore.acquire(timeout=self.timeout):
+            raise ConnectionError('Timed out waiting for a Redis connection')
+
+        try:
+            with self.lock:
+                connection = self.idle.pop() if self.idle else None
+
+            if connection is not None:
+                try:
+                    return self.execute_on(connection, commands)
+                except ConnectionError:
+                    pass
+
+            return self.execute_on(self.connect(), commands)
+        finally:
+            self.semaphore.release()
+
+    def execute_on(
+        self, connection: RedisConnection, commands: Sequence[Sequence[Argument]]
+    ) -> List[Any]:
+        try:
+            replies = connection.execute(*commands)
+        except RedisError:
+            with self.lock:
+                self.idle.append(connection)
+            raise
+        except BaseException:
+            # The connection may be left with unread replies
+            connection.close()
+            raise
+
+        with self.lock:
+            self.idle.append(connection)
+
+        return replies
+
+
+class RedisSessionStore(BaseSessionStore):
+    """
+    Stores sessions in Redis, or a server compatible with the Redis
+    protocol, so that sessions can be shared by every server of an
+    application.
+
+    Connections are pooled between requests, with at most `max_connections`
+    connections open at once. Loading a session fetches the
+    session and refreshes its expiry in a single round trip, so sessions
+    expire `max_age` seconds after they were last used.
+
+    Example::
+
+        session_store = RedisSessionStore(host='redis.internal')
+        app = SessionMiddleware.wrap(view, session_store=session_store)
+    """
+
+    prefix = 'session:'
+    """The prefix of the Redis keys sessions are stored under."""
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: Optional[float] = 5.0,
+        max_connections: int = 10,
+        **kwargs
+    ) -> None:
+        self.pool = RedisConnectionPool(
+            host, port, db, password, timeout, max_connections
+        )
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def key(self, session_key: str) -> str:
+        return self.prefix + session_key
+
+    def load(self, session_key: str) -> Optional[Dict[str, str]]:
+        key = self.key(session_key)
+        value, _ = self.pool.execute(('GET', key), ('EXPIRE', key, self.max_age))
+
+        if value is None:
+            return None
+
+        return self.decode(value)
+
+    def save(self, session_key: str, data: Dict[str, str]) -> None:
+        self.pool.execute(
+            ('SET', self.key(session_key), self.encode(data), 'EX', self.max_age)
+        )
+
+    def delete(self, session_key: str) -> None:
+        self.pool.execute(('DEL', self.key(session_key)))
+
+
+class AsyncRedisConnection(object):
+    """
+    An asynchronous variant of `RedisConnection` using asyncio streams.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(
+        cls, host: str, port: int, timeout: Optional[float] = None
+    ) -> 'AsyncRedisConnection':
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout
+        )
+        return cls(reader, writer)
+
+    async def close(self) -> None:
+        self.writer.close()
+
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+
+    async def execute(self, *commands: Sequence[Argument]) -> List[Any]:
+        """
+        Sends the commands and returns their replies. A `RedisError` is
+        raised for the first error reply, once every reply has been read.
+        """
+
+        self.writer.write(b''.join(encode_command(command) for command in commands))
+        await self.writer.drain()
+        replies = [await self.read_reply() for _ in commands]
+
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+
+        return replies
+
+    async def read_reply(self) -> Any:
+        kind, value = parse_line(await self.reader.readline())
+
+        if kind == b'$' and value >= 0:
+            try:
+                data = await self.reader.readexactly(value + 2)
+            except asyncio.IncompleteReadError:
+                raise ConnectionError('Connection closed by the Redis server')
+
+            return data[:-2]
+
+        if kind == b'*' and value >= 0:
+            return [await self.read_reply() for _ in range(value)]
+
+        if kind in (b'$', b'*'):
+            return None
+
+        return value
+
+
+class AsyncRedisConnectionPool(object):
+    """
+    A pool of asynchronous connections to a Redis server, for use from a
+    single event loop. At most `max_connections` connections are open at
+    once, a command waits up to `timeout` seconds for a connection to
+    become available before a `ConnectionError` is raised.
+    """
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: Optional[float] = 5.0,
+        max_connections: int = 10,
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self.max_connections = max_connections
+
+        self.idle: List[AsyncRedisConnection] = []
+        self.semaphore = asyncio.BoundedSemaphore(max_connections)
+
+    async def connect(self) -> AsyncRedisConnection:
+        connection = await AsyncRedisConnection.open(self.host, self.port, self.timeout)
+
+        commands: List[Sequence[Argument]] = []
+        if self.password is not None:
+            commands.append(('AUTH', self.password))
+        if self.db:
+            commands.append(('SELECT', self.db))
+
+        if commands:
+            try:
+                await connection.execute(*commands)
+            except BaseException:
+                await connection.close()
+                raise
+
+        return connection
+
+    async def close(self) -> None:
+        """
+        Closes every idle connection.
+        """
+
+        idle = self.idle
+        self.idle = []
+
+        for connection in idle:
+            await connection.close()
+
+    async def execute(self, *commands: Sequence[Argument]) -> List[Any]:
+        """
+        Executes the commands on a pooled connection. The commands are
+        retried once on a new connection when a pooled connection has been
+        closed by the server.
+        """
+
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError('Timed out waiting for a Redis connection')
+
+        try:
+            if self.idle:
+                try:
+                    return await self.execute_on(self.idle.pop(), commands)
+                except ConnectionError:
+                    pass
+
+            return await self.execute_on(await self.connect(), commands)
+        finally:
+            self.semaphore.release()
+
+    async def execute_on(
+        self, connection: AsyncRedisConnection, commands: Sequence[Sequence[Argument]]
+    ) -> List[Any]:
+        try:
+            replies = await connection.execute(*commands)
+        except RedisError:
+            self.idle.append(connection)
+            raise
+        except BaseException:
+            await connection.close()
+            raise
+
+        self.idle.append(connection)
+        return replies
+
+
+class AsyncRedisSessionStore(AsyncBaseSessionStore):
+    """
+    An asynchronous variant of `RedisSessionStore` for use with
+    `AsyncSessionMiddleware`. Sessions loaded concurrently are fetched in a
+    single pipeline.
+
+    Example::
+
+        session_store = AsyncRedisSessionStore(host='redis.internal')
+        app = AsyncSessionMiddleware.wrap(view, session_store=session_store)
+    """
+
+    prefix = 'session:'
+    """The prefix of the Redis keys sessions are stored under."""
+
+    def __init__(
+        self,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: Optional[float] = 5.0,
+        max_connections: int = 10,
+        **kwargs
+    ) -> None:
+        self.pool = AsyncRedisConnectionPool(
+            host, port, db, password, timeout, max_connections
+        )
+        super(AsyncRedisSessionStore, self).__init__(**kwargs)
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+    def key(self, session_key: str) -> str:
+        return self.prefix + session_key
+
+    async def load_many(self, session_keys: Sequence[str]) -> List[SessionResult]:
+        commands: List[Sequence[Argument]] = []
+        for session_key in session_keys:
+            key = self.key(session_key)
+            commands.append(('GET', key))
+            commands.append(('EXPIRE', key, self.max_age))
+
+        replies = await self.pool.execute(*commands)
+
+        return [
+            (None if value is None else self.decode(value), False)
+            for value in replies[::2]
+        ]
+
+    async def save(self, session_key: str, data: Dict[str, str]) -> None:
+        await self.pool.execute(
+            ('SET', self.key(session_key), self.encode(data), 'EX', self.max_age)
+        )
+
+    async def delete(self, session_key: str) -> None:
+        await self.pool.execute(('DEL', self.key(session_key)))
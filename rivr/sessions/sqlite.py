@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from rivr.sessions import BaseSessionStore, SessionResult
+
+__all__ = ['SQLiteSessionStore']
+
+
+class SQLiteSessionStore(BaseSessionStore):
+    """
+    Stores sessions in a SQLite database file, which can be shared by the
+    worker processes of a server on the same host.
+
+    The database is opened in write-ahead logging mode so that requests
+    reading sessions are not blocked by a request saving a session. Each
+    connection is used by one thread at a time, up to `max_idle_connections`
+    connections are kept open for reuse. The expiry time of sessions is
+    indexed so that expired sessions can be removed with `clear_expired()`.
+
+    Example::
+
+        session_store = SQLiteSessionStore('/var/lib/app/sessions.sqlite')
+        app = SessionMiddleware.wrap(view, session_store=session_store)
+    """
+
+    table = 'sessions'
+    """The name of the table sessions are stored in."""
+
+    timeout = 5.0
+    """The number of seconds to wait for a lock held by another connection."""
+
+    max_idle_connections = 10
+    """The maximum number of idle connections kept open for reuse."""
+
+    def __init__(self, path: str, **kwargs) -> None:
+        self.path = path
+        self.idle: List[sqlite3.Connection] = []
+        self.lock = threading.Lock()
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yields a connection to the database, which is returned to the idle
+        connections once the caller has finished with it.
+        """
+
+        with self.lock:
+            connection = self.idle.pop() if self.idle else None
+
+        if connection is None:
+            connection = self.connect()
+
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+
+        with self.lock:
+            if len(self.idle) < self.max_idle_connections:
+                self.idle.append(connection)
+                return
+
+        connection.close()
+
+    def connect(self) -> sqlite3.Connection:
+        # Transactions are not used, each statement is committed on its own
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS "%s" '
+            '(key TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)'
+            % self.table
+        )
+        connection.execute(
+            'CREATE INDEX IF NOT EXISTS "%s_expires" ON "%s" (expires)'
+            % (self.table, self.table)
+        )
+        return connection
+
+    def close(self) -> None:
+        """
+        Closes every idle connection.
+        """
+
+        with self.lock:
+            idle = self.idle
+            self.idle = []
+
+        for connection in idle:
+            connection.close()
+
+    def load(self, session_key: str) -> Optional[Dict[str, str]]:
+        data, _ = self.load_session(session_key)
+        return data
+
+    def load_session(self, session_key: str) -> SessionResult:
+        now = time.time()
+        with self.connection() as connection:
+            row = connection.execute(
+                'SELECT data, expires FROM "%s" WHERE key = ? AND expires > ?'
+                % self.table,
+                (session_key, now),
+            ).fetchone()
+
+        if row is None:
+            return (None, False)
+
+        data, expires = row
+        stale = (
+            self.touch_interval is not None
+            and now - (expires - self.max_age) >= self.touch_interval
+        )
+        return (self.decode(data), stale)
+
+    def save(self, session_key: str, data: Dict[str, str]) -> None:
+        with self.connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO "%s" (key, data, expires) VALUES (?, ?, ?)'
+                % self.table,
+                (session_key, self.encode(data), time.time() + self.max_age),
+            )
+
+    def delete(self, session_key: str) -> None:
+        with self.connection() as connection:
+            connection.execute(
+                'DELETE FROM "%s" WHERE key = ?' % self.table, (session_key,)
+            )
+
+    def clear_expired(self) -> int:
+        """
+        Removes expired sessions from the database, returning the number of
+        sessions removed.
+        """
+
+        with self.connection() as connection:
+            cursor = connection.execute(
+                'DELETE FROM "%s" WHERE expires <= ?' % self.table, (time.time(),)
+            )
+            return cursor.rowcount
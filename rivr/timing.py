@@ -0,0 +1,187 @@
+import contextvars
+import inspect
+import time
+from contextlib import nullcontext
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from rivr.concurrency import is_async_callable
+
+__all__ = ['Metric', 'Timing', 'measure', 'timed']
+
+
+class Metric(NamedTuple):
+    name: str
+    duration: float
+    """The wall clock time in seconds."""
+    cpu_duration: float
+    """The CPU time of the current thread in seconds."""
+
+
+class Measurement(object):
+    __slots__ = ('timing', 'name', 'started', 'cpu_started')
+
+    def __init__(self, timing: 'Timing', name: str):
+        self.timing = timing
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+        self.cpu_started = time.thread_time()
+
+    def __exit__(self, *exc_info) -> None:
+        self.timing.record(
+            self.name,
+            time.perf_counter() - self.started,
+            time.thread_time() - self.cpu_started,
+        )
+
+    async def wait(self, awaitable: Awaitable[Any], cpu_duration: float) -> Any:
+        """
+        Awaits an awaitable returned by the measured call, possibly from
+        another thread, before recording the measurement.
+        """
+
+        self.cpu_started = time.thread_time() - cpu_duration
+        try:
+            return await awaitable
+        finally:
+            self.__exit__()
+
+
+class Timing(object):
+    """
+    Records the wall clock and CPU time of the stages of handling a request,
+    such as routing, each middleware and the view.
+
+    CPU time is measured for the current thread, asynchronous stages which
+    await other tasks may include the CPU time of those tasks.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.metrics: List[Metric] = []
+        self.finished = False
+
+    def __iter__(self) -> Iterator[Metric]:
+        return iter(self.metrics)
+
+    def measure(self, name: str) -> Measurement:
+        """
+        Returns a context manager recording the time spent within it.
+
+        Example::
+
+            with timing.measure('database'):
+                ...
+        """
+
+        return Measurement(self, name)
+
+    def record(self, name: str, duration: float, cpu_duration: float = 0.0) -> None:
+        if not self.finished:
+            self.metrics.append(Metric(name, duration, cpu_duration))
+
+    def finish(self) -> None:
+        """
+        Records the `total` time since the timing was created. Metrics are
+        no longer recorded once the timing is finished.
+        """
+
+        self.record('total', time.perf_counter() - self.started)
+        self.finished = True
+
+    def server_timing(self) -> str:
+        """
+        Returns the metrics as a `Server-Timing` header value, with durations
+        in milliseconds.
+
+        >>> timing.server_timing()
+        'route;dur=0.052, view;dur=4.113'
+        """
+
+        return ', '.join(
+            '%s;dur=%.3f' % (metric.name, metric.duration * 1000)
+            for metric in self.metrics
+        )
+
+
+current_timing: contextvars.ContextVar[Optional[Timing]] = contextvars.ContextVar(
+    'rivr.timing', default=None
+)
+"""The timing of the request currently being handled, if enabled."""
+
+NOT_MEASURED = nullcontext()
+
+
+def measure(name: str) -> ContextManager[None]:
+    """
+    Records the time spent within the context manager in the timing of the
+    current request. Nothing is recorded when timing is not enabled, for
+    example by `TimingMiddleware`.
+
+    Example::
+
+        def view(request):
+            with measure('database'):
+                ...
+    """
+
+    timing = current_timing.get()
+    if timing is None:
+        return NOT_MEASURED
+
+    return timing.measure(name)
+
+
+def timed(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps a function, such as a view, to measure each call as `name`.
+    """
+
+    if getattr(func, 'timed', None) == name:
+        return func
+
+    if is_async_callable(func):
+
+        async def async_timed_func(*args, **kwargs) -> Any:
+            with measure(name):
+                return await func(*args, **kwargs)
+
+        async_timed_func.timed = name  # type: ignore
+        return async_timed_func
+
+    def timed_func(*args, **kwargs) -> Any:
+        timing = current_timing.get()
+        if timing is None:
+            return func(*args, **kwargs)
+
+        measurement = timing.measure(name)
+        measurement.__enter__()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            measurement.__exit__()
+            raise
+
+        if inspect.isawaitable(result):
+            # A synchronous function, such as a router, may return the
+            # coroutine of an asynchronous view, the measurement is recorded
+            # once the coroutine has completed.
+            cpu_duration = time.thread_time() - measurement.cpu_started
+            return measurement.wait(result, cpu_duration)
+
+        measurement.__exit__()
+        return result
+
+    timed_func.timed = name  # type: ignore
+    return timed_func
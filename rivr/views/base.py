@@ -70,7 +70,13 @@ class View(object):
         get = getattr(self, 'get', None)
         if get:
             response = get(request, *args, **kwargs)
+            content_length = response.content_length
             response.content = ''
+
+            if content_length is not None:
+                # The length of the content which would have been sent
+                response.content_length = content_length
+
             return response
 
         return self.http_method_not_allowed(request, *args, **kwargs)
@@ -1,17 +1,50 @@
 import datetime
+import gzip
 import mimetypes
 import os
 import posixpath
 import re
+import secrets
 import stat
+import time
+from collections import OrderedDict
 from email.utils import formatdate, mktime_tz, parsedate_tz
 from functools import reduce
-from typing import List
+from io import BytesIO
+from threading import Lock
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import unquote
 
-from rivr.http import Http404, Request, Response, ResponseNotModified, ResponseRedirect
+try:
+    import brotli  # type: ignore
+
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+from rivr.http import (
+    FileResponse,
+    Http404,
+    Request,
+    Response,
+    ResponseNotModified,
+    ResponsePreconditionFailed,
+    ResponseRangeNotSatisfiable,
+    ResponseRedirect,
+    StreamingResponse,
+)
+from rivr.http.conditional import etag_matches, evaluate_preconditions
 from rivr.views.base import View
 
+PRECOMPRESSED_EXTENSIONS = (('br', '.br'), ('gzip', '.gz'))
+
+COMPRESSORS: List[Tuple[str, Callable[[bytes], bytes]]] = [
+    ('gzip', lambda content: gzip.compress(content, compresslevel=9, mtime=0))
+]
+
+if HAS_BROTLI:
+    COMPRESSORS.insert(0, ('br', brotli.compress))
+
 DEFAULT_DIRECTORY_INDEX_TEMPLATE = """
 <!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN"
     "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">
@@ -32,6 +65,232 @@ DEFAULT_DIRECTORY_INDEX_TEMPLATE = """
 """
 
 
+class StaticFile(object):
+    """
+    The metadata of a file served by `StaticView`, and optionally its
+    content.
+
+    A file with an `encoding` is a representation of another file, encoded
+    with the given content coding, using the media type of the original file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        stat_result: os.stat_result,
+        content: Optional[bytes] = None,
+        mimetype: Optional[str] = None,
+        encoding: Optional[str] = None,
+    ):
+        self.path = path
+        self.stat_result = stat_result
+        self.content = content
+        self.mimetype = (
+            mimetype or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        )
+        self.encoding = encoding
+        self.last_modified = '%s GMT' % (formatdate(stat_result[stat.ST_MTIME])[:25])
+        self.compressed: Dict[str, bytes] = {}
+
+    @property
+    def size(self) -> int:
+        if self.content is not None:
+            return len(self.content)
+
+        return self.stat_result.st_size
+
+    @property
+    def cached_size(self) -> int:
+        """
+        The amount of bytes of content, including compressed content, held in
+        memory for the file.
+        """
+
+        return len(self.content or b'') + sum(map(len, self.compressed.values()))
+
+    def read(self) -> bytes:
+        if self.content is not None:
+            return self.content
+
+        with open(self.path, 'rb') as fp:
+            return fp.read()
+
+    def open(self) -> IO[bytes]:
+        if self.content is not None:
+            return BytesIO(self.content)
+
+        return open(self.path, 'rb')
+
+    def is_current(self, stat_result: os.stat_result) -> bool:
+        return (
+            self.stat_result.st_ino == stat_result.st_ino
+            and self.stat_result.st_size == stat_result.st_size
+            and self.stat_result.st_mtime_ns == stat_result.st_mtime_ns
+        )
+
+
+class StaticFileCacheEntry(object):
+    __slots__ = ('static_file', 'checked_at')
+
+    def __init__(self, static_file: StaticFile, checked_at: float):
+        self.static_file = static_file
+        self.checked_at = checked_at
+
+
+class StaticFileCache(object):
+    """
+    A cache of the metadata of files served by `StaticView`, along with the
+    content of files up to `max_file_size` bytes, shared between requests.
+
+    Entries are revalidated against the file system at most once every
+    `revalidate_interval` seconds. The least recently used entries are evicted
+    once the cache holds more than `max_entries` files or more than
+    `max_bytes` bytes of content.
+
+    Usage::
+
+        StaticView.as_view(document_root='.', cache=StaticFileCache())
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        max_file_size: int = 64 * 1024,
+        revalidate_interval: float = 1.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_file_size = max_file_size
+        self.revalidate_interval = revalidate_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        """The amount of bytes of file content held by the cache."""
+
+        self.entries: 'OrderedDict[str, StaticFileCacheEntry]' = OrderedDict()
+        self.lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, path: str) -> Optional[StaticFile]:
+        """
+        Returns the file at the given path, or None when the path is not a
+        regular file.
+        """
+
+        now = time.monotonic()
+
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None:
+                self.entries.move_to_end(path)
+
+                if now - entry.checked_at < self.revalidate_interval:
+                    self.hits += 1
+                    return entry.static_file
+
+        if entry is not None:
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                self.discard(path)
+                return None
+
+            if entry.static_file.is_current(stat_result):
+                entry.checked_at = now
+                with self.lock:
+                    self.hits += 1
+                return entry.static_file
+
+        try:
+            static_file = self.load(path)
+        except OSError:
+            static_file = None
+
+        with self.lock:
+            self.misses += 1
+
+        if static_file is None:
+            self.discard(path)
+            return None
+
+        self.set(path, StaticFileCacheEntry(static_file, now))
+        return static_file
+
+    def load(self, path: str) -> Optional[StaticFile]:
+        with open(path, 'rb') as fp:
+            stat_result = os.fstat(fp.fileno())
+            if not stat.S_ISREG(stat_result.st_mode):
+                return None
+
+            content = None
+            if stat_result.st_size <= self.max_file_size:
+                content = fp.read()
+
+        return StaticFile(path, stat_result, content)
+
+    def set(self, path: str, entry: StaticFileCacheEntry) -> None:
+        with self.lock:
+            self.remove(path)
+            self.entries[path] = entry
+            self.size += entry.static_file.cached_size
+            self.evict()
+
+    def compress(
+        self,
+        static_file: StaticFile,
+        encoding: str,
+        compressor: Callable[[bytes], bytes],
+    ) -> bytes:
+        """
+        Returns the content of the file compressed with the given compressor.
+        The compressed content is kept with the cached file, and so is
+        discarded when the file is modified.
+        """
+
+        content = static_file.compressed.get(encoding)
+        if content is not None:
+            return content
+
+        content = compressor(static_file.read())
+
+        with self.lock:
+            if encoding not in static_file.compressed:
+                static_file.compressed[encoding] = content
+
+                entry = self.entries.get(static_file.path)
+                if entry is not None and entry.static_file is static_file:
+                    self.size += len(content)
+                    self.evict()
+
+        return content
+
+    def evict(self) -> None:
+        while self.entries and (
+            len(self.entries) > self.max_entries or self.size > self.max_bytes
+        ):
+            self.remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def discard(self, path: str) -> None:
+        with self.lock:
+            self.remove(path)
+
+    def remove(self, path: str) -> None:
+        entry = self.entries.pop(path, None)
+        if entry is not None:
+            self.size -= entry.static_file.cached_size
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
 class StaticView(View):
     """
     Usage in the router:
@@ -44,14 +303,46 @@ class StaticView(View):
     show_indexes = False
     use_request_path = False
     index = None
+    cache: Optional[StaticFileCache] = None
+    """
+    A `StaticFileCache` used to avoid file system calls, and reading small
+    files, on each request.
+    """
 
-    def was_modified_since(self, mtime: float) -> bool:
-        if_modified_since = self.request.if_modified_since
-        if not if_modified_since:
-            return True
+    precompressed = False
+    """
+    When precompressed is True, the `.br` and `.gz` siblings of a file are
+    served to clients which accept the encoding.
+    """
+
+    compress = False
+    """
+    When compress is True and a `cache` is set, files matching
+    `compress_types` are compressed once and the compressed content is kept in
+    the cache until the file is modified. Brotli is used when the `brotli`
+    package is installed, otherwise gzip.
+    """
+
+    compress_types = (
+        'text/',
+        'application/javascript',
+        'application/json',
+        'application/xml',
+        'image/svg+xml',
+    )
+    compress_min_size = 256
+    compress_max_size = 1024 * 1024
+
+    weak_etags = False
+    """
+    When weak_etags is True, the ETag of files is marked as a weak validator.
+    """
 
-        modified_time = datetime.datetime.fromtimestamp(mtime, tz=datetime.timezone.utc)
-        return modified_time > if_modified_since
+    max_ranges = 16
+    """
+    The maximum amount of byte ranges served for a single request, requests
+    for more ranges are served the entire file.
+    """
 
     def directory_index(self, request: Request, path: str, fullpath: str) -> Response:
         if not self.show_indexes:
@@ -113,6 +404,11 @@ class StaticView(View):
 
         fullpath = os.path.join(self.document_root, newpath)
 
+        if self.cache is not None:
+            static_file = self.cache.get(fullpath)
+            if static_file is not None:
+                return self.serve_file(static_file)
+
         if not os.path.exists(fullpath):
             raise Http404('"%s" does not exist.' % newpath)
 
@@ -127,19 +423,244 @@ class StaticView(View):
 
         return self.file(fullpath)
 
-    def file(self, fullpath: str) -> Response:
-        mtime = os.stat(fullpath)[stat.ST_MTIME]
-
-        if not self.was_modified_since(mtime):
-            return ResponseNotModified()
+    def etag(self, stat_result: os.stat_result) -> str:
+        """
+        Returns the entity tag for a file, derived from its inode, size and
+        modification time so that the file does not need to be read.
+        """
+
+        etag = '"%x-%x-%x"' % (
+            stat_result.st_ino,
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+        )
+
+        if self.weak_etags:
+            return 'W/' + etag
+
+        return etag
+
+    def byte_ranges(
+        self, size: int, last_modified: str, etag: str
+    ) -> Optional[List[Tuple[int, int]]]:
+        """
+        Returns the satisfiable byte ranges of the request as `(first, last)`
+        positions, an empty list when none of the ranges are satisfiable, or
+        None when the entire file should be served.
+        """
+
+        ranges = self.request.range
+        if ranges is None or len(ranges) > self.max_ranges:
+            return None
+
+        if_range = self.request.if_range
+        if if_range is not None:
+            if if_range.startswith(('"', 'W/')):
+                if not etag_matches(etag, [if_range]):
+                    return None
+            elif if_range != last_modified:
+                return None
+
+        satisfiable = []
+        for first, last in ranges:
+            if first is None:
+                # Suffix range, the final `last` bytes of the file
+                if not last or not size:
+                    continue
+
+                first = max(size - last, 0)
+                last = size - 1
+            elif first >= size:
+                continue
+            elif last is None or last >= size:
+                last = size - 1
+
+            satisfiable.append((first, last))
+
+        return satisfiable
+
+    def load_file(self, path: str) -> Optional[StaticFile]:
+        if self.cache is not None:
+            return self.cache.get(path)
+
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+
+        return StaticFile(path, stat_result)
+
+    def is_compressible(self, static_file: StaticFile) -> bool:
+        return (
+            self.compress_min_size <= static_file.size <= self.compress_max_size
+            and static_file.mimetype.startswith(self.compress_types)
+        )
+
+    def negotiate_encoding(self, static_file: StaticFile) -> StaticFile:
+        """
+        Returns the representation of the file to serve, either the file
+        itself or a compressed representation which the client accepts.
+        """
+
+        request = self.request
+
+        if self.precompressed:
+            for encoding, extension in PRECOMPRESSED_EXTENSIONS:
+                if not request.accepts_encoding(encoding):
+                    continue
+
+                sibling = self.load_file(static_file.path + extension)
+                if (
+                    sibling is not None
+                    and sibling.stat_result.st_mtime >= static_file.stat_result.st_mtime
+                ):
+                    return StaticFile(
+                        sibling.path,
+                        sibling.stat_result,
+                        sibling.content,
+                        mimetype=static_file.mimetype,
+                        encoding=encoding,
+                    )
+
+        if (
+            self.compress
+            and self.cache is not None
+            and self.is_compressible(static_file)
+        ):
+            for encoding, compressor in COMPRESSORS:
+                if request.accepts_encoding(encoding):
+                    return StaticFile(
+                        static_file.path,
+                        static_file.stat_result,
+                        self.cache.compress(static_file, encoding, compressor),
+                        mimetype=static_file.mimetype,
+                        encoding=encoding,
+                    )
+
+        return static_file
 
-        mimetype = mimetypes.guess_type(fullpath)[0] or 'application/octet-stream'
+    def file(self, fullpath: str) -> Response:
+        static_file = None
+        if self.cache is not None:
+            static_file = self.cache.get(fullpath)
+
+        if static_file is None:
+            static_file = StaticFile(fullpath, os.stat(fullpath))
+
+        return self.serve_file(static_file)
+
+    def serve_file(self, static_file: StaticFile) -> Response:
+        is_negotiated = self.precompressed or self.compress
+        if is_negotiated:
+            static_file = self.negotiate_encoding(static_file)
+
+        stat_result = static_file.stat_result
+        mtime = stat_result[stat.ST_MTIME]
+        size = static_file.size
+        etag = self.etag(stat_result)
+        last_modified = static_file.last_modified
+
+        if static_file.encoding:
+            # Each representation requires a distinct entity tag
+            etag = '%s-%s"' % (etag[:-1], static_file.encoding)
+
+        status = evaluate_preconditions(
+            self.request,
+            etag,
+            datetime.datetime.fromtimestamp(mtime, tz=datetime.timezone.utc),
+        )
+
+        if status == 412:
+            return ResponsePreconditionFailed()
+
+        if status == 304:
+            response: Response = ResponseNotModified()
+            response.headers['ETag'] = etag
+            response.headers['Last-Modified'] = last_modified
+            if is_negotiated:
+                response.headers['Vary'] = 'Accept-Encoding'
+            return response
+
+        mimetype = static_file.mimetype
+        ranges = self.byte_ranges(size, last_modified, etag)
+
+        if ranges is None:
+            response = FileResponse(static_file.open(), content_type=mimetype)
+            response.content_length = size
+        elif not ranges:
+            response = ResponseRangeNotSatisfiable()
+            response.headers['Content-Range'] = 'bytes */%s' % size
+        elif len(ranges) == 1:
+            first, last = ranges[0]
+            fp = static_file.open()
+            fp.seek(first)
+            response = FileResponse(
+                fp, status=206, content_type=mimetype, length=last - first + 1
+            )
+            response.headers['Content-Range'] = 'bytes %s-%s/%s' % (first, last, size)
+        else:
+            response = self.multipart_byteranges(static_file, ranges)
+
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = last_modified
+        response.headers['Accept-Ranges'] = 'bytes'
+
+        if static_file.encoding:
+            response.headers['Content-Encoding'] = static_file.encoding
+
+        if is_negotiated:
+            response.headers['Vary'] = 'Accept-Encoding'
 
-        with open(fullpath, 'rb') as fp:
-            contents = fp.read()
+        return response
 
-        response = Response(contents, content_type=mimetype)
-        response.headers['Last-Modified'] = '%s GMT' % (formatdate(mtime)[:25])
-        response.headers['Content-Length'] = str(len(contents))
+    def multipart_byteranges(
+        self, static_file: StaticFile, ranges: List[Tuple[int, int]]
+    ) -> Response:
+        mimetype = static_file.mimetype
+        size = static_file.size
+        boundary = secrets.token_hex(16)
+        parts = [
+            (
+                (
+                    '--%s\r\nContent-Type: %s\r\nContent-Range: bytes %s-%s/%s\r\n\r\n'
+                    % (boundary, mimetype, first, last, size)
+                ).encode('ascii'),
+                first,
+                last,
+            )
+            for first, last in ranges
+        ]
+        closing = ('--%s--\r\n' % boundary).encode('ascii')
+
+        def generate() -> Iterator[bytes]:
+            with static_file.open() as fp:
+                for header, first, last in parts:
+                    yield header
+
+                    fp.seek(first)
+                    remaining = last - first + 1
+                    while remaining > 0:
+                        chunk = fp.read(min(FileResponse.block_size, remaining))
+                        if not chunk:
+                            break
+
+                        remaining -= len(chunk)
+                        yield chunk
+
+                    yield b'\r\n'
+
+            yield closing
+
+        response = StreamingResponse(
+            generate(),
+            status=206,
+            content_type='multipart/byteranges; boundary=%s' % boundary,
+        )
+        response.content_length = sum(
+            len(header) + last - first + 1 + 2 for header, first, last in parts
+        ) + len(closing)
 
         return response
@@ -1,15 +1,26 @@
+import io
 import logging
 import sys
-from typing import Any, Callable, Dict, Iterable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from rivr.http.chunked import ChunkedReader
+from rivr.http.headers import Headers
 from rivr.http.request import Query, Request
-from rivr.http.response import Http404, Response, ResponseNotFound
+from rivr.http.response import (
+    FileResponse,
+    Http404,
+    Response,
+    ResponseNotFound,
+    StreamingResponse,
+)
 
 logger = logging.getLogger('rivr.request')
 
 STATUS_CODES = {
     100: 'CONTINUE',
     101: 'SWITCHING PROTOCOLS',
+    102: 'PROCESSING',
+    103: 'EARLY HINTS',
     200: 'OK',
     201: 'CREATED',
     202: 'ACCEPTED',
@@ -17,6 +28,9 @@ STATUS_CODES = {
     204: 'NO CONTENT',
     205: 'RESET CONTENT',
     206: 'PARTIAL CONTENT',
+    207: 'MULTI-STATUS',
+    208: 'ALREADY REPORTED',
+    226: 'IM USED',
     300: 'MULTIPLE CHOICES',
     301: 'MOVED PERMANENTLY',
     302: 'FOUND',
@@ -25,6 +39,7 @@ STATUS_CODES = {
     305: 'USE PROXY',
     306: 'RESERVED',
     307: 'TEMPORARY REDIRECT',
+    308: 'PERMANENT REDIRECT',
     400: 'BAD REQUEST',
     401: 'UNAUTHORIZED',
     402: 'PAYMENT REQUIRED',
@@ -43,14 +58,48 @@ STATUS_CODES = {
     415: 'UNSUPPORTED MEDIA TYPE',
     416: 'REQUESTED RANGE NOT SATISFIABLE',
     417: 'EXPECTATION FAILED',
+    418: "I'M A TEAPOT",
+    421: 'MISDIRECTED REQUEST',
+    422: 'UNPROCESSABLE CONTENT',
+    423: 'LOCKED',
+    424: 'FAILED DEPENDENCY',
+    425: 'TOO EARLY',
+    426: 'UPGRADE REQUIRED',
+    428: 'PRECONDITION REQUIRED',
+    429: 'TOO MANY REQUESTS',
+    431: 'REQUEST HEADER FIELDS TOO LARGE',
+    451: 'UNAVAILABLE FOR LEGAL REASONS',
     500: 'INTERNAL SERVER ERROR',
     501: 'NOT IMPLEMENTED',
     502: 'BAD GATEWAY',
     503: 'SERVICE UNAVAILABLE',
     504: 'GATEWAY TIMEOUT',
     505: 'HTTP VERSION NOT SUPPORTED',
+    506: 'VARIANT ALSO NEGOTIATES',
+    507: 'INSUFFICIENT STORAGE',
+    508: 'LOOP DETECTED',
+    510: 'NOT EXTENDED',
+    511: 'NETWORK AUTHENTICATION REQUIRED',
 }
 
+STATUS_LINES = {
+    code: sys.intern('%d %s' % (code, text)) for code, text in STATUS_CODES.items()
+}
+
+
+def status_line(status_code: int) -> str:
+    """
+    Returns the WSGI status line for a status code.
+
+    >>> status_line(404)
+    '404 NOT FOUND'
+    """
+
+    try:
+        return STATUS_LINES[status_code]
+    except KeyError:
+        return '%d UNKNOWN STATUS CODE' % status_code
+
 
 def get_wsgi_str(environ, key: str, default) -> str:
     # https://peps.python.org/pep-3333/#unicode-issues
@@ -58,11 +107,84 @@ def get_wsgi_str(environ, key: str, default) -> str:
     return value.encode('iso-8859-1').decode()
 
 
+class WSGIHeaders(Headers):
+    """
+    The headers of a WSGI request, looked up in the WSGI environ on demand.
+    The headers are only copied from the environ once they are modified or
+    iterated.
+    """
+
+    def __init__(self, environ: Dict[str, Any]):
+        self.environ = environ
+        self.materialised_headers: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        self._parsed: Dict[str, Any] = {}
+
+    @staticmethod
+    def environ_key(name: str) -> str:
+        key = name.upper().replace('-', '_')
+        if key in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            return key
+
+        return 'HTTP_' + key
+
+    @property  # type: ignore
+    def _fields(self) -> Dict[str, List[Tuple[str, str]]]:
+        if self.materialised_headers is None:
+            self.materialised_headers = {}
+
+            for key in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                value = self.environ.get(key)
+                if value:
+                    name = key.title().replace('_', '-')
+                    self.materialised_headers[name.lower()] = [(name, value)]
+
+            for key, value in self.environ.items():
+                if key.startswith('HTTP_'):
+                    name = key[5:].replace('_', '-')
+                    self.materialised_headers[name.lower()] = [(name, value)]
+
+        return self.materialised_headers
+
+    @_fields.setter
+    def _fields(self, fields: Dict[str, List[Tuple[str, str]]]) -> None:
+        self.materialised_headers = fields
+
+    def __contains__(self, name: str) -> bool:
+        if self.materialised_headers is not None:
+            return super(WSGIHeaders, self).__contains__(name)
+
+        return bool(self.environ.get(self.environ_key(name)))
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        if self.materialised_headers is not None:
+            return super(WSGIHeaders, self).get(name, default)
+
+        return self.environ.get(self.environ_key(name)) or default
+
+    def get_all(self, name: str) -> List[str]:
+        if self.materialised_headers is not None:
+            return super(WSGIHeaders, self).get_all(name)
+
+        value = self.environ.get(self.environ_key(name))
+        if value:
+            return [value]
+
+        return []
+
+
 class WSGIRequest(Request):
     """
     https://wsgi.readthedocs.io/en/latest/definitions.html
     """
 
+    decode_chunked = False
+    """
+    Decode chunked request bodies. Enable when the WSGI server passes the
+    chunk framing of request bodies through to the application, servers
+    which decode the body themselves and set `wsgi.input_terminated` are
+    not affected.
+    """
+
     def __init__(self, environ: Dict[str, Any]):
         method: str = environ['REQUEST_METHOD']
         path = get_wsgi_str(environ, 'PATH_INFO', '/')
@@ -70,29 +192,28 @@ class WSGIRequest(Request):
         query = Query(get_wsgi_str(environ, 'QUERY_STRING', ''))
 
         super(WSGIRequest, self).__init__(
-            path, method, query=query, body=environ['wsgi.input']
+            path,
+            method,
+            query=query,
+            headers=WSGIHeaders(environ),
+            body=environ['wsgi.input'],
         )
 
         self.environ = environ
         self.META = environ
 
+        if (
+            self.decode_chunked
+            and self.is_chunked
+            and not environ.get('wsgi.input_terminated')
+        ):
+            self.body = io.BufferedReader(ChunkedReader(self.body))  # type: ignore
+
         if 'HTTP_HOST' in environ:
             self.host = environ['HTTP_HOST']
         else:
             self.host = environ['SERVER_NAME']
 
-        content_type = self.environ.get('CONTENT_TYPE', None)
-        if content_type:
-            self.content_type = content_type
-
-        content_length = self.environ.get('CONTENT_LENGTH', None)
-        if content_length:
-            self.headers['Content-Length'] = content_length
-
-        for key in self.META:
-            if key.startswith('HTTP_'):
-                self.headers[key[5:].replace('_', '-')] = self.META[key]
-
     @property
     def is_secure(self) -> bool:
         """
@@ -158,18 +279,19 @@ class WSGIHandler(object):
 
             response = Response('Internal server error', status=500)
 
-        try:
-            status_text = STATUS_CODES[response.status_code]
-        except KeyError:
-            status_text = 'UNKNOWN STATUS CODE'
-
-        status = '%s %s' % (response.status_code, status_text)
-
-        start_response(status, response.headers_items())
+        start_response(status_line(response.status_code), response.headers_items())
 
-        response_content = response.content
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if (
+            file_wrapper
+            and isinstance(response, FileResponse)
+            and response.length is None
+            and not response.file.closed
+        ):
+            return file_wrapper(response.file, response.block_size)
 
-        if isinstance(response_content, str):
-            response_content = response_content.encode('utf-8')
+        if isinstance(response, StreamingResponse):
+            # The server iterates the response and calls its close()
+            return response
 
-        return [response_content]
+        return [response.content]
@@ -0,0 +1,214 @@
+import asyncio
+import gzip
+import threading
+import unittest
+from typing import Any, Dict, List, Optional
+
+from rivr.asgi import ASGIHandler
+from rivr.http import Http404, Request, Response, StreamingResponse
+from rivr.middleware import Middleware
+from rivr.middleware.compression import CompressionMiddleware
+from rivr.middleware.conditional import ConditionalMiddleware
+from rivr.router import Router
+
+
+class ASGIHandlerTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super(ASGIHandlerTests, self).setUp()
+
+        self.scope: Dict[str, Any] = {
+            'type': 'http',
+            'method': 'GET',
+            'path': '/path/',
+            'query_string': b'',
+            'headers': [],
+        }
+        self.messages: List[Dict[str, Any]] = []
+
+    async def receive(self) -> Dict[str, Any]:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        self.messages.append(message)
+
+    async def call(self, view) -> None:
+        await ASGIHandler(view)(self.scope, self.receive, self.send)
+
+    @property
+    def status(self) -> int:
+        return self.messages[0]['status']
+
+    @property
+    def body(self) -> bytes:
+        return b''.join(message.get('body', b'') for message in self.messages[1:])
+
+    async def test_sync_view(self) -> None:
+        threads = []
+
+        def view(request: Request) -> Response:
+            threads.append(threading.current_thread())
+            return Response('Hello World')
+
+        await self.call(view)
+
+        assert self.status == 200
+        assert self.messages[0]['headers'] == [
+            (b'content-type', b'text/html; charset=utf8'),
+            (b'content-length', b'11'),
+        ]
+        assert self.body == b'Hello World'
+        assert threads[0] is not threading.current_thread()
+
+    async def test_async_view(self) -> None:
+        async def view(request: Request) -> Response:
+            await asyncio.sleep(0)
+            return Response('Hello World')
+
+        await self.call(view)
+
+        assert self.status == 200
+        assert self.body == b'Hello World'
+
+    async def test_router_with_async_view(self) -> None:
+        router = Router()
+
+        @router.register(r'^path/$')
+        async def view(request: Request) -> Response:
+            return Response('Hello World')
+
+        await self.call(router)
+
+        assert self.body == b'Hello World'
+
+    async def test_async_middleware(self) -> None:
+        class AsyncMiddleware(Middleware):
+            async def process_response(
+                self, request: Request, response: Response
+            ) -> Response:
+                response.headers['X-Middleware'] = 'async'
+                return response
+
+        def view(request: Request) -> Response:
+            return Response('Hello World')
+
+        await self.call(AsyncMiddleware.wrap(view))
+
+        assert (b'x-middleware', b'async') in self.messages[0]['headers']
+        assert self.body == b'Hello World'
+
+    async def test_middleware_processes_async_view_exception(self) -> None:
+        class ExceptionMiddleware(Middleware):
+            def process_exception(
+                self, request: Request, exception: Exception
+            ) -> Optional[Response]:
+                return Response(str(exception), status=400)
+
+        async def view(request: Request) -> Response:
+            raise Exception('Invalid')
+
+        await self.call(ExceptionMiddleware.wrap(view))
+
+        assert self.status == 400
+        assert self.body == b'Invalid'
+
+    async def test_streaming_response(self) -> None:
+        def view(request: Request) -> Response:
+            return StreamingResponse(['Hello', ' World'])
+
+        await self.call(view)
+
+        assert self.body == b'Hello World'
+        assert self.messages[-1] == {'type': 'http.response.body', 'body': b''}
+
+    async def test_async_streaming_response(self) -> None:
+        closed = []
+
+        async def generate():
+            try:
+                yield 'Hello'
+                yield b' World'
+            finally:
+                closed.append(True)
+
+        async def view(request: Request) -> Response:
+            return StreamingResponse(generate())
+
+        await self.call(view)
+
+        assert self.body == b'Hello World'
+        assert closed == [True]
+
+    async def test_compressed_async_streaming_response(self) -> None:
+        closed = []
+
+        async def generate():
+            try:
+                for _ in range(100):
+                    yield 'Hello World\n'
+            finally:
+                closed.append(True)
+
+        async def view(request: Request) -> Response:
+            return StreamingResponse(generate(), content_type='text/plain')
+
+        self.scope['headers'] = [(b'accept-encoding', b'gzip')]
+        await self.call(CompressionMiddleware.wrap(view))
+
+        headers = dict(self.messages[0]['headers'])
+        assert headers[b'content-encoding'] == b'gzip'
+        assert gzip.decompress(self.body) == b'Hello World\n' * 100
+        assert closed == [True]
+
+    async def test_not_modified_closes_async_streaming_response(self) -> None:
+        closed = []
+
+        async def generate():
+            try:
+                yield 'Hello World'
+            finally:
+                closed.append(True)
+
+        async def view(request: Request) -> Response:
+            content = generate()
+            await content.__anext__()
+            response = StreamingResponse(content, content_type='text/plain')
+            response.headers['ETag'] = '"etag"'
+            return response
+
+        self.scope['headers'] = [(b'if-none-match', b'"etag"')]
+        await self.call(ConditionalMiddleware.wrap(view))
+        await asyncio.sleep(0)
+
+        assert self.status == 304
+        assert closed == [True]
+
+    async def test_catches_http_404(self) -> None:
+        async def view(request: Request) -> Response:
+            raise Http404('Not found.')
+
+        await self.call(view)
+        assert self.status == 404
+
+    async def test_catches_exceptions(self) -> None:
+        def view(request: Request) -> Response:
+            raise Exception('Error')
+
+        with self.assertLogs('rivr.request'):
+            await self.call(view)
+
+        assert self.status == 500
+
+    async def test_lifespan(self) -> None:
+        messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+
+        async def receive() -> Dict[str, Any]:
+            return messages.pop(0)
+
+        await ASGIHandler(lambda request: Response())(
+            {'type': 'lifespan'}, receive, self.send
+        )
+
+        assert self.messages == [
+            {'type': 'lifespan.startup.complete'},
+            {'type': 'lifespan.shutdown.complete'},
+        ]
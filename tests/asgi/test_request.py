@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from typing import Any, Dict, List
+
+from rivr.asgi import ASGIRequest
+
+
+class ASGIRequestTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super(ASGIRequestTest, self).setUp()
+
+        self.scope: Dict[str, Any] = {
+            'type': 'http',
+            'method': 'PATCH',
+            'path': '/path/',
+            'query_string': b'name=Kyle&something=else',
+            'scheme': 'https',
+            'server': ('example.com', 443),
+            'headers': [
+                (b'content-type', b'text/plain'),
+                (b'content-length', b'11'),
+                (b'cookie', b'name=Kyle'),
+            ],
+        }
+        self.messages: List[Dict[str, Any]] = [
+            {'type': 'http.request', 'body': b'Hello ', 'more_body': True},
+            {'type': 'http.request', 'body': b'World', 'more_body': False},
+        ]
+
+    async def receive(self) -> Dict[str, Any]:
+        return self.messages.pop(0)
+
+    async def test_method(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        assert request.method == 'PATCH'
+
+    async def test_path(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        assert request.path == '/path/'
+
+    async def test_query(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        assert request.query['name'] == 'Kyle'
+
+    async def test_headers(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        assert request.headers['Content-Type'] == 'text/plain'
+        assert request.content_length == 11
+        assert request.cookies['name'].value == 'Kyle'
+
+    async def test_host(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        assert request.host == 'example.com'
+
+        self.scope['headers'].append((b'host', b'dev.example.com'))
+        request = ASGIRequest(self.scope, self.receive)
+        assert request.host == 'dev.example.com'
+
+    async def test_url(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        assert request.is_secure
+        assert request.port == 443
+        assert request.url == 'https://example.com/path/'
+
+    async def test_stream(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        chunks = [chunk async for chunk in request.stream()]
+        assert chunks == [b'Hello ', b'World']
+
+    async def test_text_from_thread(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+        text = await asyncio.get_running_loop().run_in_executor(None, request.text)
+        assert text == 'Hello World'
+
+    async def test_body_cannot_be_read_from_event_loop(self) -> None:
+        request = ASGIRequest(self.scope, self.receive)
+
+        with self.assertRaises(RuntimeError):
+            request.body.read()
@@ -0,0 +1,81 @@
+import io
+
+import pytest
+
+from rivr.http.chunked import ChunkedReader
+
+BODY = b'5\r\nHello\r\n1;name=value\r\n \r\n5\r\nWorld\r\n0\r\nTrailer: Value\r\n\r\n'
+
+
+def reader(body: bytes) -> io.BufferedReader:
+    return io.BufferedReader(ChunkedReader(io.BytesIO(body)))
+
+
+def test_read() -> None:
+    assert reader(BODY).read() == b'Hello World'
+
+
+@pytest.mark.parametrize('size', [1, 2, 4, 100])
+def test_read_in_parts(size: int) -> None:
+    body = ChunkedReader(io.BytesIO(BODY))
+    data = b''
+
+    while True:
+        chunk = body.read(size)
+        if not chunk:
+            break
+
+        assert len(chunk) <= size
+        data += chunk
+
+    assert data == b'Hello World'
+
+
+def test_read_stops_at_last_chunk() -> None:
+    stream = io.BytesIO(b'5\r\nHello\r\n0\r\n\r\nNext')
+    body = ChunkedReader(stream)
+
+    assert body.read() == b'Hello'
+    assert body.read() == b''
+    assert stream.read() == b'Next'
+
+
+def test_read_hex_chunk_size() -> None:
+    body = b'A\r\n0123456789\r\n0\r\n\r\n'
+
+    assert reader(body).read() == b'0123456789'
+
+
+@pytest.mark.parametrize('size', [b'Z', b'', b'-5', b'+5', b'0x5', b'1_0', b'5 5'])
+def test_invalid_chunk_size(size: bytes) -> None:
+    with pytest.raises(ValueError):
+        reader(size + b'\r\nHello\r\n0\r\n\r\n').read()
+
+
+def test_missing_line_break_after_chunk() -> None:
+    with pytest.raises(ValueError):
+        reader(b'5\r\nHelloWorld\r\n0\r\n\r\n').read()
+
+
+def test_truncated_chunk() -> None:
+    with pytest.raises(IOError):
+        reader(b'A\r\nHello').read()
+
+
+def test_truncated_framing() -> None:
+    with pytest.raises(IOError):
+        reader(b'5\r\nHello\r\n').read()
+
+
+def test_chunk_size_line_too_long() -> None:
+    body = ChunkedReader(io.BytesIO(b'5;' + b'a' * 5000 + b'\r\nHello\r\n0\r\n\r\n'))
+
+    with pytest.raises(IOError):
+        body.read()
+
+
+def test_trailers_too_long() -> None:
+    body = ChunkedReader(io.BytesIO(b'0\r\n' + b'Trailer: Value\r\n' * 2000 + b'\r\n'))
+
+    with pytest.raises(IOError):
+        body.read()
@@ -0,0 +1,72 @@
+import datetime
+
+from rivr.http import Request
+from rivr.http.conditional import etag_matches, evaluate_preconditions
+
+LAST_MODIFIED = datetime.datetime(2024, 7, 13, 19, 47, 43, tzinfo=datetime.timezone.utc)
+
+
+def test_etag_matches_strong_comparison() -> None:
+    assert etag_matches('"1"', ['"1"'])
+    assert not etag_matches('W/"1"', ['W/"1"'])
+    assert not etag_matches('"1"', ['"2"'])
+
+
+def test_etag_matches_weak_comparison() -> None:
+    assert etag_matches('W/"1"', ['"1"'], weak=True)
+    assert etag_matches('"1"', ['W/"1"'], weak=True)
+    assert not etag_matches('"1"', ['"2"'], weak=True)
+
+
+def test_etag_matches_any() -> None:
+    assert etag_matches('"1"', ['*'])
+
+
+def test_evaluate_preconditions_without_conditions() -> None:
+    assert evaluate_preconditions(Request(), '"1"', LAST_MODIFIED) is None
+
+
+def test_evaluate_preconditions_if_none_match() -> None:
+    request = Request(headers={'If-None-Match': '"1"'})
+    assert evaluate_preconditions(request, '"1"', LAST_MODIFIED) == 304
+    assert evaluate_preconditions(request, '"2"', LAST_MODIFIED) is None
+
+    request = Request(method='PUT', headers={'If-None-Match': '*'})
+    assert evaluate_preconditions(request, '"1"', LAST_MODIFIED) == 412
+
+
+def test_evaluate_preconditions_if_none_match_ignores_if_modified_since() -> None:
+    request = Request(
+        headers={
+            'If-None-Match': '"2"',
+            'If-Modified-Since': 'Sat, 13 Jul 2024 19:47:43 GMT',
+        }
+    )
+    assert evaluate_preconditions(request, '"1"', LAST_MODIFIED) is None
+
+
+def test_evaluate_preconditions_if_modified_since() -> None:
+    request = Request(headers={'If-Modified-Since': 'Sat, 13 Jul 2024 19:47:43 GMT'})
+    assert evaluate_preconditions(request, None, LAST_MODIFIED) == 304
+
+    request = Request(headers={'If-Modified-Since': 'Sat, 13 Jul 2024 18:47:43 GMT'})
+    assert evaluate_preconditions(request, None, LAST_MODIFIED) is None
+
+
+def test_evaluate_preconditions_if_match() -> None:
+    request = Request(method='PUT', headers={'If-Match': '"1"'})
+    assert evaluate_preconditions(request, '"1"', LAST_MODIFIED) is None
+    assert evaluate_preconditions(request, '"2"', LAST_MODIFIED) == 412
+    assert evaluate_preconditions(request, None, LAST_MODIFIED) == 412
+
+
+def test_evaluate_preconditions_if_unmodified_since() -> None:
+    request = Request(
+        method='PUT', headers={'If-Unmodified-Since': 'Sat, 13 Jul 2024 18:47:43 GMT'}
+    )
+    assert evaluate_preconditions(request, None, LAST_MODIFIED) == 412
+
+    request = Request(
+        method='PUT', headers={'If-Unmodified-Since': 'Sat, 13 Jul 2024 19:47:43 GMT'}
+    )
+    assert evaluate_preconditions(request, None, LAST_MODIFIED) is None
@@ -0,0 +1,107 @@
+from rivr.http.headers import Headers
+
+
+def test_case_insensitive_lookup() -> None:
+    headers = Headers([('Content-Type', 'text/plain')])
+
+    assert headers['content-type'] == 'text/plain'
+    assert headers['CONTENT-TYPE'] == 'text/plain'
+    assert 'Content-type' in headers
+
+
+def test_missing_header() -> None:
+    headers = Headers()
+
+    assert headers['Content-Type'] is None
+    assert headers.get('Content-Type', 'text/html') == 'text/html'
+    assert headers.get_all('Content-Type') == []
+    assert 'Content-Type' not in headers
+
+
+def test_headers_from_dict() -> None:
+    headers = Headers({'Accept': 'text/plain'})
+
+    assert headers.items() == [('Accept', 'text/plain')]
+
+
+def test_multiple_values() -> None:
+    headers = Headers()
+    headers.add('Set-Cookie', 'a=1')
+    headers.add('set-cookie', 'b=2')
+
+    assert headers['Set-Cookie'] == 'a=1'
+    assert headers.get_all('Set-Cookie') == ['a=1', 'b=2']
+    assert len(headers) == 2
+
+
+def test_setitem_replaces_values() -> None:
+    headers = Headers([('Vary', 'Accept'), ('Vary', 'Cookie'), ('ETag', '"1"')])
+    headers['vary'] = 'Accept-Encoding'
+
+    assert headers.items() == [('ETag', '"1"'), ('vary', 'Accept-Encoding')]
+
+
+def test_delitem() -> None:
+    headers = Headers([('Vary', 'Accept'), ('Vary', 'Cookie')])
+    del headers['VARY']
+    del headers['Missing']
+
+    assert headers.items() == []
+    assert len(headers) == 0
+
+
+def test_preserves_order() -> None:
+    headers = Headers([('B', '1'), ('A', '2'), ('C', '3')])
+
+    assert headers.keys() == ['B', 'A', 'C']
+    assert headers.values() == ['1', '2', '3']
+    assert list(headers) == ['B', 'A', 'C']
+
+
+def test_setdefault() -> None:
+    headers = Headers([('Vary', 'Accept')])
+
+    assert headers.setdefault('Vary', 'Cookie') == 'Accept'
+    assert headers.setdefault('ETag', '"1"') == '"1"'
+    assert headers['ETag'] == '"1"'
+
+
+def test_add_header_with_parameters() -> None:
+    headers = Headers()
+    headers.add_header('Content-Disposition', 'attachment', filename='a.txt')
+
+    assert headers['Content-Disposition'] == 'attachment; filename="a.txt"'
+
+
+def test_str() -> None:
+    headers = Headers([('Content-Type', 'text/plain'), ('Content-Length', '5')])
+
+    assert str(headers) == 'Content-Type: text/plain\r\nContent-Length: 5\r\n\r\n'
+
+
+def test_parsed_value_is_cached() -> None:
+    calls = []
+
+    def parse(value: str) -> int:
+        calls.append(value)
+        return int(value)
+
+    headers = Headers([('Content-Length', '5')])
+
+    assert headers.parsed('Content-Length', parse) == 5
+    assert headers.parsed('content-length', parse) == 5
+    assert calls == ['5']
+
+
+def test_parsed_value_is_invalidated_on_write() -> None:
+    headers = Headers([('Content-Length', '5')])
+    assert headers.parsed('Content-Length', int) == 5
+
+    headers['Content-Length'] = '10'
+    assert headers.parsed('Content-Length', int) == 10
+
+    headers.add('Content-Length', '20')
+    assert headers.parsed('Content-Length', int) == 10
+
+    del headers['Content-Length']
+    assert headers.parsed('Content-Length', int) is None
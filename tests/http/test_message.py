@@ -1,5 +1,4 @@
-from wsgiref.headers import Headers
-
+from rivr.http.headers import Headers
 from rivr.http.message import HTTPMessage, MediaType
 
 
@@ -50,3 +49,17 @@ def test_content_length_setter() -> None:
     message.content_length = 1024
 
     assert message.headers['Content-Length'] == '1024'
+
+
+def test_content_type_updated_after_header_change() -> None:
+    message = HTTPMessage({'Content-Type': 'text/plain'})
+    assert message.content_type == MediaType('text', 'plain')
+
+    message.headers['Content-Type'] = 'text/html'
+    assert message.content_type == MediaType('text', 'html')
+
+
+def test_invalid_content_length() -> None:
+    message = HTTPMessage({'Content-Length': 'invalid'})
+
+    assert message.content_length is None
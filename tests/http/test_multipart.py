@@ -0,0 +1,149 @@
+from io import BytesIO
+
+import pytest
+
+from rivr.http.multipart import MultipartParser, parse_content_disposition
+from rivr.http.request import Request
+
+BODY = (
+    b'preamble\r\n'
+    b'--boundary\r\n'
+    b'Content-Disposition: form-data; name="message"\r\n'
+    b'\r\n'
+    b'Hello World\r\n'
+    b'--boundary\r\n'
+    b'Content-Disposition: form-data; name="file"; filename="hello.txt"\r\n'
+    b'Content-Type: text/plain\r\n'
+    b'\r\n'
+    b'Hello\r\n--boundar\r\n'
+    b'--boundary--\r\n'
+    b'epilogue'
+)
+
+
+def parse(body: bytes, **kwargs):
+    parser = MultipartParser(BytesIO(body), 'boundary', length=len(body), **kwargs)
+    return parser.parse()
+
+
+def test_parse_content_disposition() -> None:
+    assert parse_content_disposition('form-data; name="a\\"b"; filename=c.txt') == (
+        'form-data',
+        {'name': 'a"b', 'filename': 'c.txt'},
+    )
+
+
+def test_parse_content_disposition_extended_filename() -> None:
+    assert parse_content_disposition(
+        'form-data; name="file"; filename="a.txt"; filename*=UTF-8\'\'%C3%A9.txt'
+    ) == ('form-data', {'name': 'file', 'filename': 'é.txt'})
+
+
+def test_parse_fields_and_files() -> None:
+    fields, files = parse(BODY)
+
+    assert fields == [('message', 'Hello World')]
+    assert len(files) == 1
+
+    name, uploaded_file = files[0]
+    assert name == 'file'
+    assert uploaded_file.filename == 'hello.txt'
+    assert uploaded_file.size == 16
+    assert str(uploaded_file.content_type) == 'text/plain'
+    assert uploaded_file.read() == b'Hello\r\n--boundar'
+    uploaded_file.close()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 16])
+def test_parse_in_small_chunks(chunk_size: int) -> None:
+    parser = MultipartParser(BytesIO(BODY), 'boundary', length=len(BODY))
+    parser.chunk_size = chunk_size
+    fields, files = parser.parse()
+
+    assert fields == [('message', 'Hello World')]
+    assert files[0][1].read() == b'Hello\r\n--boundar'
+    files[0][1].close()
+
+
+def test_parse_reads_only_length() -> None:
+    body = BytesIO(BODY + b'trailing')
+    parser = MultipartParser(body, 'boundary', length=len(BODY))
+    fields, files = parser.parse()
+    files[0][1].close()
+
+    assert body.read() == b'trailing'
+
+
+def test_parse_spools_large_files() -> None:
+    fields, files = parse(BODY, spool_size=4)
+    uploaded_file = files[0][1]
+
+    assert uploaded_file.file._rolled  # type: ignore
+    assert uploaded_file.read() == b'Hello\r\n--boundar'
+    uploaded_file.close()
+
+
+def test_parse_field_charset() -> None:
+    body = (
+        b'--boundary\r\n'
+        b'Content-Disposition: form-data; name="name"\r\n'
+        b'Content-Type: text/plain; charset=latin-1\r\n'
+        b'\r\n'
+        b'caf\xe9\r\n'
+        b'--boundary--'
+    )
+
+    assert parse(body) == ([('name', 'café')], [])
+
+
+def test_parse_max_part_size() -> None:
+    with pytest.raises(IOError):
+        parse(BODY, max_part_size=10)
+
+
+def test_parse_max_field_size() -> None:
+    with pytest.raises(IOError):
+        parse(BODY, max_field_size=5)
+
+
+def test_parse_max_size() -> None:
+    with pytest.raises(IOError):
+        parse(BODY, max_size=50)
+
+
+def test_parse_unterminated_body() -> None:
+    with pytest.raises(ValueError):
+        parse(BODY[:-24])
+
+
+def test_parse_missing_name() -> None:
+    body = b'--boundary\r\nContent-Disposition: form-data\r\n\r\nHello\r\n--boundary--'
+
+    with pytest.raises(ValueError):
+        parse(body)
+
+
+def test_request_multipart() -> None:
+    request = Request(
+        method='POST',
+        headers={
+            'Content-Type': 'multipart/form-data; boundary=boundary',
+            'Content-Length': str(len(BODY)),
+        },
+        body=BODY,
+    )
+
+    assert request.attributes == {'message': 'Hello World'}
+    assert request.files['file'].filename == 'hello.txt'
+    request.files['file'].close()
+
+
+def test_request_files_without_multipart() -> None:
+    request = Request(
+        method='POST',
+        headers={'Content-Type': 'application/json', 'Content-Length': '2'},
+        body=b'{}',
+    )
+
+    assert request.files == {}
+    assert request.attributes == {}
@@ -3,7 +3,7 @@ from io import BytesIO
 
 import pytest
 
-from rivr.http.request import Query, Request
+from rivr.http.request import MutableQuery, Query, Request
 
 
 def test_query_parse() -> None:
@@ -35,6 +35,86 @@ def test_query_str() -> None:
     assert str(query) == 'message=Hello+World'
 
 
+def test_query_is_parsed_lazily() -> None:
+    query = Query('message=Hello+World')
+    request = Request(query=query)
+
+    assert request.query is query
+    assert query._pairs is None
+
+    assert request.query['message'] == 'Hello World'
+    assert query._pairs == [('message', 'Hello World')]
+
+
+def test_query_multiple_values() -> None:
+    query = Query('tag=a&tag=b&limit=10')
+
+    assert query['tag'] == 'a'
+    assert query.getlist('tag') == ['a', 'b']
+    assert query.getlist('unknown') == []
+    assert query.get('limit') == '10'
+    assert query.get('unknown', 'default') == 'default'
+    assert len(query) == 3
+    assert list(query) == ['tag', 'limit']
+    assert query.items() == [('tag', 'a'), ('tag', 'b'), ('limit', '10')]
+
+
+def test_query_blank_values() -> None:
+    query = Query('message=&limit')
+
+    assert query['message'] == ''
+    assert 'limit' in query
+
+
+def test_query_from_pairs() -> None:
+    query = Query([('tag', 'a'), ('tag', 'b')])
+
+    assert query.getlist('tag') == ['a', 'b']
+    assert str(query) == 'tag=a&tag=b'
+
+
+def test_query_is_immutable() -> None:
+    query = Query('message=Hello')
+
+    with pytest.raises(TypeError):
+        query['message'] = 'Goodbye'  # type: ignore
+
+
+def test_mutable_query() -> None:
+    original = Query('tag=a&page=1&tag=b')
+    query = original.copy()
+
+    assert isinstance(query, MutableQuery)
+    assert str(query) == 'tag=a&page=1&tag=b'
+
+    query['page'] = '2'
+    query.add('limit', '10')
+    query.setlist('tag', ['c'])
+
+    assert str(query) == 'tag=c&page=2&limit=10'
+    assert query['tag'] == 'c'
+
+    del query['tag']
+
+    assert 'tag' not in query
+    assert str(query) == 'page=2&limit=10'
+    assert str(original) == 'tag=a&page=1&tag=b'
+
+
+def test_get_uses_last_value() -> None:
+    request = Request(query=Query('tag=a&tag=b'))
+
+    assert request.GET == {'tag': 'b'}
+
+
+def test_get_returns_copy() -> None:
+    request = Request(query=Query('tag=a'))
+    request.GET['tag'] = 'b'
+
+    assert request.GET == {'tag': 'a'}
+    assert request.query.to_dict() == {'tag': 'a'}
+
+
 def test_init_headers_dict() -> None:
     request = Request(headers={'Content-Type': 'text/plain'})
 
@@ -127,6 +207,118 @@ def test_text_with_content_length_and_chunked_transfer() -> None:
     assert request.text() == '.....'
 
 
+def test_iter_body() -> None:
+    request = Request(headers={'Content-Length': '11'}, body=b'Hello World!')
+
+    assert list(request.iter_body(chunk_size=5)) == [b'Hello', b' Worl', b'd']
+    assert request.body.read() == b'!'
+
+
+def test_iter_body_chunked() -> None:
+    request = Request(headers={'Transfer-Encoding': 'chunked'}, body=b'Hello World')
+
+    assert list(request.iter_body(chunk_size=6)) == [b'Hello ', b'World']
+
+
+def test_json() -> None:
+    request = Request(
+        headers={'Content-Length': '16'},
+        body=b'{"name": "Kyle"}',
+    )
+
+    assert request.json() == {'name': 'Kyle'}
+
+
+def test_json_too_big() -> None:
+    request = Request(headers={'Content-Length': '16'}, body=b'{"name": "Kyle"}')
+
+    with pytest.raises(IOError):
+        request.json(max_bytes=10)
+
+
+def test_json_custom_decoder() -> None:
+    class CustomRequest(Request):
+        json_decoder = staticmethod(lambda data: data.decode('utf-8'))
+
+    request = CustomRequest(headers={'Content-Length': '2'}, body=b'{}')
+
+    assert request.json() == '{}'
+
+
+def test_attributes_json() -> None:
+    request = Request(
+        headers={'Content-Type': 'application/merge-patch+json', 'Content-Length': '9'},
+        body=b'{"a": 1}\n',
+    )
+
+    assert request.attributes == {'a': 1}
+
+
+def test_attributes_form() -> None:
+    request = Request(
+        headers={
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Content-Length': '11',
+        },
+        body=b'a=1&b=Hello',
+    )
+
+    assert request.attributes == {'a': '1', 'b': 'Hello'}
+
+
+def test_attributes_too_big() -> None:
+    class LimitedRequest(Request):
+        max_body_size = 5
+
+    request = LimitedRequest(
+        headers={'Content-Type': 'application/json', 'Content-Length': '9'},
+        body=b'{"a": 1}\n',
+    )
+
+    with pytest.raises(IOError):
+        request.attributes
+
+
+def test_attributes_unsupported_content_type() -> None:
+    request = Request(headers={'Content-Type': 'text/plain'}, body=b'Hello')
+
+    assert request.attributes == {}
+
+
+def test_ndjson() -> None:
+    body = b'{"id": 1}\n\n{"id": 2}\r\n{"id": 3}'
+    request = Request(headers={'Content-Length': str(len(body))}, body=body)
+
+    assert list(request.ndjson()) == [{'id': 1}, {'id': 2}, {'id': 3}]
+
+
+def test_ndjson_chunked() -> None:
+    request = Request(
+        headers={'Transfer-Encoding': 'chunked'},
+        body=b'{"id": 1}\n{"id": 2}\n',
+    )
+
+    assert list(request.ndjson()) == [{'id': 1}, {'id': 2}]
+
+
+def test_ndjson_record_too_big() -> None:
+    body = b'{"id": 1}\n{"name": "' + b'a' * 100 + b'"}\n'
+    request = Request(headers={'Content-Length': str(len(body))}, body=body)
+    records = request.ndjson(max_record_size=50)
+
+    assert next(records) == {'id': 1}
+    with pytest.raises(IOError):
+        next(records)
+
+
+def test_ndjson_invalid_record() -> None:
+    body = b'{"id": 1}\n{"id"\n'
+    request = Request(headers={'Content-Length': str(len(body))}, body=body)
+
+    with pytest.raises(ValueError):
+        list(request.ndjson())
+
+
 def test_cookies() -> None:
     request = Request(headers={'Cookie': 'name=Kyle; username=kylef'})
 
@@ -194,6 +386,14 @@ def test_if_modified_since() -> None:
     )
 
 
+def test_if_modified_since_asctime() -> None:
+    request = Request(headers={'If-Modified-Since': 'Sun Nov  6 08:49:37 1994'})
+
+    assert request.if_modified_since == datetime.datetime(
+        1994, 11, 6, 8, 49, 37, tzinfo=datetime.timezone.utc
+    )
+
+
 def test_if_unmodified_since() -> None:
     request = Request(headers={})
     assert request.if_unmodified_since is None
@@ -209,3 +409,39 @@ def test_if_unmodified_since() -> None:
     assert request.if_unmodified_since == datetime.datetime(
         1994, 10, 29, 19, 43, 31, tzinfo=datetime.timezone.utc
     )
+
+
+def test_range() -> None:
+    request = Request(headers={})
+    assert request.range is None
+
+    request = Request(headers={'Range': 'bytes=0-499, 500-, -200'})
+    assert request.range == [(0, 499), (500, None), (None, 200)]
+
+
+def test_range_invalid() -> None:
+    for value in ('items=0-5', 'bytes=5-0', 'bytes=-', 'bytes=a-5', 'bytes=0-5,'):
+        request = Request(headers={'Range': value})
+        assert request.range is None
+
+
+def test_accept_encoding() -> None:
+    request = Request(headers={})
+    assert request.accept_encoding is None
+
+    request = Request(headers={'Accept-Encoding': 'gzip, BR;q=0.5, deflate;q=0'})
+    assert request.accept_encoding == {'gzip': 1.0, 'br': 0.5, 'deflate': 0.0}
+
+
+def test_accepts_encoding() -> None:
+    request = Request(headers={'Accept-Encoding': 'gzip, deflate;q=0'})
+    assert request.accepts_encoding('gzip')
+    assert not request.accepts_encoding('deflate')
+    assert not request.accepts_encoding('br')
+
+    request = Request(headers={'Accept-Encoding': '*, deflate;q=0'})
+    assert request.accepts_encoding('br')
+    assert not request.accepts_encoding('deflate')
+
+    request = Request(headers={})
+    assert not request.accepts_encoding('gzip')
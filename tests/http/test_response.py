@@ -1,7 +1,11 @@
 import datetime
 import unittest
+from io import BytesIO
+from pathlib import Path
 
 from rivr.http import (
+    FileResponse,
+    JSONResponse,
     MediaType,
     Response,
     ResponseNoContent,
@@ -10,6 +14,8 @@ from rivr.http import (
     ResponseNotModified,
     ResponsePermanentRedirect,
     ResponseRedirect,
+    StreamingJSONResponse,
+    StreamingResponse,
 )
 
 
@@ -23,6 +29,60 @@ class ResponseTest(unittest.TestCase):
         response = Response(status=302)
         assert response.status_code == 302
 
+    def test_content_is_encoded(self) -> None:
+        response = Response('👍')
+
+        assert response.content == '👍'.encode('utf-8')
+        assert response.headers['Content-Length'] == '4'
+
+    def test_setting_content_updates_content_length(self) -> None:
+        response = Response(b'Hello')
+        response.content = b'Hello World'
+
+        assert response.content_length == 11
+
+    def test_no_content_length_without_content(self) -> None:
+        assert ResponseNoContent().headers['Content-Length'] is None
+        assert ResponseNotModified().headers['Content-Length'] is None
+
+    def test_content_type_is_not_parsed(self) -> None:
+        response = Response()
+
+        assert response.headers['Content-Type'] == 'text/html; charset=utf8'
+        assert response.headers._parsed == {}
+
+    def test_cookies_are_created_lazily(self) -> None:
+        response = Response()
+
+        assert response._cookies is None
+        assert 'Set-Cookie' not in dict(response.headers_items())
+
+        response.set_cookie('name', 'value')
+
+        assert response.cookies['name'].value == 'value'
+
+    def test_set_cookie_headers_are_serialised_once(self) -> None:
+        response = Response()
+        response.set_cookie('name', 'value')
+
+        headers = response.headers_items()
+        assert ('Set-Cookie', 'name=value; Path=/') in headers
+        assert response._set_cookie_headers is not None
+        assert response.headers_items() == headers
+
+        response.set_cookie('name', 'changed')
+        assert ('Set-Cookie', 'name=changed; Path=/') in response.headers_items()
+
+        response.cookies['name']['path'] = '/other/'
+        assert ('Set-Cookie', 'name=changed; Path=/other/') in (
+            response.headers_items()
+        )
+
+        response.delete_cookie('name')
+        assert dict(response.headers_items())['Set-Cookie'].startswith(
+            'name=""; expires=Thu, 01-Jan-1970 00:00:00 GMT'
+        )
+
     def test_content_type_str(self) -> None:
         response = Response(content_type='application/json')
         assert response.content_type == MediaType('application', 'json')
@@ -74,6 +134,7 @@ class ResponseTest(unittest.TestCase):
         assert sorted(response.headers_items()) == sorted(
             [
                 ('Content-Type', 'text/html; charset=utf8'),
+                ('Content-Length', '0'),
                 ('Location', '/'),
                 (
                     'Set-Cookie',
@@ -84,11 +145,156 @@ class ResponseTest(unittest.TestCase):
 
     def test_to_string(self) -> None:
         response = Response('Hello World')
-        assert str(response) == 'Content-Type: text/html; charset=utf8\n\nHello World'
+        assert str(response) == (
+            'Content-Type: text/html; charset=utf8\nContent-Length: 11\n\nHello World'
+        )
 
     def test_to_string_bytes_content(self) -> None:
         response = Response(b'Hello World')
-        assert str(response) == 'Content-Type: text/html; charset=utf8\n\nHello World'
+        assert str(response) == (
+            'Content-Type: text/html; charset=utf8\nContent-Length: 11\n\nHello World'
+        )
+
+    def test_to_string_binary_content(self) -> None:
+        response = Response(b'\xff', content_type=None)
+        assert str(response) == 'Content-Length: 1\n\n\ufffd'
+
+    def test_omits_content_length_after_status_change(self) -> None:
+        response = Response()
+        response.status_code = 204
+
+        assert 'Content-Length' not in dict(response.headers_items())
+
+
+class StreamingResponseTest(unittest.TestCase):
+    def test_iterates_content_as_bytes(self) -> None:
+        response = StreamingResponse(['Hello', b' ', 'World'])
+        assert list(response) == [b'Hello', b' ', b'World']
+
+    def test_content(self) -> None:
+        response = StreamingResponse(iter(['Hello', ' World']))
+        assert response.content == b'Hello World'
+
+    def test_setting_content_closes_iterable(self) -> None:
+        closed = []
+
+        def generate():
+            try:
+                yield 'Hello'
+            finally:
+                closed.append(True)
+
+        content = generate()
+        next(content)
+
+        response = StreamingResponse(content)
+        response.content = ''
+
+        assert closed == [True]
+        assert list(response) == []
+
+    def test_close(self) -> None:
+        closed = []
+
+        def generate():
+            try:
+                yield 'Hello'
+                yield 'World'
+            finally:
+                closed.append(True)
+
+        response = StreamingResponse(generate())
+        assert next(iter(response)) == b'Hello'
+
+        response.close()
+        assert closed == [True]
+
+
+class JSONResponseTest(unittest.TestCase):
+    def test_content(self) -> None:
+        response = JSONResponse({'name': 'Kyle', 'emoji': '👍'})
+
+        assert response.content == '{"name":"Kyle","emoji":"👍"}'.encode('utf-8')
+        assert response.headers['Content-Type'] == 'application/json'
+        assert response.content_length == len(response.content)
+
+    def test_status(self) -> None:
+        response = JSONResponse([], status=201)
+
+        assert response.status_code == 201
+        assert response.content == b'[]'
+
+    def test_custom_encoder(self) -> None:
+        class CustomJSONResponse(JSONResponse):
+            encoder = staticmethod(lambda value: repr(value).encode('utf-8'))
+
+        response = CustomJSONResponse(None)
+
+        assert response.content == b'None'
+
+
+class StreamingJSONResponseTest(unittest.TestCase):
+    def test_content(self) -> None:
+        response = StreamingJSONResponse({'id': i} for i in range(3))
+
+        assert response.content == b'[{"id":0},{"id":1},{"id":2}]'
+        assert response.headers['Content-Type'] == 'application/json'
+        assert response.headers['Content-Length'] is None
+
+    def test_empty(self) -> None:
+        response = StreamingJSONResponse([])
+
+        assert response.content == b'[]'
+
+    def test_close_closes_items(self) -> None:
+        closed = []
+
+        def generate():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+
+        items = generate()
+        next(items)
+
+        response = StreamingJSONResponse(items)
+        response.close()
+
+        assert closed == [True]
+
+
+class FileResponseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        path = Path(__file__).parent.parent / 'views' / 'fixture' / 'file1.py'
+        self.file = open(path, 'rb')
+
+    def tearDown(self) -> None:
+        self.file.close()
+
+    def test_content_length(self) -> None:
+        response = FileResponse(self.file)
+        assert response.headers['Content-Length'] == '21'
+
+    def test_reads_file_in_chunks(self) -> None:
+        response = FileResponse(self.file)
+        response.block_size = 8
+
+        assert list(response) == [b"print('H", b"ello Wor", b"ld')\n"]
+        assert self.file.closed
+
+    def test_content_length_without_file_descriptor(self) -> None:
+        response = FileResponse(BytesIO(b'Hello World'))
+
+        assert response.headers['Content-Length'] is None
+        assert response.content == b'Hello World'
+
+    def test_close_closes_file(self) -> None:
+        response = FileResponse(self.file)
+        response.close()
+
+        assert self.file.closed
 
 
 class ResponseNoContentTest(unittest.TestCase):
@@ -0,0 +1,80 @@
+from io import BytesIO
+
+import pytest
+
+from rivr.http.serialization import iter_lines, iter_ndjson
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5, 1024])
+def test_iter_lines(chunk_size: int) -> None:
+    stream = BytesIO(b'one\ntwo\r\n\nthree')
+
+    assert list(iter_lines(stream, chunk_size=chunk_size)) == [
+        b'one',
+        b'two',
+        b'three',
+    ]
+
+
+def test_iter_lines_reads_only_length() -> None:
+    stream = BytesIO(b'one\ntwo\nthree')
+
+    assert list(iter_lines(stream, length=8)) == [b'one', b'two']
+    assert stream.read() == b'three'
+
+
+def test_iter_lines_max_line_size() -> None:
+    stream = BytesIO(b'one\n' + b'a' * 20)
+
+    lines = iter_lines(stream, chunk_size=4, max_line_size=10)
+    assert next(lines) == b'one'
+
+    with pytest.raises(IOError):
+        next(lines)
+
+
+def test_iter_ndjson_decoder() -> None:
+    stream = BytesIO(b'1\n2\n')
+
+    assert list(iter_ndjson(stream, decoder=int)) == [1, 2]
+
+
+@pytest.mark.parametrize('has_orjson', [True, False])
+def test_loads(monkeypatch, has_orjson: bool) -> None:
+    from rivr.http import serialization
+
+    if has_orjson and not serialization.HAS_ORJSON:
+        pytest.skip('orjson is not installed')
+
+    monkeypatch.setattr(serialization, 'HAS_ORJSON', has_orjson)
+
+    assert serialization.loads(b'{"name": "Kyle"}') == {'name': 'Kyle'}
+
+    with pytest.raises(ValueError):
+        serialization.loads(b'{"name"')
+
+
+def test_dumps() -> None:
+    from rivr.http.serialization import dumps
+
+    assert dumps({'emoji': '👍'}) == '{"emoji":"👍"}'.encode('utf-8')
+
+
+def test_dumps_without_orjson(monkeypatch) -> None:
+    from rivr.http import serialization
+
+    monkeypatch.setattr(serialization, 'HAS_ORJSON', False)
+    monkeypatch.setattr(serialization, 'HAS_UJSON', False)
+
+    assert serialization.dumps({'emoji': '👍', 'list': [1, 2]}) == (
+        '{"emoji":"👍","list":[1,2]}'.encode('utf-8')
+    )
+
+
+def test_iter_json_array_buffers_chunks() -> None:
+    from rivr.http.serialization import iter_json_array
+
+    chunks = list(iter_json_array(range(10), buffer_size=4))
+
+    assert b''.join(chunks) == b'[0,1,2,3,4,5,6,7,8,9]'
+    assert len(chunks) > 1
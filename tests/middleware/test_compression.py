@@ -0,0 +1,170 @@
+import gzip
+import unittest
+import zlib
+
+from rivr.http import Request, Response, StreamingResponse
+from rivr.middleware.compression import CompressionMiddleware
+
+CONTENT = '{"message": "Hello World"}' * 20
+
+
+class CompressionMiddlewareTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.middleware = CompressionMiddleware()
+
+    def view(self, request: Request) -> Response:
+        response = Response(CONTENT, content_type='application/json')
+        response.headers['ETag'] = '"1"'
+        return response
+
+    def test_compresses_gzip(self) -> None:
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(self.view, request)
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Content-Length'] == str(len(response.content))
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert response.headers['ETag'] == 'W/"1"'
+        assert gzip.decompress(response.content) == CONTENT.encode('utf-8')
+
+    def test_compresses_deflate(self) -> None:
+        request = Request(headers={'Accept-Encoding': 'deflate'})
+        response = self.middleware.dispatch(self.view, request)
+
+        assert response.headers['Content-Encoding'] == 'deflate'
+        assert zlib.decompress(response.content) == CONTENT.encode('utf-8')
+
+    def test_prefers_highest_quality(self) -> None:
+        request = Request(headers={'Accept-Encoding': 'gzip;q=0.5, deflate'})
+        response = self.middleware.dispatch(self.view, request)
+
+        assert response.headers['Content-Encoding'] == 'deflate'
+
+    def test_does_not_compress_without_accept_encoding(self) -> None:
+        response = self.middleware.dispatch(self.view, Request())
+
+        assert response.headers['Content-Encoding'] is None
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert response.content == CONTENT.encode('utf-8')
+
+    def test_does_not_compress_small_responses(self) -> None:
+        def view(request: Request) -> Response:
+            return Response('{}', content_type='application/json')
+
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(view, request)
+
+        assert response.headers['Content-Encoding'] is None
+
+    def test_does_not_compress_media_types(self) -> None:
+        def view(request: Request) -> Response:
+            return Response(b'.' * 1000, content_type='image/png')
+
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(view, request)
+
+        assert response.headers['Content-Encoding'] is None
+        assert response.headers['Vary'] is None
+
+    def test_compresses_structured_syntax_suffix(self) -> None:
+        def view(request: Request) -> Response:
+            return Response(CONTENT, content_type='application/problem+json')
+
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(view, request)
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+
+    def test_does_not_compress_encoded_responses(self) -> None:
+        def view(request: Request) -> Response:
+            response = Response(CONTENT)
+            response.headers['Content-Encoding'] = 'br'
+            return response
+
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(view, request)
+
+        assert response.headers['Content-Encoding'] == 'br'
+        assert response.content == CONTENT.encode('utf-8')
+
+    def test_appends_vary(self) -> None:
+        def view(request: Request) -> Response:
+            response = Response(CONTENT)
+            response.headers['Vary'] = 'Cookie'
+            return response
+
+        response = self.middleware.dispatch(view, Request())
+
+        assert response.headers['Vary'] == 'Cookie, Accept-Encoding'
+
+    def test_compresses_streaming_response(self) -> None:
+        consumed = []
+
+        def generate():
+            for line in range(100):
+                consumed.append(line)
+                yield 'line %s\n' % line
+
+        def view(request: Request) -> Response:
+            response = StreamingResponse(generate(), content_type='text/csv')
+            response.set_cookie('name', 'value')
+            return response
+
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(view, request)
+
+        assert isinstance(response, StreamingResponse)
+        assert consumed == []
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Content-Type'] == 'text/csv'
+        assert response.cookies['name'].value == 'value'
+
+        expected = ''.join('line %s\n' % line for line in range(100))
+        assert gzip.decompress(response.content) == expected.encode('utf-8')
+
+    def test_flushes_each_streaming_chunk(self) -> None:
+        def view(request: Request) -> Response:
+            return StreamingResponse(
+                iter(['data: first\n\n', 'data: second\n\n']),
+                content_type='text/event-stream',
+            )
+
+        request = Request(headers={'Accept-Encoding': 'deflate'})
+        response = self.middleware.dispatch(view, request)
+        decompressor = zlib.decompressobj()
+        chunks = iter(response)
+
+        assert decompressor.decompress(next(chunks)) == b'data: first\n\n'
+        assert decompressor.decompress(next(chunks)) == b'data: second\n\n'
+        response.close()
+
+    def test_does_not_create_cookies(self) -> None:
+        def view(request: Request) -> Response:
+            return StreamingResponse(iter([CONTENT]), content_type='text/plain')
+
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(view, request)
+
+        assert response._cookies is None
+        response.close()
+
+    def test_closes_streaming_response(self) -> None:
+        closed = []
+
+        def generate():
+            try:
+                yield 'Hello World'
+            finally:
+                closed.append(True)
+
+        content = generate()
+        next(content)
+
+        def view(request: Request) -> Response:
+            return StreamingResponse(content)
+
+        request = Request(headers={'Accept-Encoding': 'gzip'})
+        response = self.middleware.dispatch(view, request)
+        response.close()
+
+        assert closed == [True]
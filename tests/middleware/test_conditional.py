@@ -0,0 +1,124 @@
+import unittest
+
+from rivr.http import Request, Response, StreamingResponse
+from rivr.middleware.conditional import ConditionalMiddleware
+
+
+class ConditionalMiddlewareTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.middleware = ConditionalMiddleware()
+
+    def view(self, request: Request) -> Response:
+        response = Response('Hello World')
+        response.headers['ETag'] = '"1"'
+        response.headers['Cache-Control'] = 'max-age=60'
+        response.set_cookie('name', 'value')
+        return response
+
+    def test_returns_response_without_conditions(self) -> None:
+        response = self.middleware.dispatch(self.view, Request())
+
+        assert response.status_code == 200
+        assert response.content == b'Hello World'
+
+    def test_not_modified(self) -> None:
+        response = self.middleware.dispatch(
+            self.view, Request(headers={'If-None-Match': '"1"'})
+        )
+
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['ETag'] == '"1"'
+        assert response.headers['Cache-Control'] == 'max-age=60'
+        assert response.headers['Content-Type'] is None
+        assert response.cookies['name'].value == 'value'
+
+    def test_precondition_failed(self) -> None:
+        response = self.middleware.dispatch(
+            self.view, Request(headers={'If-Match': '"2"'})
+        )
+
+        assert response.status_code == 412
+
+    def test_not_modified_since_asctime(self) -> None:
+        def view(request: Request) -> Response:
+            response = Response('Hello World')
+            response.headers['Last-Modified'] = 'Sat, 13 Jul 2024 19:47:43 GMT'
+            return response
+
+        response = self.middleware.dispatch(
+            view, Request(headers={'If-Modified-Since': 'Sat Jul 13 19:47:43 2024'})
+        )
+
+        assert response.status_code == 304
+
+    def test_ignores_unsafe_methods(self) -> None:
+        response = self.middleware.dispatch(
+            self.view, Request(method='PUT', headers={'If-Match': '"2"'})
+        )
+
+        assert response.status_code == 200
+        assert response.content == b'Hello World'
+
+    def test_ignores_unsuccessful_responses(self) -> None:
+        def view(request: Request) -> Response:
+            return Response('Not Found', status=404)
+
+        response = self.middleware.dispatch(
+            view, Request(headers={'If-None-Match': '*'})
+        )
+
+        assert response.status_code == 404
+
+    def test_does_not_generate_etag_by_default(self) -> None:
+        def view(request: Request) -> Response:
+            return Response('Hello World')
+
+        response = self.middleware.dispatch(view, Request())
+        assert response.headers['ETag'] is None
+
+    def test_generates_etag(self) -> None:
+        def view(request: Request) -> Response:
+            return Response('Hello World')
+
+        self.middleware.generate_etag = True
+        response = self.middleware.dispatch(view, Request())
+        etag = response.headers['ETag']
+        assert etag.startswith('W/"')
+
+        response = self.middleware.dispatch(
+            view, Request(headers={'If-None-Match': etag})
+        )
+        assert response.status_code == 304
+
+    def test_does_not_generate_etag_for_streaming_response(self) -> None:
+        def view(request: Request) -> Response:
+            return StreamingResponse(['Hello World'])
+
+        self.middleware.generate_etag = True
+        response = self.middleware.dispatch(view, Request())
+        assert response.headers['ETag'] is None
+
+    def test_closes_streaming_response(self) -> None:
+        closed = []
+
+        def generate():
+            try:
+                yield 'Hello World'
+            finally:
+                closed.append(True)
+
+        content = generate()
+        next(content)
+
+        def view(request: Request) -> Response:
+            response = StreamingResponse(content)
+            response.headers['ETag'] = '"1"'
+            return response
+
+        response = self.middleware.dispatch(
+            view, Request(headers={'If-None-Match': '"1"'})
+        )
+
+        assert response.status_code == 304
+        assert closed == [True]
@@ -50,3 +50,43 @@ class MiddlewareControllerTests(unittest.TestCase):
         response = self.controller.process_exception(Request('/', 'GET'), Exception())
         assert self.middleware.processed_exception == 1
         assert response == self.middleware.response
+
+
+class AsyncMiddlewareControllerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_async_middleware(self) -> None:
+        processed = []
+
+        class AsyncMiddleware(Middleware):
+            async def process_request(self, request: Request) -> Optional[Response]:
+                processed.append('request')
+                return None
+
+            async def process_response(
+                self, request: Request, response: Response
+            ) -> Response:
+                processed.append('response')
+                return response
+
+        def view(request: Request) -> Response:
+            return Response('Hello World')
+
+        controller = MiddlewareController(TestMiddleware(), AsyncMiddleware())
+        assert controller.is_async()
+
+        response = await controller.dispatch(view, Request('/', 'GET'))  # type: ignore
+
+        assert response.content == b'Hello World'
+        assert processed == ['request', 'response']
+
+    async def test_sync_middleware_with_async_view(self) -> None:
+        middleware = TestMiddleware()
+
+        async def view(request: Request) -> Response:
+            return Response('Hello World')
+
+        wrapped = MiddlewareController.wrap(view, middleware)
+        response = await wrapped(Request('/', 'GET'))  # type: ignore
+
+        assert response.content == b'Hello World'
+        assert middleware.processed_request == 1
+        assert middleware.processed_response == 1
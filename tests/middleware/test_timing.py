@@ -0,0 +1,160 @@
+import asyncio
+import unittest
+from typing import List, Optional
+
+from rivr.http import Request, Response
+from rivr.middleware import Middleware, MiddlewareController
+from rivr.middleware.timing import TimingMiddleware
+from rivr.router import Router, url
+from rivr.timing import Timing, current_timing, measure
+
+
+class NoopMiddleware(Middleware):
+    def process_request(self, request: Request) -> Optional[Response]:
+        return None
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        return response
+
+
+def view(request: Request) -> Response:
+    with measure('database'):
+        pass
+
+    return Response('Hello World')
+
+
+class TimingMiddlewareTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(TimingMiddlewareTests, self).setUp()
+        self.timings: List[Timing] = []
+        self.responses: List[Optional[Response]] = []
+
+    def sink(
+        self, request: Request, response: Optional[Response], timing: Timing
+    ) -> None:
+        self.responses.append(response)
+        self.timings.append(timing)
+
+    def test_records_stages(self) -> None:
+        router = Router(url(r'^$', view))
+        app = MiddlewareController.wrap(
+            router, TimingMiddleware(sink=self.sink), NoopMiddleware()
+        )
+
+        response = app(Request('/'))
+
+        assert self.responses == [response]
+        assert [metric.name for metric in self.timings[0]] == [
+            'NoopMiddleware.process_request',
+            'route',
+            'database',
+            'view',
+            'NoopMiddleware.process_response',
+            'total',
+        ]
+        assert all(metric.duration >= 0 for metric in self.timings[0])
+        assert current_timing.get() is None
+
+    def test_server_timing_header(self) -> None:
+        app = MiddlewareController.wrap(view, TimingMiddleware())
+        response = app(Request('/'))
+
+        names = [
+            metric.split(';')[0]
+            for metric in response.headers['Server-Timing'].split(', ')
+        ]
+        assert names == ['database', 'view', 'total']
+
+    def test_disable_server_timing_header(self) -> None:
+        app = MiddlewareController.wrap(
+            view, TimingMiddleware(server_timing=False, sink=self.sink)
+        )
+        response = app(Request('/'))
+
+        assert response.headers['Server-Timing'] is None
+        assert len(self.timings) == 1
+
+    def test_exception(self) -> None:
+        def failing_view(request: Request) -> Response:
+            raise ValueError()
+
+        app = MiddlewareController.wrap(failing_view, TimingMiddleware(sink=self.sink))
+
+        with self.assertRaises(ValueError):
+            app(Request('/'))
+
+        assert self.responses == [None]
+        assert [metric.name for metric in self.timings[0]] == ['view', 'total']
+        assert current_timing.get() is None
+
+    def test_measure_without_timing(self) -> None:
+        with measure('database'):
+            pass
+
+        assert current_timing.get() is None
+
+
+class AsyncTimingMiddlewareTests(unittest.IsolatedAsyncioTestCase):
+    async def test_records_async_view(self) -> None:
+        timings: List[Timing] = []
+
+        async def async_view(request: Request) -> Response:
+            return Response('Hello World')
+
+        app = MiddlewareController.wrap(
+            async_view,
+            TimingMiddleware(
+                sink=lambda request, response, timing: timings.append(timing)
+            ),
+            NoopMiddleware(),
+        )
+        response = await app(Request('/'))
+
+        assert response.headers['Server-Timing']
+        assert [metric.name for metric in timings[0]] == [
+            'NoopMiddleware.process_request',
+            'view',
+            'NoopMiddleware.process_response',
+            'total',
+        ]
+
+
+    async def test_records_async_view_of_router(self) -> None:
+        timings: List[Timing] = []
+
+        async def async_view(request: Request) -> Response:
+            await asyncio.sleep(0.05)
+            return Response('Hello World')
+
+        app = MiddlewareController.wrap(
+            Router(url(r'^$', async_view)),
+            TimingMiddleware(
+                sink=lambda request, response, timing: timings.append(timing)
+            ),
+        )
+        await app(Request('/'))
+
+        metrics = {metric.name: metric for metric in timings[0]}
+        assert metrics['view'].duration >= 0.05
+        assert [metric.name for metric in timings[0]].count('view') == 1
+
+
+class TimingTests(unittest.TestCase):
+    def test_server_timing(self) -> None:
+        timing = Timing()
+        timing.record('route', 0.0005)
+        timing.record('view', 0.012)
+
+        assert timing.server_timing() == 'route;dur=0.500, view;dur=12.000'
+
+    def test_measure_records_cpu_time(self) -> None:
+        timing = Timing()
+
+        with timing.measure('work'):
+            sum(range(10000))
+
+        metric = timing.metrics[0]
+        assert metric.name == 'work'
+        assert metric.duration > 0
+        assert metric.cpu_duration >= 0
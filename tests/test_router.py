@@ -3,7 +3,7 @@ import unittest
 import pytest
 
 from rivr import Request, Response
-from rivr.router import Resolver404, Router
+from rivr.router import Resolver404, Router, include, literal_prefix
 from rivr.views import View
 
 
@@ -54,7 +54,7 @@ class RouterTest(unittest.TestCase):
 
         response = r(Request('/test/'))
         assert response.status_code == 200
-        assert response.content == 'It works'
+        assert response.content == b'It works'
 
     def test_append_slashes(self) -> None:
         def func(request: Request) -> Response:
@@ -81,3 +81,167 @@ class RouterTest(unittest.TestCase):
             (r'^/test2/$', func),
         )
         assert len(router.urlpatterns) == 2
+
+
+class CompiledRouterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.router = Router()
+        self.router.compiled = True
+
+    def test_resolves_prefixed_patterns(self) -> None:
+        def func(request: Request) -> Response:
+            return Response()
+
+        self.router.register(r'^test/(?P<slug>[-\w]+)/$', func)
+
+        assert self.router.resolve('test/rivr/') == (func, (), {'slug': 'rivr'})
+
+        with pytest.raises(Resolver404):
+            self.router.resolve('other/rivr/')
+
+    def test_resolves_first_matching_pattern(self) -> None:
+        def first(request: Request) -> Response:
+            return Response()
+
+        def second(request: Request) -> Response:
+            return Response()
+
+        self.router.register(r'^(?P<slug>[-\w]+)/$', first)
+        self.router.register(r'^test/$', second)
+        self.router.register(r'^te', second)
+
+        assert self.router.resolve('test/') == (first, (), {'slug': 'test'})
+        assert self.router.resolve('test') == (second, (), {})
+
+    def test_resolves_unanchored_patterns(self) -> None:
+        def func(request: Request) -> Response:
+            return Response()
+
+        self.router.register(r'test/$', func)
+
+        assert self.router.resolve('prefix/test/') == (func, (), {})
+
+    def test_rebuilds_when_patterns_change(self) -> None:
+        def func(request: Request) -> Response:
+            return Response()
+
+        with pytest.raises(Resolver404):
+            self.router.resolve('test/')
+
+        self.router += Router((r'^test/$', func))
+
+        assert self.router.resolve('test/') == (func, (), {})
+
+    def test_included_router(self) -> None:
+        def func(request: Request) -> Response:
+            return Response()
+
+        included = Router((r'^(\d+)/$', func))
+        self.router.register(r'^users/', include(included))
+
+        assert self.router.resolve('users/5/') == (func, ('5',), {})
+
+        with pytest.raises(Resolver404):
+            self.router.resolve('users/rivr/')
+
+
+class LiteralPrefixTest(unittest.TestCase):
+    def test_anchored_literal(self) -> None:
+        assert literal_prefix(r'^test/$') == 'test/'
+
+    def test_escaped_characters(self) -> None:
+        assert literal_prefix(r'^robots\.txt$') == 'robots.txt'
+
+    def test_stops_at_groups(self) -> None:
+        assert literal_prefix(r'^users/(?P<id>\d+)/$') == 'users/'
+
+    def test_excludes_optional_character(self) -> None:
+        assert literal_prefix(r'^tests?/$') == 'test'
+
+    def test_unanchored(self) -> None:
+        assert literal_prefix(r'test/$') == ''
+
+    def test_alternation(self) -> None:
+        assert literal_prefix(r'^test/|other/') == ''
+
+
+class RouterCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.router = Router((r'^test/(?P<slug>[-\w]+)/$', self.view))
+        self.router.cache_size = 2
+
+    def view(self, request: Request, slug: str) -> Response:
+        return Response(slug)
+
+    def test_caches_match(self) -> None:
+        assert self.router.resolve('test/a/') == (self.view, (), {'slug': 'a'})
+        assert self.router.resolve('test/a/') == (self.view, (), {'slug': 'a'})
+
+        info = self.router.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.currsize == 1
+
+    def test_caches_miss(self) -> None:
+        for _ in range(2):
+            with pytest.raises(Resolver404):
+                self.router.resolve('other/')
+
+        assert self.router.cache_info().hits == 1
+
+    def test_cached_kwargs_are_copied(self) -> None:
+        self.router.resolve('test/a/')[2]['slug'] = 'b'
+
+        assert self.router.resolve('test/a/')[2] == {'slug': 'a'}
+
+    def test_evicts_least_recently_used(self) -> None:
+        self.router.resolve('test/a/')
+        self.router.resolve('test/b/')
+        self.router.resolve('test/a/')
+        self.router.resolve('test/c/')
+
+        info = self.router.cache_info()
+        assert info.evictions == 1
+        assert info.currsize == 2
+
+        self.router.resolve('test/a/')
+        assert self.router.cache_info().hits == 2
+
+    def test_cleared_when_patterns_change(self) -> None:
+        with pytest.raises(Resolver404):
+            self.router.resolve('other/')
+
+        self.router.register(r'^other/$', self.view)
+
+        assert self.router.resolve('other/') == (self.view, (), {})
+
+    def test_included_router_changes(self) -> None:
+        child = Router()
+        parent = Router((r'^api/', include(child)))
+        parent.cache_size = 100
+
+        with pytest.raises(Resolver404):
+            parent.resolve('api/users/')
+
+        child.register(r'^users/$', self.view)
+
+        assert parent.resolve('api/users/') == (self.view, (), {})
+
+    def test_caches_paths_after_unmatched_include(self) -> None:
+        child = Router((r'^users/$', self.view))
+        parent = Router((r'^api/', include(child)), (r'^about/$', self.view))
+        parent.cache_size = 100
+
+        parent.resolve('about/')
+        parent.resolve('about/')
+        with pytest.raises(Resolver404):
+            parent.resolve('missing/')
+        parent.resolve('api/users/')
+
+        info = parent.cache_info()
+        assert info.hits == 1
+        assert info.currsize == 2
+
+    def test_call(self) -> None:
+        response = self.router(Request('/test/rivr/'))
+        assert response.content == b'rivr'
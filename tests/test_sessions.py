@@ -1,9 +1,34 @@
+import asyncio
+import base64
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
 import unittest
+from typing import Dict, List, Sequence
+from unittest import mock
 
 import pytest
 
-from rivr import Request, Response
-from rivr.sessions import BaseSession, MemorySessionStore, SessionMiddleware
+from rivr import MiddlewareController, Request, Response
+from rivr.sessions import (
+    AsyncBaseSessionStore,
+    AsyncSessionMiddleware,
+    BaseSession,
+    MemorySessionStore,
+    SessionMiddleware,
+    SessionResult,
+    SessionStoreInfo,
+)
+from rivr.sessions.cookie import CookieSessionStore
+from rivr.sessions.redis import (
+    AsyncRedisSessionStore,
+    RedisError,
+    RedisSessionStore,
+)
+from rivr.sessions.sqlite import SQLiteSessionStore
 
 
 class SessionMiddlewareTests(unittest.TestCase):
@@ -56,6 +81,17 @@ class BaseSessionTests(unittest.TestCase):
         self.session.clear()
         assert 'key' not in self.session
 
+    def test_setting_same_value_is_unmodified(self) -> None:
+        self.session.data = {'key': 'value'}
+        self.session['key'] = 'value'
+
+        assert not self.session.modified
+
+    def test_clearing_empty_session_is_unmodified(self) -> None:
+        self.session.clear()
+
+        assert not self.session.modified
+
 
 class MemorySessionStoreTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -95,3 +131,742 @@ class MemorySessionStoreTests(unittest.TestCase):
 
         assert len(self.store.sessions) == 1
         assert response.cookies['sessionid'].value
+
+
+class LazySessionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(LazySessionTests, self).setUp()
+        self.store = MemorySessionStore()
+        self.store.save('session-key', {'key': 'value'})
+        self.middleware = SessionMiddleware(session_store=self.store)
+
+    def test_loads_on_first_access(self) -> None:
+        session = self.store('session-key')
+
+        assert not session.loaded
+        assert self.store.info().hits == 0
+
+        assert session['key'] == 'value'
+        assert session.loaded
+        assert self.store.info().hits == 1
+
+    def test_unused_session_is_not_loaded(self) -> None:
+        request = Request()
+        request.cookies['sessionid'] = 'session-key'
+        self.middleware.dispatch(lambda request: Response(), request)
+
+        assert self.store.info().hits == 0
+
+    def test_unmodified_session_is_not_saved(self) -> None:
+        session = self.store('session-key')
+        session['key'] = 'value'
+
+        with mock.patch.object(self.store, 'save') as save:
+            session.save()
+
+        assert not save.called
+
+    def test_existing_session_cookie_is_not_resent(self) -> None:
+        def view(request: Request) -> Response:
+            session = getattr(request, 'session')
+            session['key'] = 'changed'
+            return Response()
+
+        request = Request()
+        request.cookies['sessionid'] = 'session-key'
+        response = self.middleware.dispatch(view, request)
+
+        assert self.store.load('session-key') == {'key': 'changed'}
+        assert 'sessionid' not in response.cookies
+
+    def test_saves_stale_session(self) -> None:
+        def view(request: Request) -> Response:
+            session = getattr(request, 'session')
+            assert session['key'] == 'value'
+            return Response()
+
+        self.store.touch_interval = 60
+        request = Request()
+        request.cookies['sessionid'] = 'session-key'
+
+        with mock.patch.object(self.store, 'save') as save:
+            self.middleware.dispatch(view, request)
+
+        assert not save.called
+
+        now = time.monotonic() + 60
+        with mock.patch('time.monotonic', lambda: now):
+            with mock.patch.object(self.store, 'save') as save:
+                self.middleware.dispatch(view, request)
+
+        save.assert_called_once_with('session-key', {'key': 'value'})
+
+
+class MemorySessionStoreExpiryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(MemorySessionStoreExpiryTests, self).setUp()
+        self.now = 1000.0
+        self.patcher = mock.patch('time.monotonic', lambda: self.now)
+        self.patcher.start()
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+        super(MemorySessionStoreExpiryTests, self).tearDown()
+
+    def test_expires_after_max_age(self) -> None:
+        store = MemorySessionStore(max_age=60)
+        store.save('session-key', {'key': 'value'})
+
+        self.now += 59
+        assert store.load('session-key') == {'key': 'value'}
+
+        self.now += 1
+        assert store.load('session-key') is None
+        assert len(store) == 0
+        assert store.info().expirations == 1
+
+    def test_expires_after_idle_timeout(self) -> None:
+        store = MemorySessionStore(idle_timeout=60)
+        store.save('session-key', {'key': 'value'})
+
+        self.now += 50
+        assert store.load('session-key') == {'key': 'value'}
+
+        self.now += 50
+        assert store.load('session-key') == {'key': 'value'}
+
+        self.now += 60
+        assert store.load('session-key') is None
+
+    def test_save_sweeps_expired_sessions(self) -> None:
+        store = MemorySessionStore(idle_timeout=60)
+        store.save('first', {})
+        store.save('second', {})
+
+        self.now += 30
+        store.save('third', {})
+
+        self.now += 30
+        store.save('fourth', {})
+
+        assert list(store.sessions) == ['third', 'fourth']
+        assert store.info().expirations == 2
+
+    def test_clear_expired(self) -> None:
+        store = MemorySessionStore(max_age=60)
+        store.save('first', {})
+
+        self.now += 30
+        store.save('second', {})
+
+        self.now += 30
+        assert store.clear_expired() == 1
+        assert list(store.sessions) == ['second']
+
+    def test_evicts_least_recently_used(self) -> None:
+        store = MemorySessionStore(max_entries=2)
+        store.save('first', {})
+        store.save('second', {})
+        store.load('first')
+        store.save('third', {})
+
+        assert list(store.sessions) == ['first', 'third']
+        assert store.info() == SessionStoreInfo(
+            hits=1, misses=0, expirations=0, evictions=1, max_entries=2, size=2
+        )
+
+    def test_unsaved_changes_are_not_stored(self) -> None:
+        store = MemorySessionStore()
+        session = store('session-key')
+        session['key'] = 'value'
+        session.save()
+
+        session['key'] = 'changed'
+
+        assert store.load('session-key') == {'key': 'value'}
+
+
+class CookieSessionStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(CookieSessionStoreTests, self).setUp()
+        self.store = CookieSessionStore('secret')
+
+    def test_persists_session_in_cookie(self) -> None:
+        def view(request: Request) -> Response:
+            session = getattr(request, 'session')
+            session['key'] = 'value'
+            return Response()
+
+        middleware = SessionMiddleware(session_store=self.store)
+        response = middleware.dispatch(view, Request())
+        value = response.cookies['sessionid'].value
+
+        assert self.store(value)['key'] == 'value'
+
+    def test_round_trip(self) -> None:
+        value = self.store.dumps({'key': 'value'})
+
+        assert self.store.loads(value) == {'key': 'value'}
+
+    def test_compresses_large_data(self) -> None:
+        data = {'key': 'value' * 200}
+        value = self.store.dumps(data)
+
+        assert value.startswith('.')
+        assert len(value) < 200
+        assert self.store.loads(value) == data
+
+    def test_rejects_modified_data(self) -> None:
+        value = self.store.dumps({'user': 'kyle'})
+        payload, timestamp, signature = value.split('.')
+        forged = base64.urlsafe_b64encode(b'{"user":"admin"}').decode('ascii')
+
+        assert self.store.loads('.'.join([forged, timestamp, signature])) is None
+
+    def test_rejects_other_key(self) -> None:
+        value = CookieSessionStore('other').dumps({'key': 'value'})
+
+        assert self.store.loads(value) is None
+
+    def test_rejects_invalid_value(self) -> None:
+        assert self.store.loads('invalid') is None
+        assert self.store.loads('') is None
+        assert self.store.loads('\u00e9') is None
+
+    def test_rotates_keys(self) -> None:
+        old_value = CookieSessionStore('old').dumps({'key': 'value'})
+        store = CookieSessionStore(['new', 'old'])
+
+        assert store.loads(old_value) == {'key': 'value'}
+        assert CookieSessionStore('new').loads(store.dumps({})) == {}
+
+    def test_expires_after_max_age(self) -> None:
+        value = self.store.dumps({'key': 'value'})
+        expired = time.time() + self.store.max_age + 1
+
+        with mock.patch('time.time', lambda: expired):
+            assert self.store.loads(value) is None
+
+    def test_touch_interval(self) -> None:
+        store = CookieSessionStore('secret', touch_interval=60)
+        value = store.dumps({'key': 'value'})
+        assert store.load_session(value) == ({'key': 'value'}, False)
+
+        later = time.time() + 60
+        with mock.patch('time.time', lambda: later):
+            session = store(value)
+            assert session['key'] == 'value'
+            assert session.stale
+
+    def test_size_guard(self) -> None:
+        data = {'key': os.urandom(4000).hex()}
+
+        with pytest.raises(ValueError):
+            self.store.dumps(data)
+
+    def test_requires_secret_key(self) -> None:
+        with pytest.raises(ValueError):
+            CookieSessionStore([])
+
+
+class SQLiteSessionStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(SQLiteSessionStoreTests, self).setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'sessions.sqlite')
+        self.store = SQLiteSessionStore(self.path)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.directory.cleanup()
+        super(SQLiteSessionStoreTests, self).tearDown()
+
+    def test_persists_session(self) -> None:
+        session = self.store('session-key')
+        session['key'] = 'value'
+        session.save()
+
+        new_session = self.store('session-key')
+        assert new_session['key'] == 'value'
+
+    def test_shares_sessions_between_stores(self) -> None:
+        self.store.save('session-key', {'key': 'value'})
+
+        store = SQLiteSessionStore(self.path)
+        try:
+            assert store.load('session-key') == {'key': 'value'}
+        finally:
+            store.close()
+
+    def test_uses_wal_journal(self) -> None:
+        with self.store.connection() as connection:
+            row = connection.execute('PRAGMA journal_mode').fetchone()
+
+        assert row[0] == 'wal'
+
+    def test_indexes_expiry(self) -> None:
+        with self.store.connection() as connection:
+            rows = connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            ).fetchall()
+
+        assert ('sessions_expires',) in rows
+
+    def test_missing_session(self) -> None:
+        assert self.store.load('missing') is None
+
+    def test_touch_interval(self) -> None:
+        self.store.touch_interval = 60
+        self.store.save('session-key', {'key': 'value'})
+
+        assert self.store.load_session('session-key') == ({'key': 'value'}, False)
+
+        later = time.time() + 60
+        with mock.patch('time.time', lambda: later):
+            data, stale = self.store.load_session('session-key')
+
+        assert stale
+
+    def test_expired_session(self) -> None:
+        self.store.max_age = -1
+        self.store.save('session-key', {'key': 'value'})
+
+        assert self.store.load('session-key') is None
+        assert self.store.clear_expired() == 1
+
+    def test_delete(self) -> None:
+        self.store.save('session-key', {'key': 'value'})
+        self.store.delete('session-key')
+
+        assert self.store.load('session-key') is None
+
+    def test_invalid_data(self) -> None:
+        with self.store.connection() as connection:
+            connection.execute(
+                "INSERT INTO sessions VALUES ('session-key', 'invalid', 1e100)"
+            )
+
+        assert self.store.load('session-key') is None
+
+    def test_reuses_connections(self) -> None:
+        with self.store.connection() as connection:
+            pass
+
+        with self.store.connection() as other:
+            assert other is connection
+
+    def test_concurrent_connections(self) -> None:
+        with self.store.connection() as connection:
+            with self.store.connection() as other:
+                assert other is not connection
+
+        assert len(self.store.idle) == 2
+
+    def test_limits_idle_connections(self) -> None:
+        self.store.max_idle_connections = 1
+
+        with self.store.connection():
+            with self.store.connection():
+                pass
+
+        assert len(self.store.idle) == 1
+
+    def test_threads_return_connections(self) -> None:
+        threads = [
+            threading.Thread(target=self.store.load, args=('session-key',))
+            for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(self.store.idle) <= self.store.max_idle_connections
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+
+            command = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                command.append(self.rfile.read(length + 2)[:-2])
+
+            self.server.commands.append(command)  # type: ignore
+            self.wfile.write(self.server.execute(command))  # type: ignore
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super(FakeRedisServer, self).__init__(('127.0.0.1', 0), FakeRedisHandler)
+        self.data: Dict[bytes, bytes] = {}
+        self.expiry: Dict[bytes, int] = {}
+        self.commands: List[List[bytes]] = []
+        self.connections = 0
+
+    def get_request(self):
+        self.connections += 1
+        return super(FakeRedisServer, self).get_request()
+
+    def execute(self, command: List[bytes]) -> bytes:
+        name = command[0].upper()
+
+        if name == b'GET':
+            value = self.data.get(command[1])
+            if value is None:
+                return b'$-1\r\n'
+            return b'$%d\r\n%s\r\n' % (len(value), value)
+
+        if name == b'SET':
+            self.data[command[1]] = command[2]
+            self.expiry[command[1]] = int(command[4])
+            return b'+OK\r\n'
+
+        if name == b'EXPIRE':
+            if command[1] not in self.data:
+                return b':0\r\n'
+            self.expiry[command[1]] = int(command[2])
+            return b':1\r\n'
+
+        if name == b'DEL':
+            return b':%d\r\n' % (self.data.pop(command[1], None) is not None)
+
+        if name == b'AUTH':
+            if command[1] != b'secret':
+                return b'-WRONGPASS invalid password\r\n'
+            return b'+OK\r\n'
+
+        if name == b'SELECT':
+            return b'+OK\r\n'
+
+        return b'-ERR unknown command\r\n'
+
+
+class RedisSessionStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(RedisSessionStoreTests, self).setUp()
+        self.server = FakeRedisServer()
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,))
+        self.thread.start()
+        self.store = RedisSessionStore(port=self.server.server_address[1])
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        super(RedisSessionStoreTests, self).tearDown()
+
+    def test_persists_session(self) -> None:
+        session = self.store('session-key')
+        session['key'] = 'value'
+        session.save()
+
+        new_session = self.store('session-key')
+        assert new_session['key'] == 'value'
+        assert self.server.data == {b'session:session-key': b'{"key": "value"}'}
+        assert self.server.expiry[b'session:session-key'] == 14 * 24 * 60 * 60
+
+    def test_load_refreshes_expiry(self) -> None:
+        self.store.save('session-key', {'key': 'value'})
+        self.server.expiry[b'session:session-key'] = 1
+
+        assert self.store.load('session-key') == {'key': 'value'}
+        assert self.server.expiry[b'session:session-key'] == 14 * 24 * 60 * 60
+        assert self.server.commands[-2:] == [
+            [b'GET', b'session:session-key'],
+            [b'EXPIRE', b'session:session-key', b'1209600'],
+        ]
+
+    def test_missing_session(self) -> None:
+        assert self.store.load('missing') is None
+
+    def test_delete(self) -> None:
+        self.store.save('session-key', {'key': 'value'})
+        self.store.delete('session-key')
+
+        assert self.store.load('session-key') is None
+
+    def test_reuses_connection(self) -> None:
+        self.store.save('session-key', {'key': 'value'})
+        self.store.load('session-key')
+        self.store.load('session-key')
+
+        assert self.server.connections == 1
+
+    def test_reconnects_closed_connection(self) -> None:
+        self.store.save('session-key', {'key': 'value'})
+        self.store.pool.idle[0].socket.shutdown(socket.SHUT_RDWR)
+
+        assert self.store.load('session-key') == {'key': 'value'}
+        assert self.server.connections == 2
+
+    def test_limits_open_connections(self) -> None:
+        store = RedisSessionStore(
+            port=self.server.server_address[1], timeout=0.01, max_connections=1
+        )
+        store.pool.semaphore.acquire()
+        try:
+            with pytest.raises(ConnectionError):
+                store.load('session-key')
+        finally:
+            store.pool.semaphore.release()
+            store.close()
+
+        assert self.server.connections == 0
+
+    def test_authenticates_and_selects_database(self) -> None:
+        store = RedisSessionStore(
+            port=self.server.server_address[1], db=2, password='secret'
+        )
+        try:
+            store.load('session-key')
+        finally:
+            store.close()
+
+        assert self.server.commands[:2] == [[b'AUTH', b'secret'], [b'SELECT', b'2']]
+
+    def test_error_reply(self) -> None:
+        store = RedisSessionStore(
+            port=self.server.server_address[1], password='invalid'
+        )
+        try:
+            with pytest.raises(RedisError):
+                store.load('session-key')
+        finally:
+            store.close()
+
+
+class AsyncMemorySessionStore(AsyncBaseSessionStore):
+    def __init__(self) -> None:
+        super(AsyncMemorySessionStore, self).__init__()
+        self.sessions: Dict[str, Dict[str, str]] = {}
+        self.batches_loaded: List[List[str]] = []
+
+    async def load_many(self, session_keys: Sequence[str]) -> List[SessionResult]:
+        self.batches_loaded.append(list(session_keys))
+        return [(self.sessions.get(key), False) for key in session_keys]
+
+    async def save(self, session_key: str, data: Dict[str, str]) -> None:
+        self.sessions[session_key] = dict(data)
+
+
+class AsyncSessionStoreTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super(AsyncSessionStoreTests, self).setUp()
+        self.store = AsyncMemorySessionStore()
+        self.store.sessions = {'first': {'key': '1'}, 'second': {'key': '2'}}
+
+    async def test_batches_concurrent_loads(self) -> None:
+        results = await asyncio.gather(
+            self.store.load_session('first'),
+            self.store.load_session('second'),
+            self.store.load_session('first'),
+        )
+
+        assert results == [
+            ({'key': '1'}, False),
+            ({'key': '2'}, False),
+            ({'key': '1'}, False),
+        ]
+        assert self.store.batches_loaded == [['first', 'second']]
+
+    async def test_shares_session_load(self) -> None:
+        session = self.store('first')
+        await asyncio.gather(session.load(), session.load())
+
+        assert session['key'] == '1'
+        assert self.store.batches_loaded == [['first']]
+
+    async def test_load_error_is_raised_to_each_task(self) -> None:
+        async def load_many(session_keys: Sequence[str]) -> List[SessionResult]:
+            raise ConnectionError()
+
+        self.store.load_many = load_many  # type: ignore
+        results = await asyncio.gather(
+            self.store.load_session('first'),
+            self.store.load_session('second'),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    async def test_missing_load_results_are_raised_to_each_task(self) -> None:
+        async def load_many(session_keys: Sequence[str]) -> List[SessionResult]:
+            return [(None, False)]
+
+        self.store.load_many = load_many  # type: ignore
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                self.store.load_session('first'),
+                self.store.load_session('second'),
+                return_exceptions=True,
+            ),
+            1,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_unloaded_session_raises(self) -> None:
+        session = self.store('first')
+
+        with pytest.raises(RuntimeError):
+            session['key']
+
+    async def test_middleware_saves_session(self) -> None:
+        async def view(request: Request) -> Response:
+            session = await getattr(request, 'session').load()
+            session['key'] = 'value'
+            return Response()
+
+        wrapped = AsyncSessionMiddleware.wrap(view, session_store=self.store)
+        response = await wrapped(Request())  # type: ignore
+        session_key = response.cookies['sessionid'].value
+
+        assert self.store.sessions[session_key] == {'key': 'value'}
+
+    async def test_middleware_controller_saves_session(self) -> None:
+        async def view(request: Request) -> Response:
+            session = await getattr(request, 'session').load()
+            session['key'] = 'value'
+            return Response()
+
+        wrapped = MiddlewareController.wrap(
+            view, AsyncSessionMiddleware(session_store=self.store)
+        )
+        response = await wrapped(Request())  # type: ignore
+        session_key = response.cookies['sessionid'].value
+
+        assert self.store.sessions[session_key] == {'key': 'value'}
+
+    async def test_middleware_with_sync_store(self) -> None:
+        def view(request: Request) -> Response:
+            session = getattr(request, 'session')
+            session['key'] = 'value'
+            return Response()
+
+        store = MemorySessionStore()
+        wrapped = AsyncSessionMiddleware.wrap(view, session_store=store)
+        response = await wrapped(Request())  # type: ignore
+        session_key = response.cookies['sessionid'].value
+
+        assert store.load(session_key) == {'key': 'value'}
+
+    async def test_middleware_loads_sync_store_in_executor(self) -> None:
+        threads = []
+
+        class Store(MemorySessionStore):
+            def load_session(self, session_key: str) -> SessionResult:
+                threads.append(threading.current_thread())
+                return super(Store, self).load_session(session_key)
+
+        async def view(request: Request) -> Response:
+            return Response(getattr(request, 'session')['key'])
+
+        store = Store()
+        store.save('session-key', {'key': 'value'})
+        wrapped = AsyncSessionMiddleware.wrap(view, session_store=store)
+        request = Request()
+        request.cookies['sessionid'] = 'session-key'
+        response = await wrapped(request)  # type: ignore
+
+        assert response.content == b'value'
+        assert threads and threading.current_thread() not in threads
+
+    def test_sync_middleware_raises(self) -> None:
+        middleware = SessionMiddleware(session_store=self.store)
+
+        with pytest.raises(Exception):
+            middleware.process_request(Request())
+
+
+class AsyncRedisSessionStoreTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        super(AsyncRedisSessionStoreTests, self).setUp()
+        self.server = FakeRedisServer()
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,))
+        self.thread.start()
+        self.store = AsyncRedisSessionStore(port=self.server.server_address[1], db=1)
+
+    async def asyncTearDown(self) -> None:
+        await self.store.close()
+        await super(AsyncRedisSessionStoreTests, self).asyncTearDown()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        super(AsyncRedisSessionStoreTests, self).tearDown()
+
+    async def test_persists_session(self) -> None:
+        session = await self.store('session-key').load()
+        session['key'] = 'value'
+        await session.save()
+
+        new_session = await self.store('session-key').load()
+        assert new_session['key'] == 'value'
+        assert self.server.data == {b'session:session-key': b'{"key": "value"}'}
+
+    async def test_pipelines_concurrent_loads(self) -> None:
+        await self.store.save('first', {'key': '1'})
+        await self.store.save('second', {'key': '2'})
+
+        results = await asyncio.gather(
+            self.store.load_session('first'),
+            self.store.load_session('second'),
+            self.store.load_session('missing'),
+        )
+
+        assert results == [
+            ({'key': '1'}, False),
+            ({'key': '2'}, False),
+            (None, False),
+        ]
+        assert self.server.commands[-6:] == [
+            [b'GET', b'session:first'],
+            [b'EXPIRE', b'session:first', b'1209600'],
+            [b'GET', b'session:second'],
+            [b'EXPIRE', b'session:second', b'1209600'],
+            [b'GET', b'session:missing'],
+            [b'EXPIRE', b'session:missing', b'1209600'],
+        ]
+        assert self.server.connections == 1
+
+    async def test_selects_database(self) -> None:
+        await self.store.delete('session-key')
+
+        assert self.server.commands == [
+            [b'SELECT', b'1'],
+            [b'DEL', b'session:session-key'],
+        ]
+
+    async def test_limits_open_connections(self) -> None:
+        store = AsyncRedisSessionStore(
+            port=self.server.server_address[1], timeout=0.01, max_connections=1
+        )
+        await store.pool.semaphore.acquire()
+        try:
+            with pytest.raises(ConnectionError):
+                await store.load_session('session-key')
+        finally:
+            store.pool.semaphore.release()
+            await store.close()
+
+        assert self.server.connections == 0
+
+    async def test_reconnects_closed_connection(self) -> None:
+        await self.store.save('session-key', {'key': 'value'})
+        self.store.pool.idle[0].writer.transport.abort()
+        await asyncio.sleep(0)
+
+        assert await self.store.load_session('session-key') == (
+            {'key': 'value'},
+            False,
+        )
+        assert self.server.connections == 2
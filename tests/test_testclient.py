@@ -15,39 +15,39 @@ def client() -> Client:
 
 def test_http(client: Client) -> None:
     response = client.http('METHOD', '/path/')
-    assert response.content == 'METHOD /path/'
+    assert response.content == b'METHOD /path/'
 
 
 def test_options(client: Client) -> None:
     response = client.options('/')
-    assert response.content == 'OPTIONS /'
+    assert response.content == b'OPTIONS /'
 
 
 def test_head(client: Client) -> None:
     response = client.head('/')
-    assert response.content == 'HEAD /'
+    assert response.content == b'HEAD /'
 
 
 def test_get(client: Client) -> None:
     response = client.get('/')
-    assert response.content == 'GET /'
+    assert response.content == b'GET /'
 
 
 def test_put(client: Client) -> None:
     response = client.put('/')
-    assert response.content == 'PUT /'
+    assert response.content == b'PUT /'
 
 
 def test_post(client: Client) -> None:
     response = client.post('/')
-    assert response.content == 'POST /'
+    assert response.content == b'POST /'
 
 
 def test_patch(client: Client) -> None:
     response = client.patch('/')
-    assert response.content == 'PATCH /'
+    assert response.content == b'PATCH /'
 
 
 def test_delete(client: Client) -> None:
     response = client.delete('/resource')
-    assert response.content == 'DELETE /resource'
+    assert response.content == b'DELETE /resource'
@@ -23,7 +23,7 @@ class ViewTest(unittest.TestCase):
 
         response = view(Request())
         assert response.status_code == 200
-        assert response.content == 'Hello Simple View'
+        assert response.content == b'Hello Simple View'
 
     def test_unimplemented_method_routing(self) -> None:
         view = SimpleView.as_view()
@@ -50,6 +50,7 @@ class ViewTest(unittest.TestCase):
         response = view(Request(method='HEAD'))
         assert response.status_code == 200
         assert len(response.content) == 0
+        assert response.headers['Content-Length'] == '17'
 
     def test_head_returns_405_without_get(self) -> None:
         view = SimplePostView.as_view()
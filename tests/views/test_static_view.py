@@ -1,10 +1,12 @@
+import gzip
 import os
+import tempfile
 import unittest
 from pathlib import Path
 
 from rivr.http import Http404
 from rivr.test import Client
-from rivr.views.static import StaticView
+from rivr.views.static import COMPRESSORS, StaticFileCache, StaticView
 
 FIXTURE_DIRECTORY_INDEX = """
 <!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN"
@@ -59,7 +61,7 @@ class StaticViewTests(unittest.TestCase):
             return content.replace('\n', '').replace(' ', '')
 
         response = self.client.get('/fixture')
-        assert strip(response.content) == strip(FIXTURE_DIRECTORY_INDEX)
+        assert strip(response.content.decode('utf-8')) == strip(FIXTURE_DIRECTORY_INDEX)
 
     def test_index_file(self) -> None:
         self.view = StaticView.as_view(
@@ -112,3 +114,324 @@ class StaticViewTests(unittest.TestCase):
             },
         )
         assert response.status_code == 200
+        response.close()
+
+    def test_file_not_modified_asctime(self) -> None:
+        response = self.client.get(
+            '/fixture/file1.py',
+            headers={
+                'If-Modified-Since': 'Sat Jul 13 19:47:43 2024',
+            },
+        )
+        assert response.status_code == 304
+
+        response = self.client.get(
+            '/fixture/file1.py',
+            headers={
+                'If-Unmodified-Since': 'Sat Jul 13 18:47:43 2024',
+            },
+        )
+        assert response.status_code == 412
+
+    def test_file_accepts_ranges(self) -> None:
+        response = self.client.get('/fixture/file1.py')
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        response.close()
+
+    def test_file_range(self) -> None:
+        response = self.client.get('/fixture/file1.py', headers={'Range': 'bytes=7-11'})
+        assert response.status_code == 206
+        assert response.content == b'Hello'
+        assert response.headers['Content-Range'] == 'bytes 7-11/21'
+        assert response.headers['Content-Length'] == '5'
+
+    def test_file_suffix_range(self) -> None:
+        response = self.client.get('/fixture/file1.py', headers={'Range': 'bytes=-3'})
+        assert response.status_code == 206
+        assert response.content == b"')\n"
+        assert response.headers['Content-Range'] == 'bytes 18-20/21'
+
+    def test_file_multiple_ranges(self) -> None:
+        response = self.client.get(
+            '/fixture/file1.py', headers={'Range': 'bytes=0-4, 7-50'}
+        )
+        assert response.status_code == 206
+
+        content_type = response.content_type
+        assert content_type is not None
+        assert str(content_type).startswith('multipart/byteranges')
+        boundary = content_type['boundary']
+
+        content = response.content
+        assert response.headers['Content-Length'] == str(len(content))
+        assert content == (
+            '--{0}\r\n'
+            'Content-Type: text/x-python\r\n'
+            'Content-Range: bytes 0-4/21\r\n'
+            '\r\n'
+            'print\r\n'
+            '--{0}\r\n'
+            'Content-Type: text/x-python\r\n'
+            'Content-Range: bytes 7-20/21\r\n'
+            '\r\n'
+            "Hello World')\n\r\n"
+            '--{0}--\r\n'
+        ).format(boundary).encode('ascii')
+
+    def test_file_range_not_satisfiable(self) -> None:
+        response = self.client.get('/fixture/file1.py', headers={'Range': 'bytes=21-'})
+        assert response.status_code == 416
+        assert response.headers['Content-Range'] == 'bytes */21'
+
+    def test_file_if_range(self) -> None:
+        response = self.client.get(
+            '/fixture/file1.py',
+            headers={
+                'Range': 'bytes=0-4',
+                'If-Range': 'Sat, 13 Jul 2024 19:47:43 GMT',
+            },
+        )
+        assert response.status_code == 206
+        assert response.content == b'print'
+
+        response = self.client.get(
+            '/fixture/file1.py',
+            headers={
+                'Range': 'bytes=0-4',
+                'If-Range': 'Sat, 13 Jul 2024 18:47:43 GMT',
+            },
+        )
+        assert response.status_code == 200
+        assert response.content == b"print('Hello World')\n"
+
+    def test_file_etag(self) -> None:
+        response = self.client.get('/fixture/file1.py')
+        etag = response.headers['ETag']
+        response.close()
+
+        assert etag.startswith('"')
+
+        response = self.client.get('/fixture/file1.py', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+
+    def test_file_weak_etag(self) -> None:
+        self.client = Client(
+            StaticView.as_view(
+                document_root=self.root, use_request_path=True, weak_etags=True
+            )
+        )
+
+        response = self.client.get('/fixture/file1.py')
+        assert response.headers['ETag'].startswith('W/"')
+        response.close()
+
+    def test_file_if_none_match_takes_precedence(self) -> None:
+        response = self.client.get(
+            '/fixture/file1.py',
+            headers={
+                'If-None-Match': '"other"',
+                'If-Modified-Since': 'Sat, 13 Jul 2024 19:47:43 GMT',
+            },
+        )
+        assert response.status_code == 200
+        response.close()
+
+    def test_file_if_match_precondition_failed(self) -> None:
+        response = self.client.get('/fixture/file1.py', headers={'If-Match': '"other"'})
+        assert response.status_code == 412
+
+    def test_file_if_range_etag(self) -> None:
+        response = self.client.get('/fixture/file1.py')
+        etag = response.headers['ETag']
+        response.close()
+
+        response = self.client.get(
+            '/fixture/file1.py', headers={'Range': 'bytes=0-4', 'If-Range': etag}
+        )
+        assert response.status_code == 206
+        assert response.content == b'print'
+
+
+class StaticFileCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(StaticFileCacheTests, self).setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.path = os.path.join(self.root, 'file.txt')
+        self.write(self.path, b'Hello World')
+
+        self.cache = StaticFileCache(revalidate_interval=60)
+        self.client = Client(
+            StaticView.as_view(
+                document_root=self.root, use_request_path=True, cache=self.cache
+            )
+        )
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, path: str, content: bytes, mtime: int = 1720900063) -> None:
+        with open(path, 'wb') as fp:
+            fp.write(content)
+
+        os.utime(path, (mtime, mtime))
+
+    def test_serves_cached_file(self) -> None:
+        response = self.client.get('/file.txt')
+        assert response.status_code == 200
+        assert response.content == b'Hello World'
+        assert response.headers['Content-Length'] == '11'
+        assert response.headers['Content-Type'] == 'text/plain'
+
+        response = self.client.get('/file.txt')
+        assert response.content == b'Hello World'
+        assert self.cache.misses == 1
+        assert self.cache.hits == 1
+        assert self.cache.size == 11
+
+    def test_serves_cached_range(self) -> None:
+        self.client.get('/file.txt').close()
+
+        response = self.client.get('/file.txt', headers={'Range': 'bytes=6-'})
+        assert response.status_code == 206
+        assert response.content == b'World'
+
+    def test_does_not_revalidate_within_interval(self) -> None:
+        self.client.get('/file.txt').close()
+        self.write(self.path, b'Hello Rivr', mtime=1720900064)
+
+        assert self.client.get('/file.txt').content == b'Hello World'
+
+    def test_revalidates_modified_file(self) -> None:
+        self.cache.revalidate_interval = 0
+        self.client.get('/file.txt').close()
+        self.write(self.path, b'Hello Rivr', mtime=1720900064)
+
+        assert self.client.get('/file.txt').content == b'Hello Rivr'
+        assert self.cache.misses == 2
+
+    def test_revalidates_deleted_file(self) -> None:
+        self.cache.revalidate_interval = 0
+        self.client.get('/file.txt').close()
+        os.remove(self.path)
+
+        with self.assertRaises(Http404):
+            self.client.get('/file.txt')
+
+        assert len(self.cache) == 0
+
+    def test_does_not_cache_content_of_large_files(self) -> None:
+        self.cache.max_file_size = 5
+
+        response = self.client.get('/file.txt')
+        assert response.content == b'Hello World'
+        assert len(self.cache) == 1
+        assert self.cache.size == 0
+
+    def test_evicts_least_recently_used_files(self) -> None:
+        self.cache.max_bytes = 21
+        self.write(os.path.join(self.root, 'other.txt'), b'Hello Rivr')
+        self.write(os.path.join(self.root, 'another.txt'), b'Hello')
+
+        self.client.get('/file.txt').close()
+        self.client.get('/other.txt').close()
+        self.client.get('/file.txt').close()
+        self.client.get('/another.txt').close()
+
+        assert self.cache.evictions == 1
+        assert self.cache.size == 16
+        assert self.cache.get(self.path) is not None
+        assert self.cache.hits == 2
+
+    def test_ignores_directories(self) -> None:
+        assert self.cache.get(self.root) is None
+
+
+class StaticViewEncodingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super(StaticViewEncodingTests, self).setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.content = b'body { color: black; }\n' * 20
+        self.write('style.css', self.content)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name: str, content: bytes, mtime: int = 1720900063) -> None:
+        path = os.path.join(self.root, name)
+        with open(path, 'wb') as fp:
+            fp.write(content)
+
+        os.utime(path, (mtime, mtime))
+
+    def client(self, **kwargs) -> Client:
+        return Client(
+            StaticView.as_view(document_root=self.root, use_request_path=True, **kwargs)
+        )
+
+    def test_serves_precompressed_sibling(self) -> None:
+        self.write('style.css.gz', b'compressed')
+        client = self.client(precompressed=True)
+
+        response = client.get('/style.css', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.content == b'compressed'
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Content-Type'] == 'text/css'
+        assert response.headers['Content-Length'] == '10'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert response.headers['ETag'].endswith('-gzip"')
+
+    def test_serves_identity_when_encoding_not_accepted(self) -> None:
+        self.write('style.css.gz', b'compressed')
+        client = self.client(precompressed=True)
+
+        response = client.get('/style.css', headers={'Accept-Encoding': 'br'})
+        assert response.content == self.content
+        assert response.headers['Content-Encoding'] is None
+        assert response.headers['Vary'] == 'Accept-Encoding'
+
+    def test_ignores_stale_precompressed_sibling(self) -> None:
+        self.write('style.css.gz', b'compressed', mtime=1720900000)
+        client = self.client(precompressed=True)
+
+        response = client.get('/style.css', headers={'Accept-Encoding': 'gzip'})
+        assert response.content == self.content
+
+    def test_compresses_once(self) -> None:
+        cache = StaticFileCache()
+        client = self.client(compress=True, cache=cache)
+        encoding = COMPRESSORS[0][0]
+
+        response = client.get('/style.css', headers={'Accept-Encoding': encoding})
+        assert response.headers['Content-Encoding'] == encoding
+        content = response.content
+        assert len(content) < len(self.content)
+        assert response.headers['Content-Length'] == str(len(content))
+
+        static_file = cache.get(os.path.join(self.root, 'style.css'))
+        assert static_file is not None
+        assert static_file.compressed[encoding] == content
+        assert cache.size == len(self.content) + len(content)
+
+        response = client.get('/style.css', headers={'Accept-Encoding': encoding})
+        assert response.content == content
+
+    def test_compresses_with_gzip(self) -> None:
+        client = self.client(compress=True, cache=StaticFileCache())
+
+        response = client.get('/style.css', headers={'Accept-Encoding': 'gzip'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.content) == self.content
+
+    def test_does_not_compress_small_files(self) -> None:
+        self.write('small.css', b'body {}')
+        client = self.client(compress=True, cache=StaticFileCache())
+
+        response = client.get('/small.css', headers={'Accept-Encoding': 'gzip'})
+        assert response.content == b'body {}'
+        assert response.headers['Content-Encoding'] is None
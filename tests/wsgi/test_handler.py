@@ -2,8 +2,8 @@ import unittest
 from io import BytesIO
 from typing import List, Tuple
 
-from rivr.http import Http404, Request, Response
-from rivr.wsgi import WSGIHandler
+from rivr.http import FileResponse, Http404, Request, Response, StreamingResponse
+from rivr.wsgi import WSGIHandler, status_line
 
 
 class WSGIHandlerTests(unittest.TestCase):
@@ -31,10 +31,41 @@ class WSGIHandlerTests(unittest.TestCase):
         handler(self.environ, self.start_response)
         assert self.status == '200 OK'
 
+    def test_sets_modern_status(self) -> None:
+        handler = WSGIHandler(lambda request: Response(status=429))
+        handler(self.environ, self.start_response)
+        assert self.status == '429 TOO MANY REQUESTS'
+
+    def test_sets_unknown_status(self) -> None:
+        handler = WSGIHandler(lambda request: Response(status=599))
+        handler(self.environ, self.start_response)
+        assert self.status == '599 UNKNOWN STATUS CODE'
+
+    def test_status_line(self) -> None:
+        assert status_line(308) == '308 PERMANENT REDIRECT'
+        assert status_line(599) == '599 UNKNOWN STATUS CODE'
+
+    def test_sets_cookie_headers(self) -> None:
+        def view(request: Request) -> Response:
+            response = Response('Hello World')
+            response.set_cookie('name', 'value')
+            return response
+
+        handler = WSGIHandler(view)
+        handler(self.environ, self.start_response)
+        assert self.headers == [
+            ('Content-Type', 'text/html; charset=utf8'),
+            ('Content-Length', '11'),
+            ('Set-Cookie', 'name=value; Path=/'),
+        ]
+
     def test_sets_headers(self) -> None:
         handler = WSGIHandler(self.hello_view)
         handler(self.environ, self.start_response)
-        assert self.headers == [('Content-Type', 'text/html; charset=utf8')]
+        assert self.headers == [
+            ('Content-Type', 'text/html; charset=utf8'),
+            ('Content-Length', '11'),
+        ]
 
     def test_returns_content(self) -> None:
         handler = WSGIHandler(self.hello_view)
@@ -64,3 +95,38 @@ class WSGIHandlerTests(unittest.TestCase):
         handler = WSGIHandler(view)  # type: ignore
         handler(self.environ, self.start_response)
         assert self.status == '500 INTERNAL SERVER ERROR'
+
+    def test_returns_streaming_content(self) -> None:
+        def generate():
+            yield 'Hello'
+            yield b' World'
+
+        response = StreamingResponse(generate())
+        handler = WSGIHandler(lambda request: response)
+        content = handler(self.environ, self.start_response)
+
+        assert self.status == '200 OK'
+        assert content is response
+        assert list(content) == [b'Hello', b' World']
+
+    def test_uses_file_wrapper_for_file_response(self) -> None:
+        class FileWrapper:
+            def __init__(self, file, block_size: int) -> None:
+                self.file = file
+                self.block_size = block_size
+
+        file = BytesIO(b'Hello World')
+        self.environ['wsgi.file_wrapper'] = FileWrapper
+        handler = WSGIHandler(lambda request: FileResponse(file))
+        content = handler(self.environ, self.start_response)
+
+        assert isinstance(content, FileWrapper)
+        assert content.file is file
+        assert content.block_size == FileResponse.block_size
+
+    def test_file_response_without_file_wrapper(self) -> None:
+        file = BytesIO(b'Hello World')
+        handler = WSGIHandler(lambda request: FileResponse(file))
+        content = handler(self.environ, self.start_response)
+
+        assert list(content) == [b'Hello World']
@@ -4,7 +4,7 @@ import unittest
 from io import BytesIO
 
 from rivr.http import MediaType
-from rivr.wsgi import WSGIRequest
+from rivr.wsgi import WSGIHeaders, WSGIRequest
 
 
 class WSGIRequestTest(unittest.TestCase):
@@ -39,6 +39,33 @@ class WSGIRequestTest(unittest.TestCase):
 
         assert request.headers['headerx'] == 'Hello World'
 
+    def test_headers_are_read_from_environ(self) -> None:
+        self.environ['HTTP_ACCEPT_ENCODING'] = 'gzip'
+        self.environ['CONTENT_TYPE'] = 'text/plain'
+        request = WSGIRequest(self.environ)
+
+        assert request.headers['Accept-Encoding'] == 'gzip'
+        assert request.headers.get_all('accept-encoding') == ['gzip']
+        assert 'Content-Type' in request.headers
+        assert request.headers['Content-Length'] is None
+        assert isinstance(request.headers, WSGIHeaders)
+        assert request.headers.materialised_headers is None
+
+    def test_headers_materialise_on_modification(self) -> None:
+        self.environ['HTTP_ACCEPT_ENCODING'] = 'gzip'
+        self.environ['CONTENT_LENGTH'] = '5'
+        request = WSGIRequest(self.environ)
+
+        request.headers['X-Custom'] = 'Hello'
+
+        assert request.headers.items() == [
+            ('Content-Length', '5'),
+            ('ACCEPT-ENCODING', 'gzip'),
+            ('X-Custom', 'Hello'),
+        ]
+        assert 'X_CUSTOM' not in self.environ
+        assert request.headers['accept-encoding'] == 'gzip'
+
     def test_query_string(self) -> None:
         self.environ['QUERY_STRING'] = 'name=Kyle&something=else'
         request = WSGIRequest(self.environ)
@@ -124,6 +151,29 @@ class WSGIRequestTest(unittest.TestCase):
 
         assert request.attributes == {'test': '👍'}
 
+    def test_decode_chunked_body(self) -> None:
+        class ChunkedWSGIRequest(WSGIRequest):
+            decode_chunked = True
+
+        self.environ['CONTENT_TYPE'] = 'application/json'
+        self.environ['HTTP_TRANSFER_ENCODING'] = 'chunked'
+        self.environ['wsgi.input'] = BytesIO(b'6\r\n{"a": \r\n2\r\n1}\r\n0\r\n\r\n')
+        request = ChunkedWSGIRequest(self.environ)
+
+        assert request.attributes == {'a': 1}
+
+    def test_decode_chunked_body_input_terminated(self) -> None:
+        class ChunkedWSGIRequest(WSGIRequest):
+            decode_chunked = True
+
+        self.environ['CONTENT_TYPE'] = 'application/json'
+        self.environ['HTTP_TRANSFER_ENCODING'] = 'chunked'
+        self.environ['wsgi.input'] = BytesIO(b'{"a": 1}')
+        self.environ['wsgi.input_terminated'] = True
+        request = ChunkedWSGIRequest(self.environ)
+
+        assert request.attributes == {'a': 1}
+
     # Cookies
 
     def test_cookies(self) -> None: